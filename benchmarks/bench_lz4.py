@@ -0,0 +1,119 @@
+"""Compare the LZ4 backends on map payloads.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_lz4 [--type stream|p2p] [payload ...]
+
+Each payload file holds one serialized ``stream.Map`` (default) or
+``p2p.CompleteMap`` message as captured from the device. Without payload files a
+synthetic 1000x1000 floor plan is generated and compressed.
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from custom_components.robovac_mqtt.maps import lz4_block
+from custom_components.robovac_mqtt.proto.cloud.p2pdata_pb2 import CompleteMap
+from custom_components.robovac_mqtt.proto.cloud.stream_pb2 import Map
+
+MIN_MATCH = 4
+MF_LIMIT = 12
+LAST_LITERALS = 5
+
+
+def _length_bytes(n: int) -> bytes:
+    return b'\xff' * (n // 255) + bytes([n % 255])
+
+
+def _sequence(literals: bytes, match_len: int | None, offset: int = 0) -> bytes:
+    lit_len = len(literals)
+    ml = 0 if match_len is None else match_len - MIN_MATCH
+    out = bytearray([(min(lit_len, 15) << 4) | min(ml, 15)])
+    if lit_len >= 15:
+        out += _length_bytes(lit_len - 15)
+    out += literals
+    if match_len is not None:
+        out += offset.to_bytes(2, 'little')
+        if ml >= 15:
+            out += _length_bytes(ml - 15)
+    return bytes(out)
+
+
+def compress(data: bytes) -> bytes:
+    """Greedy LZ4 block compressor, good enough to produce benchmark inputs."""
+    table: dict[bytes, int] = {}
+    out = bytearray()
+    anchor = 0
+    i = 0
+    limit = len(data) - MF_LIMIT
+    while i < limit:
+        key = data[i:i + MIN_MATCH]
+        candidate = table.get(key)
+        table[key] = i
+        if candidate is None or i - candidate > 0xFFFF:
+            i += 1
+            continue
+        match_end = i + MIN_MATCH
+        max_end = len(data) - LAST_LITERALS
+        while match_end < max_end and data[match_end] == data[candidate + match_end - i]:
+            match_end += 1
+        out += _sequence(data[anchor:i], match_end - i, i - candidate)
+        i = anchor = match_end
+    out += _sequence(data[anchor:], None)
+    return bytes(out)
+
+
+def synthetic_payload(width: int = 1000, height: int = 1000) -> tuple[bytes, int]:
+    rng = np.random.default_rng(0)
+    grid = np.zeros((height, width), dtype=np.uint8)
+    grid[100:900, 100:900] = Map.FREE
+    grid[100:900:200, 100:900] = Map.OBSTACLE
+    grid[300:400, 300:600] = Map.CARPET
+    grid[rng.integers(100, 900, 2000), rng.integers(100, 900, 2000)] = Map.OBSTACLE
+    cells = grid.reshape(-1, 4)
+    packed = (cells[:, 0] | (cells[:, 1] << 2) | (cells[:, 2] << 4) | (cells[:, 3] << 6)).astype(np.uint8).tobytes()
+    return compress(packed), len(packed)
+
+
+def load_payload(path: str, message_type: str) -> tuple[bytes, int]:
+    with open(path, 'rb') as f:
+        data = f.read()
+    if message_type == 'p2p':
+        message = CompleteMap.FromString(data)
+        return message.map.pixels, message.map.pixel_size
+    message = Map.FromString(data)
+    return message.pixels, message.pixel_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('payloads', nargs='*')
+    parser.add_argument('--type', choices=('stream', 'p2p'), default='stream')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if args.payloads:
+        payloads = [(path, *load_payload(path, args.type)) for path in args.payloads]
+    else:
+        payloads = [('synthetic 1000x1000', *synthetic_payload())]
+
+    print(f'Backends: {", ".join(lz4_block.BACKENDS)} (default: {lz4_block.BACKEND})')
+    for name, pixels, pixel_size in payloads:
+        print(f'\n{name}: {len(pixels)} -> {pixel_size} bytes')
+        buffer = bytearray(pixel_size)
+        reference = None
+        for backend, fn in lz4_block.BACKENDS.items():
+            out = memoryview(buffer)
+            fn(pixels, out)
+            if reference is None:
+                reference = bytes(buffer)
+            elif bytes(buffer) != reference:
+                print(f'  {backend:>8}: output mismatch!')
+                continue
+            best = min(timeit.repeat(lambda: fn(pixels, out), number=1, repeat=args.repeat))
+            print(f'  {backend:>8}: {best * 1000:8.3f} ms  ({pixel_size / best / 1e6:8.1f} MB/s)')
+
+
+if __name__ == '__main__':
+    main()
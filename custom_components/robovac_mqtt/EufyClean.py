@@ -5,6 +5,7 @@ from typing import Any
 
 from .controllers.Login import EufyLogin
 from .controllers.MqttConnect import MqttConnect
+from .schedule.timers import TimerIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +17,8 @@ class EufyClean:
         self.username = username
         self.password = password
         self.openudid = ''.join(random.choices(string.hexdigits, k=32))
+        # Next timer runs of all devices created by init_device
+        self.timer_index = TimerIndex()
 
     async def init(self) -> list[dict[str, Any]]:
         self.eufyCleanApi = EufyLogin(self.username, self.password, self.openudid)
@@ -36,7 +39,9 @@ class EufyClean:
         if not device['mqtt']:
             raise Exception('Device is not a MQTT device')
 
-        return MqttConnect(device, self.openudid, self.eufyCleanApi)
+        connection = MqttConnect(device, self.openudid, self.eufyCleanApi)
+        connection.timers.attach(self.timer_index)
+        return connection
 
     async def get_user_info(self):
         return await self.eufyCleanApi.eufyApi.get_user_info()
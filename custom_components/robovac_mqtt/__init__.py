@@ -5,7 +5,9 @@ try:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.const import Platform
     from homeassistant.core import HomeAssistant
-    from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+    from homeassistant.helpers.storage import STORAGE_DIR
+    from homeassistant.util import dt as dt_util
+    from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_HOMEASSISTANT_STOP
     try:
         from .constants.hass import DOMAIN, VACS, DEVICES
     except ImportError:
@@ -14,7 +16,7 @@ try:
         VACS = "vacs"
         DEVICES = "devices"
     
-    PLATFORMS = [Platform.VACUUM, Platform.BUTTON]
+    PLATFORMS = [Platform.VACUUM, Platform.BUTTON, Platform.IMAGE, Platform.SENSOR]
     _LOGGER = logging.getLogger(__name__)
     
     # Home Assistant integration functions
@@ -34,14 +36,48 @@ try:
         # Load devices
         for vacuum in await eufy_clean.get_devices():
             device = await eufy_clean.init_device(vacuum['deviceId'])
+            device.map_store = MapStore(hass.config.path(STORAGE_DIR, DOMAIN, device.device_id))
+            device.statistics = CleanStatisticsRecorder(
+                hass.config.path(STORAGE_DIR, DOMAIN, device.device_id, 'statistics.db'), dt_util.DEFAULT_TIME_ZONE)
+            await hass.async_add_executor_job(device.statistics.load)
+            device.consumables = ConsumableTracker(
+                hass.config.path(STORAGE_DIR, DOMAIN, device.device_id, 'consumables.db'))
+            await hass.async_add_executor_job(device.consumables.load)
+            device.error_events.subscribe(
+                lambda event, device_id=device.device_id: hass.loop.call_soon_threadsafe(
+                    hass.bus.async_fire, f"{DOMAIN}_error", {"device_id": device_id, **event.as_dict()}))
             await device.connect()
             _LOGGER.info("Adding %s", device.device_id)
             hass.data[DOMAIN][DEVICES][device.device_id] = device
     
+        async def _async_stop(_) -> None:
+            # Entries are not unloaded on shutdown, flush the statistics recorded since the last compaction
+            for device in list(hass.data[DOMAIN][DEVICES].values()):
+                await hass.async_add_executor_job(_close_device, device)
+
+        entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop))
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
         return True
     
+    async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+        unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        if unloaded:
+            devices = hass.data[DOMAIN][DEVICES]
+            for device_id in list(devices):
+                device = devices.pop(device_id)
+                await device.disconnect()
+                await hass.async_add_executor_job(_close_device, device)
+        return unloaded
+
+    def _close_device(device) -> None:
+        """Flush and release the on-disk stores of a device. Blocking."""
+        device.statistics.compact()
+        device.statistics.close()
+        device.consumables.close()
+        if device.map_store is not None:
+            device.map_store.close()
+
     async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
         await hass.config_entries.async_reload(entry.entry_id)
 
@@ -50,3 +86,6 @@ except ImportError:
 
 # Core library imports - always available
 from .EufyClean import EufyClean
+from .history.consumables import ConsumableTracker
+from .history.statistics import CleanStatisticsRecorder
+from .maps.store import MapStore
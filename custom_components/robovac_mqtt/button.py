@@ -1,8 +1,10 @@
 import logging
+from functools import partial
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.entity import DeviceInfo
 from .constants.hass import DOMAIN, DEVICES
+from .history.consumables import RESET_TYPES
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
@@ -16,6 +18,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         # Empty dust bin button
         collect_dust_button = RoboVacButton(device, "Empty dust bin", "_empty_dust_bin", device.collect_dust)
         async_add_entities([dry_mop_button, clean_mop_button, collect_dust_button])
+        # Consumable reset buttons, presses close together are sent as one request
+        async_add_entities([
+            RoboVacButton(device, "Reset " + part.replace("_", " "), "_reset_" + part,
+                          partial(device.reset_consumables, [part]))
+            for part in RESET_TYPES
+        ])
 
 
 class RoboVacButton(ButtonEntity):
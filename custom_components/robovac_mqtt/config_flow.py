@@ -6,10 +6,12 @@ from typing import Any, Optional
 import homeassistant.helpers.config_validation as cv
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from voluptuous import Required, Schema
+from voluptuous import All, Coerce, Range, Required, Schema
 
-from .constants.hass import DOMAIN, VACS
+from .constants.hass import (CONF_MAP_MAX_FPS, DEFAULT_MAP_MAX_FPS, DOMAIN,
+                             VACS)
 from .EufyApi import EufyApi
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,6 +29,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     data: Optional[dict[str, Any]]
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -57,3 +64,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user", data_schema=USER_SCHEMA, errors=errors
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for Eufy Robovac."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        max_fps = self.config_entry.options.get(CONF_MAP_MAX_FPS, DEFAULT_MAP_MAX_FPS)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=Schema(
+                {
+                    Required(CONF_MAP_MAX_FPS, default=max_fps): All(Coerce(float), Range(min=0.05, max=10)),
+                }
+            ),
+        )
@@ -1,3 +1,6 @@
 DOMAIN = 'robovac_mqtt'
 VACS = 'vacs'
 DEVICES = 'devices'
+
+CONF_MAP_MAX_FPS = 'map_max_fps'
+DEFAULT_MAP_MAX_FPS = 0.5
@@ -13,6 +13,11 @@ class Base:
             'FIND_ROBOT': '160',
             'BATTERY_LEVEL': '163',
             'ERROR_CODE': '177',
+            'MULTI_MAP_MANAGE': '172',
+            'UNIVERSAL_DATA': '179',
+            'TIMING': '164',
+            'SCENE_INFO': '180',
+            'MAP_STREAM': '181',
         }
         self.robovac_data = {}
 
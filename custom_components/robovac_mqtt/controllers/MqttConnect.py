@@ -58,6 +58,14 @@ class MqttConnect(SharedConnect):
         await self.updateDevice(True)
         await sleep(2000)
 
+    async def disconnect(self):
+        if self.mqttClient:
+            client, self.mqttClient = self.mqttClient, None
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, client.disconnect)
+            # loop_stop joins the network thread
+            await loop.run_in_executor(None, client.loop_stop)
+
     async def updateDevice(self, checkApiType=False):
         try:
             if not checkApiType:
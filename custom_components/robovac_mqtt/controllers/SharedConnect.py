@@ -1,5 +1,9 @@
 import asyncio
 import logging
+import time
+from base64 import b64decode
+from collections import deque
+from functools import partial
 from typing import Any, Callable
 
 # Try to import VacuumActivity from Home Assistant, fallback to string literals for standalone
@@ -18,15 +22,47 @@ except ImportError:
 from ..constants.devices import EUFY_CLEAN_DEVICES
 from ..constants.state import (EUFY_CLEAN_CLEAN_SPEED, EUFY_CLEAN_CONTROL,
                                EUFY_CLEAN_NOVEL_CLEAN_SPEED)
+from ..errors.catalog import ErrorCatalog
+from ..errors.events import ErrorEventEngine
+from ..history.consumables import RESET_TYPES, ConsumableTracker
+from ..history.statistics import CleanStatisticsRecorder
+from ..maps.catalog import MapCatalog, MapEntry
+from ..maps.contours import RoomContours
+from ..maps.live_map import LiveMap
+from ..maps.obstacles import ObstacleIndex
+from ..maps.path import PathBuffer
+from ..maps.pose import RoomTracker
+from ..maps.render import MapRenderer
+from ..maps.rooms import RoomIndex
+from ..maps.route import RoomRoutePlanner
+from ..maps.store import MapStore
+from ..maps.stream import StreamDemux
+from ..maps.zones import RestrictedZoneMask, quadrangle
 from ..proto.cloud.clean_param_pb2 import (CleanExtent, CleanParamRequest,
                                            CleanParamResponse, CleanType,
                                            MopMode)
-from ..proto.cloud.control_pb2 import (ModeCtrlRequest, ModeCtrlResponse,
-                                       SelectRoomsClean)
+from ..proto.cloud.clean_statistics_pb2 import CleanStatistics
+from ..proto.cloud.consumable_pb2 import (ConsumableRequest,
+                                          ConsumableResponse)
+from ..proto.cloud.control_pb2 import (Goto, ModeCtrlRequest,
+                                       ModeCtrlResponse, SelectRoomsClean,
+                                       SelectZonesClean)
+from ..proto.cloud.multi_maps_pb2 import (MultiMapsManageRequest,
+                                          MultiMapsManageResponse)
+from ..proto.cloud.p2pdata_pb2 import CompleteMap, MapChannelMsg
+from ..proto.cloud.scene_pb2 import SceneInfo, SceneRequest, SceneResponse
 from ..proto.cloud.station_pb2 import StationRequest
+from ..proto.cloud.stream_pb2 import (DynamicData, Map, Metadata,
+                                      ObstacleInfo, PathPoint, RestrictedZone,
+                                      RoomOutline)
+from ..proto.cloud.timing_pb2 import TimerInfo, TimerRequest, TimerResponse
+from ..proto.cloud.universal_data_pb2 import (UniversalDataRequest,
+                                             UniversalDataResponse)
 from ..proto.cloud.error_code_pb2 import ErrorCode
 from ..proto.cloud.work_status_pb2 import WorkStatus
 from ..utils import decode, encode, encode_message
+from ..schedule.scenes import SceneCatalog
+from ..schedule.timers import TimerCache
 from .Base import Base
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,10 +76,156 @@ class SharedConnect(Base):
         self.device_model = config.get('deviceModel', '')
         self.device_model_desc = EUFY_CLEAN_DEVICES.get(self.device_model, '') or self.device_model
         self.config = {}
+        self.error_catalog = ErrorCatalog(self.device_model)
+        self.error_events = ErrorEventEngine(self.error_catalog)
+        self._error_code_value = None
+        self.live_map = LiveMap()
+        self.room_index = RoomIndex()
+        self.room_tracker = RoomTracker(self.room_index, self.live_map)
+        self.room_contours = RoomContours(self.room_index, self.live_map)
+        self.room_route = RoomRoutePlanner(self.room_index, self.live_map)
+        self.obstacle_index = ObstacleIndex(self.room_index)
+        self.zone_mask = RestrictedZoneMask(self.live_map)
+        self.stream = StreamDemux()
+        self.path = PathBuffer()
+        self.map_renderer = MapRenderer(self.live_map, self.room_index, self.path)
+        self.map_store = MapStore(config['mapStorePath']) if config.get('mapStorePath') else None
+        self.map_catalog = MapCatalog()
+        self.statistics = CleanStatisticsRecorder(config.get('statisticsPath'))
+        self._statistics_value = None
+        self.consumables = ConsumableTracker(config.get('consumablesPath'))
+        self._consumables_value = None
+        self._pending_resets: set[str] = set()
+        self._reset_flush: asyncio.Future | None = None
+        self._multi_maps_seq = 0
+        # seq -> (future resolved by the final response, last STARTED response)
+        self._multi_maps_pending: dict[int, list] = {}
+        # Map the stream still reported when another one was loaded, ignored until the stream moves on
+        self._unloaded_map_id: int | None = None
+        self._room_table_waiters: list[asyncio.Future] = []
+        self.timers = TimerCache(self.device_id)
+        self.scenes = SceneCatalog()
+        self._scene_seq = 0
+        self._scene_waiters: list[asyncio.Future] = []
+        self._scenes_failed_at: float | None = None
+        self._timer_seq = 0
+        self._timer_pending: dict[int, asyncio.Future] = {}
         self._update_listeners = []
+        # (decode, apply) pairs of map stream work, decoded in the executor one at a time
+        self._map_work: deque[tuple[Callable[[], Any], Callable[[Any], Any]]] = deque()
+        self._map_worker: asyncio.Task | None = None
+        self._subscribe_stream()
+
+    MULTI_MAPS_TIMEOUT = 15
+    # Multi-map requests answered with the maps over p2p, see feed_map_channel
+    P2P_MAP_METHODS = (MultiMapsManageRequest.MAP_GET_ALL, MultiMapsManageRequest.MAP_GET_ONE)
+    # Resets requested within this many seconds are sent as one ConsumableRequest
+    RESET_BATCH_DELAY = 0.2
+    ROOM_TABLE_TIMEOUT = 10
+    TIMER_TIMEOUT = 10
+    SCENE_TIMEOUT = 10
+    # After an unanswered scene list request, scene_clean does not ask again for this many seconds
+    SCENE_RETRY_INTERVAL = 300
 
     _update_listeners: list[Callable[[], None]]
 
+    def _subscribe_stream(self) -> None:
+        """Route the map stream channels this integration uses; the others are skipped unparsed."""
+        self.stream.subscribe('map_data', self._on_map_frame)
+        self.stream.subscribe('room_outline', self._on_room_outline)
+        self.stream.subscribe('room_params', self.map_catalog.update_room_params)
+        self.stream.subscribe('dynamic_data', self._on_dynamic_data)
+        self.stream.subscribe('path', self._on_path_points, batch=True)
+        self.stream.subscribe('restricted_zone', self.set_restricted_zones)
+        self.stream.subscribe('obstacle_info', self._on_obstacle_info)
+
+    def feed_stream(self, chan_id: int, payload: bytes) -> int:
+        """Hand one map stream channel payload (delimited frames) to the stream parsers."""
+        return self.stream.feed(chan_id, payload)
+
+    def feed_map_channel(self, payload: bytes) -> None:
+        """Hand one p2p.MapChannelMsg received over the p2p connection to the multi-map requests.
+
+        The robot answers MAP_GET_ALL and MAP_GET_ONE with the saved maps over
+        p2p only, the DP response just reports the request as started.
+        """
+        try:
+            message = MapChannelMsg.FromString(payload)
+            if message.type != MapChannelMsg.MULTI_MAP_RESPONSE:
+                return
+            response = MultiMapsManageResponse.FromString(message.multi_map_response)
+        except Exception as error:
+            _LOGGER.error('Could not decode map channel message', exc_info=error)
+            return
+        self._on_multi_maps_message(response)
+
+    def _on_map_stream(self, value: dict) -> None:
+        # {chan id: base64 payload}, with the stream.Metadata under 'metadata' when the channels change
+        if not isinstance(value, dict):
+            _LOGGER.warning('Unexpected map stream value: %r', type(value))
+            return
+        if (metadata := value.get('metadata')) is not None:
+            try:
+                self.stream.set_metadata(decode(Metadata, metadata))
+            except Exception as error:
+                _LOGGER.error('Could not decode map stream metadata', exc_info=error)
+        for chan_id, payload in value.items():
+            if chan_id == 'metadata':
+                continue
+            try:
+                self.feed_stream(int(chan_id), b64decode(payload))
+            except ValueError as error:
+                _LOGGER.error('Could not decode map stream payload of channel %s', chan_id, exc_info=error)
+
+    def _on_map_frame(self, message: Map) -> None:
+        self._queue_map_work(partial(self.live_map.decode, message), partial(self.live_map.apply, message))
+
+    def _on_room_outline(self, message: RoomOutline) -> None:
+        if not self.room_index.stale(message):
+            return
+
+        def build() -> RoomIndex:
+            info = self.live_map.info
+            return RoomIndex.build(message, info.resolution if info is not None else 0)
+
+        self._queue_map_work(build, self.room_index.replace)
+
+    def _queue_map_work(self, decode: Callable[[], Any], apply: Callable[[Any], Any]) -> None:
+        """Run `decode` (LZ4, raster scans) in the executor and `apply` its result on the loop, in arrival order."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Fed from outside an event loop, nothing to keep responsive
+            apply(decode())
+            self._check_unloaded_map()
+            return
+        self._map_work.append((decode, apply))
+        if self._map_worker is None or self._map_worker.done():
+            self._map_worker = loop.create_task(self._drain_map_work())
+
+    async def _drain_map_work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._map_work:
+            decode, apply = self._map_work.popleft()
+            try:
+                apply(await loop.run_in_executor(None, decode))
+            except Exception as error:
+                _LOGGER.error('Could not apply map stream data', exc_info=error)
+        self._check_unloaded_map()
+        # The listeners already ran for the DPS push, let them see the decoded map too
+        await self._call_listeners()
+
+    def _on_dynamic_data(self, message: DynamicData) -> None:
+        self.map_renderer.set_pose(message.cur_pose)
+        self.room_tracker.update(message)
+
+    def _on_path_points(self, points: list[PathPoint]) -> None:
+        self.path.extend_points(points)
+
+    def _on_obstacle_info(self, message: ObstacleInfo) -> None:
+        if self.obstacle_index.update(message, self.room_index.transform(self.live_map.info)):
+            self.map_renderer.set_obstacles(message)
+
     async def _map_data(self, dps):
         for key, value in dps.items():
             mapped_keys = [k for k, v in self.dps_map.items() if v == key]
@@ -53,7 +235,27 @@ class SharedConnect(Base):
         if self.debug_log:
             _LOGGER.debug('mappedData', self.robovac_data)
 
+        if (map_stream := dps.get(self.dps_map['MAP_STREAM'])) is not None:
+            self._on_map_stream(map_stream)
+        if (multi_maps := dps.get(self.dps_map['MULTI_MAP_MANAGE'])) is not None:
+            self._on_multi_maps_response(multi_maps)
+        if (universal_data := dps.get(self.dps_map['UNIVERSAL_DATA'])) is not None:
+            self._on_universal_data(universal_data)
+        if (statistics := dps.get(self.dps_map['CLEANING_STATISTICS'])) is not None:
+            await self._on_clean_statistics(statistics)
+        if (consumables := dps.get(self.dps_map['ACCESSORIES_STATUS'])) is not None:
+            await self._on_consumables(consumables)
+        if (scenes := dps.get(self.dps_map['SCENE_INFO'])) is not None:
+            self._on_scene_response(scenes)
+        if (timing := dps.get(self.dps_map['TIMING'])) is not None:
+            self._on_timer_response(timing)
+        if (error_code := dps.get(self.dps_map['ERROR_CODE'])) is not None:
+            self._on_error_code(error_code)
+
         await self.get_control_response()
+        await self._call_listeners()
+
+    async def _call_listeners(self) -> None:
         for listener in self._update_listeners:
             try:
                 _LOGGER.debug(f'Calling listener {listener.__name__ if hasattr(listener, "__name__") else "anonymous"}')
@@ -65,10 +267,70 @@ class SharedConnect(Base):
             except Exception as error:
                 _LOGGER.error(error)
 
+    async def _on_clean_statistics(self, value: str) -> None:
+        # The robot repeats the same statistics with most status pushes, only decode changes
+        if value == self._statistics_value:
+            return
+        self._statistics_value = value
+        try:
+            self.statistics.update(decode(CleanStatistics, value))
+        except Exception as error:
+            _LOGGER.error('Could not decode clean statistics', exc_info=error)
+            return
+        if self.statistics.path is not None and self.statistics.compaction_due():
+            batch = self.statistics.take_batch()
+            await asyncio.get_running_loop().run_in_executor(None, self.statistics.write, batch)
+
+    def _on_error_code(self, value: str) -> None:
+        if value == self._error_code_value:
+            return
+        self._error_code_value = value
+        try:
+            self.error_events.update(decode(ErrorCode, value))
+        except Exception as error:
+            _LOGGER.error('Could not decode error code', exc_info=error)
+
+    async def _on_consumables(self, value: str) -> None:
+        if value == self._consumables_value:
+            return
+        self._consumables_value = value
+        try:
+            samples = self.consumables.update(decode(ConsumableResponse, value).runtime)
+        except Exception as error:
+            _LOGGER.error('Could not decode consumables', exc_info=error)
+            return
+        if samples and self.consumables.path is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.consumables.write, samples)
+
+    async def reset_consumables(self, parts: list[str]):
+        """Reset the runtime of consumables, e.g. ['side_brush', 'filter_mesh'].
+
+        Resets requested by concurrent calls within RESET_BATCH_DELAY go out
+        together in a single ConsumableRequest.
+        """
+        unknown = [part for part in parts if part not in RESET_TYPES]
+        if unknown:
+            raise ValueError(f'Invalid consumables: {unknown}, allowed values: {list(RESET_TYPES)}')
+        self._pending_resets.update(parts)
+        if self._reset_flush is None:
+            self._reset_flush = asyncio.ensure_future(self._flush_resets())
+        return await asyncio.shield(self._reset_flush)
+
+    async def _flush_resets(self):
+        await asyncio.sleep(self.RESET_BATCH_DELAY)
+        parts, self._pending_resets, self._reset_flush = self._pending_resets, set(), None
+        _LOGGER.debug('Resetting consumables %s', sorted(parts))
+        value = encode(ConsumableRequest, {'reset_types': sorted(RESET_TYPES[part] for part in parts)})
+        return await self.send_command({self.dps_map['ACCESSORIES_STATUS']: value})
+
     def add_listener(self, listener: Callable[[], None]):
         """Fixed: Changed type annotation to match actual usage"""
         self._update_listeners.append(listener)
 
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        if listener in self._update_listeners:
+            self._update_listeners.remove(listener)
+
     async def get_robovac_data(self):
         return self.robovac_data
 
@@ -183,6 +445,17 @@ class SharedConnect(Base):
             _LOGGER.error(f"Error getting work status: {e}")
             return VacuumActivity.ERROR
 
+    async def get_task_suspended(self) -> bool:
+        """True while a task is only interrupted: recharging to resume it (breakpoint) or washing the mop."""
+        try:
+            value = decode(WorkStatus, self.robovac_data['WORK_STATUS'])
+        except Exception:
+            return False
+        if value.HasField('breakpoint'):
+            return True
+        # Drying the mop happens once the task is over
+        return value.HasField('go_wash') and value.go_wash.mode != WorkStatus.GoWash.DRYING
+
     async def get_clean_params_request(self):
         try:
             value = decode(CleanParamRequest, self.robovac_data.get('CLEANING_PARAMETERS'))
@@ -205,13 +478,9 @@ class SharedConnect(Base):
         return int(self.robovac_data['BATTERY_LEVEL'])
 
     async def get_error_code(self):
-        try:
-            value = decode(ErrorCode, self.robovac_data['ERROR_CODE'])
-            if value.get('warn'):
-                return value['warn'][0]
-            return 0
-        except Exception as error:
-            _LOGGER.error(error)
+        """First active error code, else the first warning code, else 0."""
+        active = self.error_events.errors + self.error_events.warns
+        return active[0] if active else 0
 
     async def set_clean_speed(self, clean_speed: EUFY_CLEAN_CLEAN_SPEED):
         try:
@@ -225,9 +494,60 @@ class SharedConnect(Base):
         value = encode(ModeCtrlRequest, {'auto_clean': {'clean_times': 1}})
         return await self.send_command({self.dps_map['PLAY_PAUSE']: value})
 
-    async def scene_clean(self, id: int):
-        increment = 3
-        value = encode(ModeCtrlRequest, {'method': EUFY_CLEAN_CONTROL.START_SCENE_CLEAN, 'scene_clean': {'scene_id': id + increment}})
+    def _on_scene_response(self, value: str) -> None:
+        try:
+            response = decode(SceneResponse, value)
+        except Exception as error:
+            _LOGGER.error('Could not decode scene response', exc_info=error)
+            return
+        if response.result.value == SceneResponse.Result.FAILED:
+            _LOGGER.warning('Scene request %s failed with error %s', response.seq, response.result.err_code)
+            return
+        # Only DEFAULT responses (boot, scene changes, our list request) carry the full list
+        if response.method != SceneRequest.DEFAULT:
+            return
+        self._scenes_failed_at = None
+        if self.scenes.replace(response.infos):
+            _LOGGER.debug('Scenes: %s', {info.id.value: info.name for info in response.infos})
+        for waiter in self._scene_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def list_scenes(self, refresh: bool = False) -> list[SceneInfo]:
+        """Scenes of the robot, asked for once and then kept current by its reports."""
+        if refresh or not self.scenes.loaded:
+            waiter = asyncio.get_running_loop().create_future()
+            self._scene_waiters.append(waiter)
+            self._scene_seq = self._scene_seq % 0xFFFFFFFF + 1
+            value = encode(SceneRequest, {'method': SceneRequest.DEFAULT, 'seq': self._scene_seq})
+            try:
+                await self.send_command({self.dps_map['SCENE_INFO']: value})
+                await asyncio.wait_for(waiter, self.SCENE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self._scenes_failed_at = time.monotonic()
+                raise TimeoutError('No scene list received from the robot')
+            finally:
+                self._scene_waiters.remove(waiter)
+        return list(self.scenes.scenes.values())
+
+    async def scene_clean(self, scene: int | str):
+        """Start a scene by its id or name (case-insensitive)."""
+        if isinstance(scene, str) and scene.strip().isdigit():
+            scene = int(scene)
+        if not self.scenes.loaded:
+            failed_at = self._scenes_failed_at
+            if failed_at is None or time.monotonic() - failed_at >= self.SCENE_RETRY_INTERVAL:
+                try:
+                    await self.list_scenes()
+                except TimeoutError:
+                    if not isinstance(scene, int):
+                        raise
+            elif not isinstance(scene, int):
+                raise ValueError(f'Scene list unavailable, cannot resolve scene name {scene!r}; use the scene id')
+            if not self.scenes.loaded:
+                _LOGGER.warning('Scene list unavailable, sending scene id %s unchecked', scene)
+        scene_id = self.scenes.resolve(scene).id.value if self.scenes.loaded else scene
+        value = encode(ModeCtrlRequest, {'method': EUFY_CLEAN_CONTROL.START_SCENE_CLEAN, 'scene_clean': {'scene_id': scene_id}})
         return await self.send_command({self.dps_map['PLAY_PAUSE']: value})
 
     async def play(self):
@@ -262,7 +582,121 @@ class SharedConnect(Base):
         value = encode(ModeCtrlRequest, {'method': EUFY_CLEAN_CONTROL.START_SPOT_CLEAN})
         return await self.send_command({self.dps_map['PLAY_PAUSE']: value})
 
-    async def room_clean(self, room_ids: list[int], map_id: int = 3):
+    def active_map_id(self) -> int | None:
+        """Id of the map the robot is using, from the map stream or the multi-map responses.
+
+        Right after `load_map` the stream keeps reporting the previous map for a
+        while; the loaded map wins until the stream reports a different one.
+        """
+        current = self._stream_map_id()
+        if current is not None and current == self._unloaded_map_id:
+            current = None
+        return self.map_catalog.resolve(current)
+
+    def _stream_map_id(self) -> int | None:
+        """Map id of the last room outline, or of the live map when no outline was received."""
+        if self.room_index.map_id is not None:
+            return self.room_index.map_id
+        if self.live_map.grid is not None:
+            return self.live_map.map_id
+        return None
+
+    def _check_unloaded_map(self) -> None:
+        if self._unloaded_map_id is not None and self._stream_map_id() != self._unloaded_map_id:
+            self._unloaded_map_id = None
+
+    def _map_releases(self, map_id: int) -> int:
+        """Release of a map as far as known, the room outline being the most recent source."""
+        if self.room_index.map_id == map_id:
+            return self.room_index.releases
+        if self.live_map.grid is not None and self.live_map.map_id == map_id:
+            return self.live_map.releases
+        entry = self.map_catalog.get(map_id)
+        return entry.releases if entry is not None else 0
+
+    def _on_universal_data(self, value: str) -> None:
+        try:
+            response = decode(UniversalDataResponse, value)
+        except Exception as error:
+            _LOGGER.error('Could not decode universal data', exc_info=error)
+            return
+        if not response.HasField('cur_map_room'):
+            return
+        table = response.cur_map_room
+        entry = self.map_catalog.update_room_table(table, self._map_releases(table.map_id))
+        self.map_catalog.active_map_id = table.map_id
+        _LOGGER.debug('Room table of map %s: %s', table.map_id, entry.rooms)
+        for waiter in self._room_table_waiters:
+            if not waiter.done():
+                waiter.set_result(table.map_id)
+
+    async def _room_entry(self, map_id: int | None) -> MapEntry | None:
+        if map_id is None:
+            map_id = self.active_map_id()
+        if map_id is not None:
+            entry = self.map_catalog.get(map_id)
+            if entry is not None and entry.rooms and entry.rooms_releases == self._map_releases(map_id):
+                return entry
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._room_table_waiters.append(waiter)
+        try:
+            await self.send_command({self.dps_map['UNIVERSAL_DATA']: encode_message(UniversalDataRequest())})
+            # The robot only reports the room table of its current map
+            current_map_id = await asyncio.wait_for(waiter, self.ROOM_TABLE_TIMEOUT)
+        finally:
+            self._room_table_waiters.remove(waiter)
+        return self.map_catalog.get(map_id if map_id is not None else current_map_id)
+
+    async def get_rooms(self, map_id: int | None = None) -> dict[int, str]:
+        """Room id -> name of a map, the active one by default.
+
+        The room table is requested from the robot only when none is cached
+        for the current release of the map.
+        """
+        entry = await self._room_entry(map_id)
+        return entry.rooms if entry is not None else {}
+
+    async def resolve_rooms(self, rooms: list[int | str], map_id: int | None = None) -> list[int]:
+        """Room ids for a list of room ids and/or room names; raises ValueError on unknown rooms."""
+        if all(isinstance(room, int) or room.isdigit() for room in rooms):
+            return [int(room) for room in rooms]
+
+        entry = await self._room_entry(map_id)
+        room_ids = []
+        unknown = []
+        for room in rooms:
+            if isinstance(room, int) or room.isdigit():
+                room_ids.append(int(room))
+            elif entry is not None and (room_id := entry.room_id(room)) is not None:
+                room_ids.append(room_id)
+            else:
+                unknown.append(room)
+        if unknown:
+            known = sorted(entry.rooms.values()) if entry is not None else []
+            raise ValueError(f'Unknown rooms: {unknown}, known rooms: {known}')
+        return room_ids
+
+    async def room_clean(self, room_ids: list[int | str], map_id: int | None = None, optimize_order: bool = False):
+        """Clean rooms given by id or by name; names are resolved through the cached room table.
+
+        With `optimize_order` the rooms are cleaned in the order that keeps
+        travel from the dock shortest, when the outline of the map is known;
+        otherwise they are cleaned in the order given.
+        """
+        if map_id is None:
+            map_id = self.active_map_id()
+        room_ids = await self.resolve_rooms(room_ids, map_id)
+        if map_id is None:
+            map_id = self.active_map_id()
+            if map_id is None:
+                # Nothing known about the maps yet, fall back to the historical default
+                map_id = 3
+        if optimize_order:
+            if self.room_index.map_id == map_id:
+                room_ids = self.room_route.order(room_ids)
+            else:
+                _LOGGER.debug(f'No room outline for map {map_id}, keeping the given room order')
         _LOGGER.debug(f'Room clean: {room_ids}, map_id: {map_id}')
         rooms_clean = SelectRoomsClean(
             rooms=[SelectRoomsClean.Room(id=id, order=i + 1) for i, id in enumerate(room_ids)],
@@ -273,6 +707,221 @@ class SharedConnect(Base):
         value = encode_message(ModeCtrlRequest(method=EUFY_CLEAN_CONTROL.START_SELECT_ROOMS_CLEAN, select_rooms_clean=rooms_clean))
         return await self.send_command({self.dps_map['PLAY_PAUSE']: value})
 
+    def set_restricted_zones(self, zones: RestrictedZone) -> None:
+        """Feed a stream.RestrictedZone to the pre-flight checks and the map renderer."""
+        if self.zone_mask.update(zones):
+            self.map_renderer.set_restricted_zones(zones)
+
+    async def zone_clean(self, zones: list, clean_times: int = 1, map_id: int | None = None):
+        """Clean zones given as (x0, y0, x1, y1) rectangles or four (x, y) corners in world coordinates.
+
+        Zones without any explored floor outside the forbidden zones are rejected
+        with a ValueError before anything is sent.
+        """
+        quadrangles = [quadrangle(zone) for zone in zones]
+        if not quadrangles:
+            raise ValueError('At least one zone is required')
+        for quad in quadrangles:
+            self.zone_mask.check_zone(quad)
+        map_id = map_id if map_id is not None else self.active_map_id() or 0
+        _LOGGER.debug(f'Zone clean: {len(quadrangles)} zones, map_id: {map_id}')
+        zones_clean = SelectZonesClean(
+            zones=[SelectZonesClean.Zone(quadrangle=quad, clean_times=clean_times) for quad in quadrangles],
+            map_id=map_id,
+            releases=self._map_releases(map_id),
+        )
+        value = encode_message(ModeCtrlRequest(method=EUFY_CLEAN_CONTROL.START_SELECT_ZONES_CLEAN, select_zones_clean=zones_clean))
+        return await self.send_command({self.dps_map['PLAY_PAUSE']: value})
+
+    async def goto(self, x: int, y: int, goto_type: str = 'GOTO_DESTINATION', clean_times: int = 1, map_id: int | None = None):
+        """Send the robot to a world point; targets in forbidden zones, on virtual walls or off the floor raise ValueError."""
+        if goto_type not in Goto.Type.keys():
+            raise ValueError(f'Invalid goto type: {goto_type}, allowed values: {Goto.Type.keys()}')
+        self.zone_mask.check_point(x, y)
+        map_id = map_id if map_id is not None else self.active_map_id() or 0
+        _LOGGER.debug(f'Goto: ({x}, {y}) {goto_type}, map_id: {map_id}')
+        go_to = Goto(
+            destination={'x': int(x), 'y': int(y)},
+            type=Goto.Type.Value(goto_type),
+            clean_times=clean_times,
+            map_id=map_id,
+            releases=self._map_releases(map_id),
+        )
+        value = encode_message(ModeCtrlRequest(method=EUFY_CLEAN_CONTROL.START_GOTO_CLEAN, go_to=go_to))
+        return await self.send_command({self.dps_map['PLAY_PAUSE']: value})
+
+    def _on_multi_maps_response(self, value: str) -> None:
+        try:
+            response = decode(MultiMapsManageResponse, value)
+        except Exception as error:
+            _LOGGER.error('Could not decode multi-map response', exc_info=error)
+            return
+        self._on_multi_maps_message(response)
+
+    def _on_multi_maps_message(self, response: MultiMapsManageResponse) -> None:
+        _LOGGER.debug('Multi-map response: method %s, seq %s, result %s', response.method, response.seq, response.result)
+
+        pending = self._multi_maps_pending.get(response.seq)
+        if pending is None or pending[0].done():
+            return
+        if response.result == MultiMapsManageResponse.STARTED or (
+                response.method in self.P2P_MAP_METHODS and response.result == MultiMapsManageResponse.SUCCESS
+                and response.WhichOneof('Param') is None):
+            # A DP acknowledgement of a request whose maps are still to come over p2p
+            pending[1] = response
+        else:
+            pending[0].set_result(response)
+
+    async def _multi_maps_request(self, method: int, **params) -> MultiMapsManageResponse:
+        """Send a MultiMapsManageRequest and wait for the response carrying the same seq."""
+        self._multi_maps_seq = self._multi_maps_seq % 0xFFFFFFFF + 1
+        seq = self._multi_maps_seq
+        pending = [asyncio.get_running_loop().create_future(), None]
+        self._multi_maps_pending[seq] = pending
+        try:
+            value = encode_message(MultiMapsManageRequest(method=method, seq=seq, **params))
+            await self.send_command({self.dps_map['MULTI_MAP_MANAGE']: value})
+            try:
+                response = await asyncio.wait_for(pending[0], self.MULTI_MAPS_TIMEOUT)
+            except asyncio.TimeoutError:
+                if pending[1] is None:
+                    raise TimeoutError(f'No response to multi-map request {MultiMapsManageRequest.Method.Name(method)}')
+                if method in self.P2P_MAP_METHODS:
+                    raise TimeoutError(f'No maps received for {MultiMapsManageRequest.Method.Name(method)}, '
+                                       'they are sent over p2p, see feed_map_channel')
+                # The robot accepted the request but did not report completion in time
+                response = pending[1]
+        finally:
+            del self._multi_maps_pending[seq]
+
+        if response.result == MultiMapsManageResponse.FAILED:
+            raise RuntimeError(f'Multi-map request {MultiMapsManageRequest.Method.Name(method)} failed')
+        return response
+
+    async def _store_maps(self, maps: list[CompleteMap]) -> None:
+        if self.map_store is None or not maps:
+            return
+        stale = set(self.map_store.stale((m.map_id, m.releases) for m in maps))
+        changed = [m for m in maps if m.map_id in stale]
+        if changed:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: [self.map_store.put(m) for m in changed])
+
+    async def list_maps(self) -> list[MapEntry]:
+        """Fetch all saved maps, refreshing the map catalog and the local map store."""
+        response = await self._multi_maps_request(MultiMapsManageRequest.MAP_GET_ALL)
+        maps = list(response.complete_maps.complete_map)
+        if response.HasField('complete_maps'):
+            self.map_catalog.replace(maps)
+        elif response.HasField('map_infos'):
+            self.map_catalog.update(response.map_infos)
+        await self._store_maps(maps)
+        return list(self.map_catalog.maps.values())
+
+    async def get_map(self, map_id: int) -> CompleteMap | None:
+        """One saved map, read from the local map store when its release is already stored.
+
+        Until the catalog knows the map (after a restart, before `list_maps`),
+        the newest stored release is served and recorded in the catalog.
+        """
+        entry = self.map_catalog.get(map_id)
+        if self.map_store is not None:
+            loop = asyncio.get_running_loop()
+            releases = entry.releases if entry is not None else None
+            stored = await loop.run_in_executor(None, self.map_store.get, map_id, releases)
+            if stored is not None:
+                complete_map = await loop.run_in_executor(None, stored.complete_map)
+                if entry is None:
+                    self.map_catalog.update(complete_map)
+                return complete_map
+
+        response = await self._multi_maps_request(MultiMapsManageRequest.MAP_GET_ONE, common={'cloud_mapid': map_id})
+        maps = list(response.complete_maps.complete_map)
+        for complete_map in maps:
+            self.map_catalog.update(complete_map)
+        await self._store_maps(maps)
+        return next((m for m in maps if m.map_id == map_id), None)
+
+    async def load_map(self, map_id: int) -> None:
+        await self._multi_maps_request(MultiMapsManageRequest.MAP_LOAD, common={'cloud_mapid': map_id})
+        self.map_catalog.active_map_id = map_id
+        current = self._stream_map_id()
+        self._unloaded_map_id = current if current != map_id else None
+
+    async def rename_map(self, map_id: int, name: str) -> None:
+        await self._multi_maps_request(MultiMapsManageRequest.MAP_RENAME, rename={'cloud_mapid': map_id, 'new_name': name})
+        self.map_catalog.rename(map_id, name)
+
+    async def delete_map(self, map_id: int) -> None:
+        await self._multi_maps_request(MultiMapsManageRequest.MAP_DELETE, common={'cloud_mapid': map_id})
+        self.map_catalog.remove(map_id)
+        if self.map_store is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.map_store.delete, map_id)
+
+    async def save_map(self, multi_map: bool = True) -> None:
+        """Save the current map; with `multi_map` it is kept next to the other saved maps."""
+        await self._multi_maps_request(MultiMapsManageRequest.MAP_SAVE, save_options={'multi_map_sw': {'value': multi_map}})
+
+    def _on_timer_response(self, value: str) -> None:
+        try:
+            response = decode(TimerResponse, value)
+        except Exception as error:
+            _LOGGER.error('Could not decode timer response', exc_info=error)
+            return
+        _LOGGER.debug('Timer response: method %s, seq %s, %s timers', response.method, response.seq, len(response.timers))
+        # Every response carries the full list of timers, an empty one after the last timer was deleted
+        self.timers.replace(response.timers)
+        waiter = self._timer_pending.get(response.seq)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(response)
+
+    async def _timer_request(self, method: int, timer: TimerInfo | None = None) -> TimerResponse:
+        """Send a TimerRequest and wait for the response carrying the same seq."""
+        self._timer_seq = self._timer_seq % 0xFFFFFFFF + 1
+        seq = self._timer_seq
+        waiter = self._timer_pending[seq] = asyncio.get_running_loop().create_future()
+        try:
+            request = TimerRequest(method=method, seq=seq)
+            if timer is not None:
+                request.timer.CopyFrom(timer)
+            await self.send_command({self.dps_map['TIMING']: encode_message(request)})
+            try:
+                response = await asyncio.wait_for(waiter, self.TIMER_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f'No response to timer request {TimerRequest.Method.Name(method)}')
+        finally:
+            del self._timer_pending[seq]
+        if response.result.value == TimerResponse.Result.FAILED:
+            raise RuntimeError(f'Timer request {TimerRequest.Method.Name(method)} failed with error {response.result.err_code}')
+        return response
+
+    async def get_timers(self, refresh: bool = False) -> list[TimerInfo]:
+        """Timers of the robot, fetched once and then kept up to date from its reports."""
+        if refresh or not self.timers.loaded:
+            await self._timer_request(TimerRequest.INQUIRY)
+        return list(self.timers.timers.values())
+
+    async def set_timers(self, timers: list[TimerInfo]) -> None:
+        """Make the robot's timers match `timers`, sending requests only for the timers that differ.
+
+        Timers without an id (or with an unknown one) are added, cached timers
+        missing from the list are deleted.
+        """
+        if not self.timers.loaded:
+            await self.get_timers()
+        for method, timer in self.timers.changes(timers):
+            await self._timer_request(method, timer)
+
+    async def delete_timer(self, timer_id: int) -> None:
+        await self._timer_request(TimerRequest.DELETE, TimerInfo(id={'value': timer_id}))
+
+    async def set_timer_open(self, timer_id: int, opened: bool) -> None:
+        method = TimerRequest.OPEN if opened else TimerRequest.CLOSE
+        await self._timer_request(method, TimerInfo(id={'value': timer_id}))
+
+    async def skip_timer_once(self, timer_id: int) -> None:
+        await self._timer_request(TimerRequest.IGNORE_ONCE, TimerInfo(id={'value': timer_id}))
+
     async def set_clean_param(self, config: dict[str, Any]):
         is_mop = False
         if ct := config.get('clean_type'):
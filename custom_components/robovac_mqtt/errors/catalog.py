@@ -0,0 +1,81 @@
+import importlib
+
+# Models with their own error code list; the others use the standard one.
+# Only exact models are mapped, the lists differ within a model family.
+MODEL_TABLES = {
+    'T2080': 't2080',
+    'T2265': 't2265',
+    'T2320': 't2320',
+}
+STANDARD = 'standard'
+
+_tables: dict[str, tuple[dict, dict]] = {}
+
+
+def table_name(device_model: str) -> str:
+    """Error code list used by a device model, e.g. 'T2320' -> 't2320', 'T2261' -> 'standard'."""
+    return MODEL_TABLES.get((device_model or '').upper(), STANDARD)
+
+
+def load_table(name: str) -> tuple[dict, dict]:
+    """(errors, prompts) of a generated table, imported on first use and shared by all catalogs."""
+    table = _tables.get(name)
+    if table is None:
+        module = importlib.import_module(f'.tables.{name}', __package__)
+        table = _tables[name] = (module.ERRORS, module.PROMPTS)
+    return table
+
+
+class ErrorInfo:
+    """Name, severity ('error', 'fault' or 'prompt') and description of one code."""
+
+    __slots__ = ('code', 'name', 'severity', 'description')
+
+    def __init__(self, code: int, name: str, severity: str, description: str) -> None:
+        self.code = code
+        self.name = name
+        self.severity = severity
+        self.description = description
+
+    def as_dict(self) -> dict:
+        return {'code': self.code, 'name': self.name, 'severity': self.severity, 'description': self.description}
+
+    def __repr__(self) -> str:
+        return f'ErrorInfo({self.code}, {self.name!r}, {self.severity!r})'
+
+
+class ErrorCatalog:
+    """Error and prompt codes of one device model.
+
+    Tables are generated ahead of time by `errors.generate`; the model's table
+    is imported on the first lookup and every lookup after that is a dict hit.
+    Unknown codes still get an ErrorInfo so callers never have to special-case
+    them.
+    """
+
+    def __init__(self, device_model: str) -> None:
+        self.device_model = device_model
+        self.table = table_name(device_model)
+        self._errors: dict[int, ErrorInfo] | None = None
+        self._prompts: dict[int, ErrorInfo] | None = None
+
+    def _load(self) -> None:
+        errors, prompts = load_table(self.table)
+        self._errors = {code: ErrorInfo(code, *entry) for code, entry in errors.items()}
+        self._prompts = {code: ErrorInfo(code, *entry) for code, entry in prompts.items()}
+
+    def error(self, code: int) -> ErrorInfo:
+        if self._errors is None:
+            self._load()
+        info = self._errors.get(code)
+        if info is None:
+            info = self._errors[code] = ErrorInfo(code, f'E{code:04d}_UNKNOWN', 'error', f'Unknown error {code}')
+        return info
+
+    def prompt(self, code: int) -> ErrorInfo:
+        if self._prompts is None:
+            self._load()
+        info = self._prompts.get(code)
+        if info is None:
+            info = self._prompts[code] = ErrorInfo(code, f'P{code:04d}_UNKNOWN', 'prompt', f'Unknown prompt {code}')
+        return info
@@ -0,0 +1,103 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+
+from ..proto.cloud.error_code_pb2 import ErrorCode
+from .catalog import ErrorCatalog, ErrorInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+RAISED = 'raised'
+CLEARED = 'cleared'
+
+ERROR = 'error'
+WARN = 'warn'
+
+
+class ErrorEvent:
+    """A code of the `error` or `warn` list being raised or cleared."""
+
+    __slots__ = ('kind', 'level', 'info', 'time')
+
+    def __init__(self, kind: str, level: str, info: ErrorInfo, timestamp: float) -> None:
+        self.kind = kind
+        self.level = level
+        self.info = info
+        self.time = timestamp
+
+    @property
+    def code(self) -> int:
+        return self.info.code
+
+    def as_dict(self) -> dict:
+        return {'kind': self.kind, 'level': self.level, 'time': self.time, **self.info.as_dict()}
+
+    def __repr__(self) -> str:
+        return f'ErrorEvent({self.kind}, {self.level}, {self.info.code}, {self.info.name!r})'
+
+
+Listener = Callable[[ErrorEvent], None]
+
+
+class ErrorEventEngine:
+    """Turns successive ErrorCode snapshots into raised / cleared events.
+
+    Codes are diffed per list against the previous snapshot. A code listed in
+    `new_code` is raised again even if it was already active, since the robot
+    only fills `new_code` when it triggers a code anew. Frames whose lists and
+    new codes equal the previous frame's are dropped before any diffing. The
+    last HISTORY events are kept in memory.
+    """
+
+    HISTORY = 100
+
+    def __init__(self, catalog: ErrorCatalog) -> None:
+        self.catalog = catalog
+        self.errors: tuple[int, ...] = ()
+        self.warns: tuple[int, ...] = ()
+        self.history: deque[ErrorEvent] = deque(maxlen=self.HISTORY)
+        self._key = None
+        self._listeners: list[Listener] = []
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Call `listener` with every event. Returns an unsubscribe function."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def update(self, snapshot: ErrorCode, timestamp: float | None = None) -> list[ErrorEvent]:
+        """Apply an ErrorCode snapshot, returning the events it caused."""
+        errors, warns = tuple(snapshot.error), tuple(snapshot.warn)
+        new_errors, new_warns = tuple(snapshot.new_code.error), tuple(snapshot.new_code.warn)
+        key = (errors, warns, new_errors, new_warns)
+        if key == self._key:
+            return []
+        self._key = key
+
+        timestamp = time.time() if timestamp is None else timestamp
+        events = []
+        # Warnings are prompt codes, looked up in the catalog's prompt table
+        for level, lookup, previous, current, new in ((ERROR, self.catalog.error, self.errors, errors, new_errors),
+                                                      (WARN, self.catalog.prompt, self.warns, warns, new_warns)):
+            active = set(current)
+            before = set(previous)
+            for code in previous:
+                if code not in active:
+                    events.append(ErrorEvent(CLEARED, level, lookup(code), timestamp))
+            raised = [code for code in current if code not in before]
+            raised += [code for code in new if code in before and code in active and code not in raised]
+            for code in raised:
+                events.append(ErrorEvent(RAISED, level, lookup(code), timestamp))
+        self.errors, self.warns = errors, warns
+
+        self.history.extend(events)
+        for event in events:
+            _LOGGER.debug('Error event %s', event)
+            for listener in self._listeners:
+                listener(event)
+        return events
+
+    def active(self) -> list[ErrorInfo]:
+        """Active errors followed by active warnings."""
+        return ([self.catalog.error(code) for code in self.errors]
+                + [self.catalog.prompt(code) for code in self.warns])
@@ -0,0 +1,74 @@
+"""Generate the error code tables in ``errors/tables`` from the error_code_list protos.
+
+Run after regenerating the ``error_code_list_*_pb2`` modules:
+
+    python -m custom_components.robovac_mqtt.errors.generate
+
+The catalog then imports plain dict literals instead of walking the protobuf
+descriptor pools at runtime.
+"""
+import re
+from pathlib import Path
+
+from ..proto.cloud import (error_code_list_standard_pb2,
+                           error_code_list_t2080_pb2,
+                           error_code_list_t2265_pb2,
+                           error_code_list_t2320_pb2)
+
+# Table module name -> generated proto module it is built from
+SOURCES = {
+    'standard': error_code_list_standard_pb2,
+    't2080': error_code_list_t2080_pb2,
+    't2265': error_code_list_t2265_pb2,
+    't2320': error_code_list_t2320_pb2,
+}
+
+FAULT = 'fault'
+ERROR = 'error'
+PROMPT = 'prompt'
+
+# Error names describing a broken component rather than something the user can clear
+_FAULT_WORDS = re.compile(r'OPEN_CIRCUIT|SHORT_CIRCUIT|OVERCURRENT|ABNORMAL|NO_SIGNAL|_ERROR$|PROTECTION_TEST')
+
+TABLES_DIR = Path(__file__).parent / 'tables'
+
+
+def describe(name: str) -> str:
+    """'E001_THE_SIDE_BRUSH_IS_STUCK' -> 'The side brush is stuck'."""
+    text = name.split('_', 1)[1].replace('_', ' ').lower()
+    return text[:1].upper() + text[1:]
+
+
+def severity(name: str, prompt: bool) -> str:
+    if prompt:
+        return PROMPT
+    return FAULT if _FAULT_WORDS.search(name) else ERROR
+
+
+def entries(enum, prompt: bool) -> dict[int, tuple[str, str, str]]:
+    return {
+        value.number: (value.name, severity(value.name, prompt), describe(value.name))
+        for value in enum.values if value.number
+    }
+
+
+def render(module) -> str:
+    lines = [f'# Generated by errors/generate.py from {Path(module.__file__).stem}, do not edit.', '']
+    for variable, enum_name, prompt in (('ERRORS', 'ErrorCodeList', False), ('PROMPTS', 'PromptCodeList', True)):
+        lines.append(f'{variable} = {{')
+        for code, entry in sorted(entries(module.DESCRIPTOR.enum_types_by_name[enum_name], prompt).items()):
+            lines.append(f'    {code}: {entry!r},')
+        lines.extend(('}', ''))
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    TABLES_DIR.mkdir(exist_ok=True)
+    (TABLES_DIR / '__init__.py').touch()
+    for table, module in SOURCES.items():
+        (TABLES_DIR / f'{table}.py').write_text(render(module), encoding='utf-8')
+        print(f'Wrote {table}.py')
+
+
+if __name__ == '__main__':
+    main()
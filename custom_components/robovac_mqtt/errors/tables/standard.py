@@ -0,0 +1,172 @@
+# Generated by errors/generate.py from error_code_list_standard_pb2, do not edit.
+
+ERRORS = {
+    1010: ('E1010_LEFT_WHEEL_OPEN_CIRCUIT', 'fault', 'Left wheel open circuit'),
+    1011: ('E1011_LEFT_WHEEL_SHORT_CIRCUIT', 'fault', 'Left wheel short circuit'),
+    1012: ('E1012_LEFT_WHEEL_ABNORMAL', 'fault', 'Left wheel abnormal'),
+    1013: ('E1013_LEFT_WHEEL_OVERCURRENT', 'fault', 'Left wheel overcurrent'),
+    1020: ('E1020_RIGHT_WHEEL_OPEN_CIRCUIT', 'fault', 'Right wheel open circuit'),
+    1021: ('E1021_RIGHT_WHEEL_SHORT_CIRCUIT', 'fault', 'Right wheel short circuit'),
+    1022: ('E1022_RIGHT_WHEEL_ABNORMAL', 'fault', 'Right wheel abnormal'),
+    1023: ('E1023_RIGHT_WHEEL_OVERCURRENT', 'fault', 'Right wheel overcurrent'),
+    1030: ('E1030_LEFT_RIGHT_WHEEL_OPEN_CIRCUIT', 'fault', 'Left right wheel open circuit'),
+    1031: ('E1031_LEFT_RIGHT_WHEEL_SHORT_CIRCUIT', 'fault', 'Left right wheel short circuit'),
+    1032: ('E1032_LEFT_RIGHT_WHEEL_ABNORMAL', 'fault', 'Left right wheel abnormal'),
+    1033: ('E1033_LEFT_RIGHT_WHEEL_OVERCURRENT', 'fault', 'Left right wheel overcurrent'),
+    2010: ('E2010_SINGLE_FAN_OPEN_CIRCUIT', 'fault', 'Single fan open circuit'),
+    2011: ('E2011_SINGLE_FAN_SHORT_CIRCUIT', 'fault', 'Single fan short circuit'),
+    2012: ('E2012_SINGLE_FAN_ABNORMAL', 'fault', 'Single fan abnormal'),
+    2013: ('E2013_SINGLE_FAN_ROTATION_ABNORMAL', 'fault', 'Single fan rotation abnormal'),
+    2020: ('E2020_LEFT_FAN_OPEN_CIRCUIT', 'fault', 'Left fan open circuit'),
+    2021: ('E2021_LEFT_FAN_SHORT_CIRCUIT', 'fault', 'Left fan short circuit'),
+    2022: ('E2022_LEFT_FAN_ABNORMAL', 'fault', 'Left fan abnormal'),
+    2023: ('E2023_LEFT_FAN_ROTATION_ABNORMAL', 'fault', 'Left fan rotation abnormal'),
+    2024: ('E2024_RIGHT_FAN_OPEN_CIRCUIT', 'fault', 'Right fan open circuit'),
+    2025: ('E2025_RIGHT_FAN_SHORT_CIRCUIT', 'fault', 'Right fan short circuit'),
+    2026: ('E2026_RIGHT_FAN_ABNORMAL', 'fault', 'Right fan abnormal'),
+    2027: ('E2027_RIGHT_FAN_ROTATION_ABNORMAL', 'fault', 'Right fan rotation abnormal'),
+    2110: ('E2110_SINGLE_BRUSH_OPEN_CIRCUIT', 'fault', 'Single brush open circuit'),
+    2111: ('E2111_SINGLE_BRUSH_SHORT_CIRCUIT', 'fault', 'Single brush short circuit'),
+    2112: ('E2112_SINGLE_BRUSH_OVERCURRENT', 'fault', 'Single brush overcurrent'),
+    2113: ('E2113_SINGLE_BRUSH_ABNORMAL', 'fault', 'Single brush abnormal'),
+    2120: ('E2120_DOUBLE_BRUSH_FRONT_OPEN_CIRCUIT', 'fault', 'Double brush front open circuit'),
+    2121: ('E2121_DOUBLE_BRUSH_FRONT_SHORT_CIRCUIT', 'fault', 'Double brush front short circuit'),
+    2122: ('E2122_DOUBLE_BRUSH_FRONT_OVERCURRENT', 'fault', 'Double brush front overcurrent'),
+    2123: ('E2123_DOUBLE_BRUSH_BACK_OPEN_CIRCUIT', 'fault', 'Double brush back open circuit'),
+    2124: ('E2124_DOUBLE_BRUSH_BACK_SHORT_CIRCUIT', 'fault', 'Double brush back short circuit'),
+    2125: ('E2125_DOUBLE_BRUSH_BACK_OVERCURRENT', 'fault', 'Double brush back overcurrent'),
+    2210: ('E2210_SINGLE_SIDE_BRUSH_OPEN_CIRCUIT', 'fault', 'Single side brush open circuit'),
+    2211: ('E2211_SINGLE_SIDE_BRUSH_SHORT_CIRCUIT', 'fault', 'Single side brush short circuit'),
+    2212: ('E2212_SINGLE_SIDE_BRUSH_ABNORMAL', 'fault', 'Single side brush abnormal'),
+    2213: ('E2213_SINGLE_SIDE_BRUSH_OVERCURRENT', 'fault', 'Single side brush overcurrent'),
+    2220: ('E2220_LEFT_SIDE_BRUSH_OPEN_CIRCUIT', 'fault', 'Left side brush open circuit'),
+    2221: ('E2221_LEFT_SIDE_BRUSH_SHORT_CIRCUIT', 'fault', 'Left side brush short circuit'),
+    2222: ('E2222_LEFT_SIDE_BRUSH_ABNORMAL', 'fault', 'Left side brush abnormal'),
+    2223: ('E2223_LEFT_SIDE_BRUSH_OVERCURRENT', 'fault', 'Left side brush overcurrent'),
+    2224: ('E2224_RIGHT_SIDE_BRUSH_OPEN_CIRCUIT', 'fault', 'Right side brush open circuit'),
+    2225: ('E2225_RIGHT_SIDE_BRUSH_SHORT_CIRCUIT', 'fault', 'Right side brush short circuit'),
+    2226: ('E2226_RIGHT_SIDE_BRUSH_ABNORMAL', 'fault', 'Right side brush abnormal'),
+    2227: ('E2227_RIGHT_SIDE_BRUSH_OVERCURRENT', 'fault', 'Right side brush overcurrent'),
+    2310: ('E2310_DUSTBIN_NOT_INSTALLED', 'error', 'Dustbin not installed'),
+    2311: ('E2311_DUSTBIN_INSTALLED_USE_TIME_EXCEEDS_10_HOURS', 'error', 'Dustbin installed use time exceeds 10 hours'),
+    3010: ('E3010_ROBOT_WATER_PUMP_OPEN_CIRCUIT', 'fault', 'Robot water pump open circuit'),
+    3011: ('E3011_ROBOT_WATER_PUMP_SHORT_CIRCUIT', 'fault', 'Robot water pump short circuit'),
+    3012: ('E3012_ROBOT_WATER_TANK_WATER_PUMP_ABNORMAL', 'fault', 'Robot water tank water pump abnormal'),
+    3013: ('E3013_ROBOT_WATER_TANK_INSUFFICIENT', 'error', 'Robot water tank insufficient'),
+    3020: ('E3020_ROBOT_WATER_TANK_REMOVED_CANNOT_MOVE', 'error', 'Robot water tank removed cannot move'),
+    3110: ('E3110_LEFT_MOP_NOT_INSTALLED', 'error', 'Left mop not installed'),
+    3111: ('E3111_RIGHT_MOP_NOT_INSTALLED', 'error', 'Right mop not installed'),
+    3120: ('E3120_ROTATING_MOTOR_OPEN_CIRCUIT', 'fault', 'Rotating motor open circuit'),
+    3121: ('E3121_ROTATING_MOTOR_SHORT_CIRCUIT', 'fault', 'Rotating motor short circuit'),
+    3122: ('E3122_ROTATING_MOTOR_ABNORMAL', 'fault', 'Rotating motor abnormal'),
+    3123: ('E3123_ROTATING_MOTOR_JAMMED', 'error', 'Rotating motor jammed'),
+    3130: ('E3130_LIFTING_MOTOR_OPEN_CIRCUIT', 'fault', 'Lifting motor open circuit'),
+    3131: ('E3131_LIFTING_MOTOR_SHORT_CIRCUIT', 'fault', 'Lifting motor short circuit'),
+    3132: ('E3132_LIFTING_MOTOR_ABNORMAL', 'fault', 'Lifting motor abnormal'),
+    3133: ('E3133_LIFTING_MOTOR_JAMMED', 'error', 'Lifting motor jammed'),
+    4010: ('E4010_RADAR_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED', 'fault', 'Radar no signal communication possibly damaged'),
+    4011: ('E4011_RADAR_BLOCKED', 'error', 'Radar blocked'),
+    4012: ('E4012_RADAR_ROTATION_ABNORMAL', 'fault', 'Radar rotation abnormal'),
+    4020: ('E4020_GYROSCOPE_ABNORMAL', 'fault', 'Gyroscope abnormal'),
+    4030: ('E4030_TOF_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED', 'fault', 'Tof no signal communication possibly damaged'),
+    4031: ('E4031_TOF_BLOCKED', 'error', 'Tof blocked'),
+    4040: ('E4040_CAM_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED', 'fault', 'Cam no signal communication possibly damaged'),
+    4041: ('E4041_CAM_BLOCKED', 'error', 'Cam blocked'),
+    4090: ('E4090_WALL_SENSOR_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED', 'fault', 'Wall sensor no signal communication possibly damaged'),
+    4091: ('E4091_WALL_SENSOR_BLOCKED', 'error', 'Wall sensor blocked'),
+    4111: ('E4111_LEFT_FRONT_COLLISION_LONG_TRIGGER', 'error', 'Left front collision long trigger'),
+    4112: ('E4112_RIGHT_FRONT_COLLISION_LONG_TRIGGER', 'error', 'Right front collision long trigger'),
+    4120: ('E4120_ULTRASONIC_COMMUNICATION_INTERRUPTED_CLEANING_SCENE', 'error', 'Ultrasonic communication interrupted cleaning scene'),
+    4121: ('E4121_ULTRASONIC_COMMUNICATION_INTERRUPTED_NON_CLEANING_SCENE', 'error', 'Ultrasonic communication interrupted non cleaning scene'),
+    4130: ('E4130_LASER_SHIELD_LONG_TRIGGER', 'error', 'Laser shield long trigger'),
+    5010: ('E5010_BATTERY_OPEN_CIRCUIT', 'fault', 'Battery open circuit'),
+    5011: ('E5011_BATTERY_SHORT_CIRCUIT', 'fault', 'Battery short circuit'),
+    5012: ('E5012_BATTERY_CHARGING_CURRENT_TOO_SMALL', 'error', 'Battery charging current too small'),
+    5013: ('E5013_BATTERY_DISCHARGE_CURRENT_TOO_LARGE', 'error', 'Battery discharge current too large'),
+    5014: ('E5014_LOW_BATTERY_SHUTDOWN', 'error', 'Low battery shutdown'),
+    5015: ('E5015_LOW_BATTERY_CANNOT_SCHEDULE_CLEANING', 'error', 'Low battery cannot schedule cleaning'),
+    5016: ('E5016_CHARGING_CURRENT_TOO_LARGE', 'error', 'Charging current too large'),
+    5017: ('E5017_CHARGING_VOLTAGE_ABNORMAL', 'fault', 'Charging voltage abnormal'),
+    5018: ('E5018_BATTERY_TEMPERATURE_ABNORMAL', 'fault', 'Battery temperature abnormal'),
+    5021: ('E5021_DISCHARGE_HIGH_TEMPERATURE', 'error', 'Discharge high temperature'),
+    5022: ('E5022_DISCHARGE_LOW_TEMPERATURE', 'error', 'Discharge low temperature'),
+    5023: ('E5023_CHARGING_HIGH_TEMPERATURE', 'error', 'Charging high temperature'),
+    5024: ('E5024_CHARGING_LOW_TEMPERATURE', 'error', 'Charging low temperature'),
+    5110: ('E5110_WIFI_ABNORMAL', 'fault', 'Wifi abnormal'),
+    5111: ('E5111_BT_ABNORMAL', 'fault', 'Bt abnormal'),
+    5112: ('E5112_INFRARED_COMMUNICATION_ABNORMAL', 'fault', 'Infrared communication abnormal'),
+    6010: ('E6010_CLEAN_WATER_TANK_NOT_INSTALLED', 'error', 'Clean water tank not installed'),
+    6011: ('E6011_CLEAN_WATER_TANK_EMPTY', 'error', 'Clean water tank empty'),
+    6012: ('E6012_CLEAN_WATER_PUMP_OPEN_CIRCUIT', 'fault', 'Clean water pump open circuit'),
+    6013: ('E6013_CLEAN_WATER_PUMP_SHORT_CIRCUIT', 'fault', 'Clean water pump short circuit'),
+    6014: ('E6014_THREE_WAY_VALVE_SHORT_CIRCUIT', 'fault', 'Three way valve short circuit'),
+    6020: ('E6020_DIRTY_WATER_TANK_NOT_INSTALLED', 'error', 'Dirty water tank not installed'),
+    6021: ('E6021_DIRTY_WATER_TANK_FULL', 'error', 'Dirty water tank full'),
+    6022: ('E6022_DIRTY_WATER_PUMP_OPEN_CIRCUIT', 'fault', 'Dirty water pump open circuit'),
+    6023: ('E6023_DIRTY_WATER_PUMP_SHORT_CIRCUIT', 'fault', 'Dirty water pump short circuit'),
+    6024: ('E6024_DIRTY_WATER_TANK_NOT_CLOSED_TIGHTLY', 'error', 'Dirty water tank not closed tightly'),
+    6025: ('E6025_DIRTY_WATER_TANK_ABNORMAL_FULL_OR_NOT_INSTALLED', 'fault', 'Dirty water tank abnormal full or not installed'),
+    6030: ('E6030_CLEANING_DISC_NOT_INSTALLED', 'error', 'Cleaning disc not installed'),
+    6031: ('E6031_CLEANING_DISC_WATER_FULL', 'error', 'Cleaning disc water full'),
+    6032: ('E6032_CLEANING_DISC_NOT_INSTALLED_OR_WATER_FULL', 'error', 'Cleaning disc not installed or water full'),
+    6040: ('E6040_BLOWING_FAN_OPEN_CIRCUIT', 'fault', 'Blowing fan open circuit'),
+    6041: ('E6041_BLOWING_FAN_SHORT_CIRCUIT', 'fault', 'Blowing fan short circuit'),
+    6042: ('E6042_HEATING_MODULE_OPEN_CIRCUIT', 'fault', 'Heating module open circuit'),
+    6043: ('E6043_NTC_OPEN_CIRCUIT', 'fault', 'Ntc open circuit'),
+    6110: ('E6110_VOLTAGE_TRANSFORMER_DEGREE_ABNORMAL', 'fault', 'Voltage transformer degree abnormal'),
+    6111: ('E6111_DUST_BIN_LEAKS_AIR', 'error', 'Dust bin leaks air'),
+    6112: ('E6112_DUST_BIN_BLOCKED', 'error', 'Dust bin blocked'),
+    6113: ('E6113_DUST_BAG_NOT_INSTALLED', 'error', 'Dust bag not installed'),
+    6114: ('E6114_FAN_OVERHEATED', 'error', 'Fan overheated'),
+    6115: ('E6115_PRESSURE_GAUGE_ABNORMAL', 'fault', 'Pressure gauge abnormal'),
+    6311: ('E6311_HAIR_CUTTING_COMPONENT_ABNORMAL_OR_BLOCKED_CANNOT_START_WORK', 'fault', 'Hair cutting component abnormal or blocked cannot start work'),
+    7000: ('E7000_SMALL_SPACE_TIMEOUT', 'error', 'Small space timeout'),
+    7001: ('E7001_PART_OF_MACHINE_SUSPENDED', 'error', 'Part of machine suspended'),
+    7002: ('E7002_MACHINE_PICKED_UP_EXCEEDING_3_GROUND_CHECKS_WHEEL_SUSPENDED', 'error', 'Machine picked up exceeding 3 ground checks wheel suspended'),
+    7003: ('E7003_STARTUP_FALLING_SUSPENDED', 'error', 'Startup falling suspended'),
+    7004: ('E7004_MACHINE_STUCK', 'error', 'Machine stuck'),
+    7010: ('E7010_ENTERED_FORBIDDEN_AREA', 'error', 'Entered forbidden area'),
+    7011: ('E7011_ENTERED_CARPET', 'error', 'Entered carpet'),
+    7031: ('E7031_RIDING_FAILURE', 'error', 'Riding failure'),
+    7033: ('E7033_EXPLORING_BASE_STATION_FAILURE_BASE_STATION_DEPARTURE', 'error', 'Exploring base station failure base station departure'),
+    7034: ('E7034_CANNOT_FIND_STARTING_POINT', 'error', 'Cannot find starting point'),
+    7035: ('E7035_RIDING_FAILURE_BASE_STATION_NOT_POWERED_ON', 'error', 'Riding failure base station not powered on'),
+    7036: ('E7036_RIDING_FAILURE_OMNIWHEEL_JAMMED', 'error', 'Riding failure omniwheel jammed'),
+    7037: ('E7037_RIDING_FAILURE_INFRARED_REFLECTION', 'error', 'Riding failure infrared reflection'),
+    7040: ('E7040_DISMOUNT_FAILURE', 'error', 'Dismount failure'),
+    7053: ('E7053_MACHINE_TILTED', 'error', 'Machine tilted'),
+    7055: ('E7055_STATION_NOT_FOUND_CANNOT_MOP', 'error', 'Station not found cannot mop'),
+}
+
+PROMPTS = {
+    24: ('P0024_NETWORK_PASSWORD_ERROR', 'prompt', 'Network password error'),
+    25: ('P0025_ROUTER_NOT_CONNECTED_TO_INTERNET', 'prompt', 'Router not connected to internet'),
+    31: ('P0031_LOCATION_SUCCESS', 'prompt', 'Location success'),
+    38: ('P0038_MOPPING_COMPLETED_IN_TASK', 'prompt', 'Mopping completed in task'),
+    39: ('P0039_MOPPING_COMPLETED_AFTER_TASK', 'prompt', 'Mopping completed after task'),
+    40: ('P0040_RETURN_TO_BASE_AFTER_TASK_COMPLETED', 'prompt', 'Return to base after task completed'),
+    45: ('P0045_TASK_COMPLETED', 'prompt', 'Task completed'),
+    61: ('P0061_LOW_BATTERY_RECHARGE_NO_CLEAN', 'prompt', 'Low battery recharge no clean'),
+    65: ('P0065_LOW_BATTERY_30_PERCENT_NOT_ENOUGH', 'prompt', 'Low battery 30 percent not enough'),
+    66: ('P0066_LOW_BATTERY_10_PERCENT_NOT_ENOUGH', 'prompt', 'Low battery 10 percent not enough'),
+    76: ('P0076_CANNOT_EXECUTE_POSITIONING_RECHARGE_IN_BASE', 'prompt', 'Cannot execute positioning recharge in base'),
+    78: ('P0078_LOW_BATTERY_CANNOT_START_TASK', 'prompt', 'Low battery cannot start task'),
+    79: ('P0079_LOW_BATTERY_RECHARGE', 'prompt', 'Low battery recharge'),
+    83: ('P0083_CHILD_LOCK_ON_CANNOT_USE_POSITIONING', 'prompt', 'Child lock on cannot use positioning'),
+    85: ('P0085_SCHEDULE_CLEAN_START', 'prompt', 'Schedule clean start'),
+    87: ('P0087_MAP_DATA_UPDATING_CANNOT_OPERATE', 'prompt', 'Map data updating cannot operate'),
+    88: ('P0088_CHILD_LOCK_ON_CANNOT_USE_RECHARGE', 'prompt', 'Child lock on cannot use recharge'),
+    90: ('P0090_BASE_INSIDE_MOP_BUTTON_PRESSED', 'prompt', 'Base inside mop button pressed'),
+    91: ('P0091_BASE_INSIDE_DUST_COLLECTING_BUTTON_PRESSED', 'prompt', 'Base inside dust collecting button pressed'),
+    6117: ('P6117_LOW_BATTERY_CANNOT_START_DUST_COLLECTION', 'prompt', 'Low battery cannot start dust collection'),
+    6118: ('P6118_LOW_BATTERY_CANNOT_START_ROLLING_BRUSH_SELF_CLEANING', 'prompt', 'Low battery cannot start rolling brush self cleaning'),
+    6300: ('P6300_HAIR_CLEANING_IN_PROGRESS', 'prompt', 'Hair cleaning in progress'),
+    6301: ('P6301_LOW_BATTERY_CANNOT_START_HAIR_CUTTING', 'prompt', 'Low battery cannot start hair cutting'),
+    6310: ('P6310_POWER_FAILURE', 'prompt', 'Power failure'),
+    7020: ('P7020_POSITIONING_FAILED_IN_GLOBAL_CLEANING', 'prompt', 'Positioning failed in global cleaning'),
+    7021: ('P7021_POSITIONING_FAILED_IN_NON_GLOBAL_CLEANING', 'prompt', 'Positioning failed in non global cleaning'),
+    7050: ('P7050_CANNOT_REACH', 'prompt', 'Cannot reach'),
+    7051: ('P7051_SCHEDULE_FAILURE', 'prompt', 'Schedule failure'),
+    7052: ('P7052_PATH_PLANNING_FAILURE', 'prompt', 'Path planning failure'),
+    7054: ('P7054_TARGET_NOT_FOUND_STOP_FOLLOWING', 'prompt', 'Target not found stop following'),
+}
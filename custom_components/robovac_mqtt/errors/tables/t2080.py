@@ -0,0 +1,97 @@
+# Generated by errors/generate.py from error_code_list_t2080_pb2, do not edit.
+
+ERRORS = {
+    1: ('E001_THE_SIDE_BRUSH_IS_STUCK', 'error', 'The side brush is stuck'),
+    2: ('E002_ROLLING_BRUSH_IS_STUCK', 'error', 'Rolling brush is stuck'),
+    3: ('E003_FAN_SPEED_IS_ABNORMAL', 'fault', 'Fan speed is abnormal'),
+    4: ('E004_MICRO_SWITCH_IS_ABNORMAL', 'fault', 'Micro switch is abnormal'),
+    5: ('E005_THE_WHEEL_IS_OVERHANGING', 'error', 'The wheel is overhanging'),
+    6: ('E006_THE_RIGHT_SIDE_SENSOR_ALONG_THE_WALL_IS_BLOCKED', 'error', 'The right side sensor along the wall is blocked'),
+    7: ('E007_THE_COLLISION_BUFFER_IS_JAMMED', 'error', 'The collision buffer is jammed'),
+    8: ('E008_THE_COLLISION_SWITCH_IS_ABNORMAL_THE_MANUAL_OR_APP', 'fault', 'The collision switch is abnormal the manual or app'),
+    9: ('E009_ULTRASONIC_SENSOR_IS_ABNORMAL_THE_MANUAL_OR_APP', 'fault', 'Ultrasonic sensor is abnormal the manual or app'),
+    10: ('E010_LASER_PROTECTION_COVER_IS_STUCK', 'error', 'Laser protection cover is stuck'),
+    11: ('E011_LASER_SENSOR_MAY_BE_BLOCKED', 'error', 'Laser sensor may be blocked'),
+    12: ('E012_LASER_SENSOR_IS_STUCK_OR_ENTANGLED', 'error', 'Laser sensor is stuck or entangled'),
+    13: ('E013_COMMUNICATION_MODULE_IS_ABNORMAL', 'fault', 'Communication module is abnormal'),
+    14: ('E014_THE_POWER_IS_TOO_LOW_THE_SYSTEM_IS_ABOUT_TO_SHUT_DOWN_AUTOMATICALLY', 'error', 'The power is too low the system is about to shut down automatically'),
+    15: ('E015_PLEASE_PUT_BACK_THE_DUST_BOX_AND_FILTER', 'error', 'Please put back the dust box and filter'),
+    16: ('E016_THE_WATER_TANK_IS_TAKEN_OUT', 'error', 'The water tank is taken out'),
+    17: ('E017_THE_MOP_CLOTH_IS_OFF', 'error', 'The mop cloth is off'),
+    18: ('E018_THE_MACHINE_IS_TILTED', 'error', 'The machine is tilted'),
+    19: ('E019_THE_MACHINE_IS_TRAPPED_PLEASE_CLEAR_THE_SURROUNDING_OBSTACLES', 'error', 'The machine is trapped please clear the surrounding obstacles'),
+    20: ('E020_THE_MACHINE_IS_TRAPPED_PLEASE_MOVE_TO_THE_ORIGINAL_PLACE_NEAR_TO_START', 'error', 'The machine is trapped please move to the original place near to start'),
+    21: ('E021_THE_WATER_TANK_IS_NOT_ENOUGH', 'error', 'The water tank is not enough'),
+    22: ('E022_THE_SEWAGE_TANK_IS_FUL', 'error', 'The sewage tank is ful'),
+    23: ('E023_WATER_TANK_IS_NOT_IN_POSITION', 'error', 'Water tank is not in position'),
+    24: ('E024_HEATER_IS_ABNORMAL', 'fault', 'Heater is abnormal'),
+    25: ('E025_THE_WATER_LEVEL_OF_CLEANING_TRAY_IS_ABNORMAL', 'fault', 'The water level of cleaning tray is abnormal'),
+    26: ('E026_THE_CLEANING_TRAY_IS_NOT_INSTALLED', 'error', 'The cleaning tray is not installed'),
+    27: ('E027_TRAVELING_WHEEL_IS_STUCK', 'error', 'Traveling wheel is stuck'),
+    29: ('E029_NO_GO_ZONE_DETECTED_PLEASE_MOVE', 'error', 'No go zone detected please move'),
+    30: ('E030_VIRTUAL_WALL_MAGNETIC_STRIP_DETECTED_PLEASE_MOVE', 'error', 'Virtual wall magnetic strip detected please move'),
+    31: ('E031_ROTATING_MOTOR_IS_STUCK', 'error', 'Rotating motor is stuck'),
+    32: ('E032_LIFT_MOTOR_IS_STUCK', 'error', 'Lift motor is stuck'),
+    51: ('E051_LONG_TIME_NOT_CLEAN_THE_DUST_BOX', 'error', 'Long time not clean the dust box'),
+    52: ('E052_CAMERA_LENS_IS_DIRTY', 'error', 'Camera lens is dirty'),
+    101: ('E101_THE_BATTERY_IS_ABNORMAL', 'fault', 'The battery is abnormal'),
+    102: ('E102_THE_WHEEL_MODULE_IS_ABNORMAL', 'fault', 'The wheel module is abnormal'),
+    103: ('E103_THE_SIDE_BRUSH_MODULE_IS_ABNORMAL', 'fault', 'The side brush module is abnormal'),
+    104: ('E104_THE_ROLLER_BRUSH_IS_ABNORMAL', 'fault', 'The roller brush is abnormal'),
+    105: ('E105_THE_FAN_IS_ABNORMAL', 'fault', 'The fan is abnormal'),
+    106: ('E106_THE_WATER_PUMP_IS_ABNORMAL', 'fault', 'The water pump is abnormal'),
+    107: ('E107_THE_LASER_SENSOR_IS_ABNORMAL', 'fault', 'The laser sensor is abnormal'),
+    108: ('E108_THE_OPTICAL_FLOW_SENSOR_IS_ABNORMAL', 'fault', 'The optical flow sensor is abnormal'),
+    109: ('E109_THE_GYROSCOPE_IS_ABNORMAL', 'fault', 'The gyroscope is abnormal'),
+    110: ('E110_CAMERA_IS_ABNORMAL', 'fault', 'Camera is abnormal'),
+    111: ('E111_ROTATION_MOTOR_ABNORMAL', 'fault', 'Rotation motor abnormal'),
+    112: ('E112_LIFT_MOTOR_ABNORMAL', 'fault', 'Lift motor abnormal'),
+    113: ('E113_THE_WATER_SPRAYING_DEVICE_IS_ABNORMAL', 'fault', 'The water spraying device is abnormal'),
+    114: ('E114_THE_WATER_PUMPING_DEVICE_IS_ABNORMAL', 'fault', 'The water pumping device is abnormal'),
+    115: ('E115_THE_AIR_DRYING_DEVICE_IS_ABNORMAL', 'fault', 'The air drying device is abnormal'),
+    116: ('E116_3D_TOF_ABNORMAL', 'fault', '3d tof abnormal'),
+    117: ('E117_ULTRASONIC_SENSOR_ABNORMAL', 'fault', 'Ultrasonic sensor abnormal'),
+    118: ('E118_LASER_SHIELD_IS_JAMMED', 'error', 'Laser shield is jammed'),
+    119: ('E119_MID_SWEEP_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Mid sweep open circuit protection test'),
+    120: ('E120_LEFT_AND_RIGHT_WHEEL_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Left and right wheel open circuit protection test'),
+    121: ('E121_SIDE_SWEEP_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Side sweep open circuit protection test'),
+    122: ('E122_FAN_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Fan open circuit protection test'),
+    123: ('E123_RADAR_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Radar open circuit protection test'),
+    124: ('E124_TOF_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Tof open circuit protection test'),
+    125: ('E125_TURNTABLE_MOTOR_OPEN_CIRCUIT', 'fault', 'Turntable motor open circuit'),
+    126: ('E126_LIFT_MOTOR_OPEN_CIRCUIT', 'fault', 'Lift motor open circuit'),
+    127: ('E127_MID_SWEEP_SHORT_CIRCUIT_PROTECTION_TEST', 'fault', 'Mid sweep short circuit protection test'),
+    128: ('E128_LEFT_AND_RIGHT_WHEEL_SHORT_CIRCUIT_PROTECTION_TEST', 'fault', 'Left and right wheel short circuit protection test'),
+    129: ('E129_SIDE_SWEEP_SHORT_CIRCUIT_PROTECTION_TEST', 'fault', 'Side sweep short circuit protection test'),
+    130: ('E130_TURNTABLE_MOTOR_SHORT_CIRCUIT', 'fault', 'Turntable motor short circuit'),
+    131: ('E131_LIFT_MOTOR_SHORT_CIRCUIT', 'fault', 'Lift motor short circuit'),
+    132: ('E132_MID_SWEEP_BLOCKING_PROTECTION_TEST', 'fault', 'Mid sweep blocking protection test'),
+    133: ('E133_LEFT_AND_RIGHT_WHEEL_BLOCKING_PROTECTION_TEST', 'fault', 'Left and right wheel blocking protection test'),
+    134: ('E134_SIDE_SWEEP_BLOCKING_PROTECTION_TEST', 'fault', 'Side sweep blocking protection test'),
+    135: ('E135_BLOWER_BLOCKING_PROTECTION_TEST', 'fault', 'Blower blocking protection test'),
+    136: ('E136_TURNTABLE_MOTOR_BLOCKING_TEST', 'error', 'Turntable motor blocking test'),
+    137: ('E137_LIFTING_MOTOR_BLOCKING_TEST', 'error', 'Lifting motor blocking test'),
+    138: ('E138_FORWARD_COLLISION_PROTECTION_TEST', 'fault', 'Forward collision protection test'),
+    139: ('E139_OFF_GROUND_PROTECTION_TEST', 'fault', 'Off ground protection test'),
+    140: ('E140_GRAY_LAYER_BOX_PROTECTION_TEST', 'fault', 'Gray layer box protection test'),
+    141: ('E141_T2310_HOST_WATER_TANK_PROTECTION_TEST', 'fault', 'T2310 host water tank protection test'),
+    142: ('E142_RADAR_COVER_MICRO_SWITCH_JAMMING_PROTECTION', 'error', 'Radar cover micro switch jamming protection'),
+    143: ('E143_T2320_BASE_STATION_WATER_TANK_IS_NOT_IN_POSITION', 'error', 'T2320 base station water tank is not in position'),
+    144: ('E144_T2320_BASE_STATION_SEWAGE_TANK_IS_NOT_IN_POSITION', 'error', 'T2320 base station sewage tank is not in position'),
+    145: ('E145_T2320_BASE_STATION_SEWAGE_TANK_FULL', 'error', 'T2320 base station sewage tank full'),
+    151: ('E151_LEFT_WHEEL_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Left wheel open circuit protection test'),
+    152: ('E152_RIGHT_WHEEL_OPEN_CIRCUIT_PROTECTION_TEST', 'fault', 'Right wheel open circuit protection test'),
+}
+
+PROMPTS = {
+    1: ('P001_START_SCHEDULED_CLEANING', 'prompt', 'Start scheduled cleaning'),
+    2: ('P002_START_CRUISE_APPOINTMENT', 'prompt', 'Start cruise appointment'),
+    3: ('P003_POWER_IS_LOW_RETURN_TO_BASE_STATION_IMMEDIATELY', 'prompt', 'Power is low return to base station immediately'),
+    4: ('P004_POSITIONING_FAILED_REBUILD_MAP_START_NEW_CLEANING', 'prompt', 'Positioning failed rebuild map start new cleaning'),
+    5: ('P005_POSITIONING_FAILED_MISSION_ENDED_START_BACK_TO_BASE_STATION', 'prompt', 'Positioning failed mission ended start back to base station'),
+    6: ('P006_SOME_AREAS_ARE_NOT_YET_CLEANED_BECAUSE_THEY_ARE_UNREACHABLE', 'prompt', 'Some areas are not yet cleaned because they are unreachable'),
+    7: ('P007_PATH_PLANNING_FAILED_CANT_REACH_THE_DESIGNATED_AREA', 'prompt', 'Path planning failed cant reach the designated area'),
+    8: ('P008_UNABLE_TO_REACH_THE_TARGET_POINT', 'prompt', 'Unable to reach the target point'),
+    9: ('P009_BASE_STATION_EXPLORATION_FAILED_THE_MACHINE_RETURNED_TO_THE_STARTING_POINT', 'prompt', 'Base station exploration failed the machine returned to the starting point'),
+    10: ('P010_BASE_STATION_EXPLORATION_FAILED_MACHINE_STOPPED_WORKING', 'prompt', 'Base station exploration failed machine stopped working'),
+}
@@ -0,0 +1,69 @@
+# Generated by errors/generate.py from error_code_list_t2265_pb2, do not edit.
+
+ERRORS = {
+    1010: ('E1010_LEFT_WHEEL_OPEN_CIRCUIT', 'fault', 'Left wheel open circuit'),
+    1011: ('E1011_LEFT_WHEEL_SHORT_CIRCUIT', 'fault', 'Left wheel short circuit'),
+    1012: ('E1012_LEFT_WHEEL_ERROR', 'fault', 'Left wheel error'),
+    1013: ('E1013_LEFT_WHEEL_STUCK', 'error', 'Left wheel stuck'),
+    1020: ('E1020_RIGHT_WHEEL_OPEN_CIRCUIT', 'fault', 'Right wheel open circuit'),
+    1021: ('E1021_RIGHT_WHEEL_SHORT_CIRCUIT', 'fault', 'Right wheel short circuit'),
+    1022: ('E1022_RIGHT_WHEEL_ERROR', 'fault', 'Right wheel error'),
+    1023: ('E1023_RIGHT_WHEEL_STUCK', 'error', 'Right wheel stuck'),
+    1030: ('E1030_WHEELS_OPEN_CIRCUIT', 'fault', 'Wheels open circuit'),
+    1031: ('E1031_WHEELS_SHORT_CIRCUIT', 'fault', 'Wheels short circuit'),
+    1032: ('E1032_WHEELS_ERROR', 'fault', 'Wheels error'),
+    1033: ('E1033_WHEELS_STUCK', 'error', 'Wheels stuck'),
+    2010: ('E2010_SUNCTION_FAN_OPEN_CIRCUIT', 'fault', 'Sunction fan open circuit'),
+    2013: ('E2013_SUNCTION_FAN_RPM_ERROR', 'fault', 'Sunction fan rpm error'),
+    2110: ('E2110_ROLLER_BRUSH_OPEN_CIRCUIT', 'fault', 'Roller brush open circuit'),
+    2111: ('E2111_ROLLER_BRUSH_SHORT_CIRCUIT', 'fault', 'Roller brush short circuit'),
+    2112: ('E2112_ROLLER_BRUSH_STUCK', 'error', 'Roller brush stuck'),
+    2210: ('E2210_SIDE_BRUSH_OPEN_CIRCUIT', 'fault', 'Side brush open circuit'),
+    2211: ('E2211_SIDE_BRUSH_SHORT_CIRCUIT', 'fault', 'Side brush short circuit'),
+    2212: ('E2212_SIDE_BRUSH_ERROR', 'fault', 'Side brush error'),
+    2213: ('E2213_SIDE_BRUSH_STUCK', 'error', 'Side brush stuck'),
+    2310: ('E2310_DUSTBIN_NOT_INSTALLED', 'error', 'Dustbin not installed'),
+    2311: ('E2311_DUSTBIN_NOT_CLEANED_FOR_TOO_LONG', 'error', 'Dustbin not cleaned for too long'),
+    3010: ('E3010_ROBOT_WATER_PUMP_OPEN_CIRCUIT', 'fault', 'Robot water pump open circuit'),
+    3013: ('E3013_ROBOT_WATER_INSUFFICIENT', 'error', 'Robot water insufficient'),
+    4010: ('E4010_LASER_ERROR', 'fault', 'Laser error'),
+    4011: ('E4011_LASER_BLOCKED', 'error', 'Laser blocked'),
+    4012: ('E4012_LASER_STUCK', 'error', 'Laser stuck'),
+    4111: ('E4111_LEFT_BUMPER_STUCK', 'error', 'Left bumper stuck'),
+    4112: ('E4112_RIGHT_BUMPER_STUCK', 'error', 'Right bumper stuck'),
+    4130: ('E4130_LASER_COVER_STUCK', 'error', 'Laser cover stuck'),
+    5014: ('E5014_LOW_BATTERY_SHUT_DOWN', 'error', 'Low battery shut down'),
+    5015: ('E5015_LOW_BATTERY_SCHEDULES_FAILED', 'error', 'Low battery schedules failed'),
+    5110: ('E5110_WIFI_OR_BLUETOOTH_ERROR', 'fault', 'Wifi or bluetooth error'),
+    5112: ('E5112_STATION_COMMUNICATION_ERROR', 'fault', 'Station communication error'),
+    6113: ('E6113_NO_DUST_BAG_INSTALLED', 'error', 'No dust bag installed'),
+    6310: ('E6310_CUT_HAIR_INTERRUPTED', 'error', 'Cut hair interrupted'),
+    6311: ('E6311_CUT_HAIR_STUCK', 'error', 'Cut hair stuck'),
+    7000: ('E7000_ROBOT_TRAPPED', 'error', 'Robot trapped'),
+    7001: ('E7001_ROBOT_PARTLY_SUSPEND', 'error', 'Robot partly suspend'),
+    7002: ('E7002_ROBOT_SUSPEND', 'error', 'Robot suspend'),
+    7003: ('E7003_ROBOT_STARTUP_SUSPEND', 'error', 'Robot startup suspend'),
+    7010: ('E7010_ENTERED_NO_GO_ZONE', 'error', 'Entered no go zone'),
+    7020: ('E7020_POSITIONING_FAILED_AND_START_CLEANING', 'error', 'Positioning failed and start cleaning'),
+    7021: ('E7021_POSITIONING_FAILED_AND_HEADING_HOME', 'error', 'Positioning failed and heading home'),
+    7031: ('E7031_RETURN_FAILED', 'error', 'Return failed'),
+    7032: ('E7032_FIND_STATION_FAILED_AND_RETURN_START_POINT', 'error', 'Find station failed and return start point'),
+    7033: ('E7033_RETURN_STATION_FAILED_AND_STOP', 'error', 'Return station failed and stop'),
+    7034: ('E7034_FINE_START_POINT_FAILED_AND_STOP', 'error', 'Fine start point failed and stop'),
+    7040: ('E7040_LEAVE_STATION_FAILED', 'error', 'Leave station failed'),
+    7050: ('E7050_INACCESSIBLE_AREAS_NOT_CLEANED', 'error', 'Inaccessible areas not cleaned'),
+    7051: ('E7051_IN_TASK_SCHEDULES_FAILED', 'error', 'In task schedules failed'),
+    7052: ('E7052_ROUTE_UNAVAILABLE', 'error', 'Route unavailable'),
+}
+
+PROMPTS = {
+    31: ('P0031_POSITIONING_SUCCESSFUL', 'prompt', 'Positioning successful'),
+    40: ('P0040_TASK_FINISHED_HEADING_HOME', 'prompt', 'Task finished heading home'),
+    76: ('P0076_NO_PERFORMANCE_AT_STATION', 'prompt', 'No performance at station'),
+    78: ('P0078_LOW_BATTERY_NEED_CHARGING', 'prompt', 'Low battery need charging'),
+    79: ('P0079_LOW_BATTERY_HEADING_HOME', 'prompt', 'Low battery heading home'),
+    85: ('P0085_SCHEDULED_CLEANING', 'prompt', 'Scheduled cleaning'),
+    87: ('P0087_MAP_UPDATING_TRY_LATER', 'prompt', 'Map updating try later'),
+    6300: ('P6300_CUTTING_HAIR', 'prompt', 'Cutting hair'),
+    6301: ('P6301_LOW_BATTERY_CANT_CUT_HAIR', 'prompt', 'Low battery cant cut hair'),
+}
@@ -0,0 +1,75 @@
+# Generated by errors/generate.py from error_code_list_t2320_pb2, do not edit.
+
+ERRORS = {
+    1: ('E001_CRASH_BUFFER_IS_STUCK', 'error', 'Crash buffer is stuck'),
+    2: ('E002_WHEEL_IS_STUCK', 'error', 'Wheel is stuck'),
+    3: ('E003_THE_SIDE_BRUSH_IS_STUCK', 'error', 'The side brush is stuck'),
+    4: ('E004_ROLLING_BRUSH_IS_STUCK', 'error', 'Rolling brush is stuck'),
+    5: ('E005_THE_HOST_MACHINE_IS_TRAPPED_PLEASE_CLEAR_OBSTACLES', 'error', 'The host machine is trapped please clear obstacles'),
+    6: ('E006_MACHINE_IS_TRAPPED_PLEASE_MOVE_TO_START', 'error', 'Machine is trapped please move to start'),
+    7: ('E007_THE_WHEEL_IS_OVERHANGING', 'error', 'The wheel is overhanging'),
+    8: ('E008_THE_POWER_IS_TOO_LOW_THE_SYSTEM_IS_ABOUT_TO_SHUT_DOWN_AUTOMATICALLY', 'error', 'The power is too low the system is about to shut down automatically'),
+    13: ('E013_THE_HOST_IS_TILTED', 'error', 'The host is tilted'),
+    14: ('E014_THE_FAULT_NO_DUST_BOX', 'error', 'The fault no dust box'),
+    17: ('E017_FORBIDDEN_AREA_IS_DETECTED', 'error', 'Forbidden area is detected'),
+    18: ('E018_THE_LASER_PROTECTION_COVER_IS_STUCK', 'error', 'The laser protection cover is stuck'),
+    19: ('E019_LASER_SENSOR_IS_STUCK_OR_TANGLED', 'error', 'Laser sensor is stuck or tangled'),
+    20: ('E020_LASER_SENSOR_MAY_BE_BLOCKED', 'error', 'Laser sensor may be blocked'),
+    21: ('E021_ON_DOCK_FAILED', 'error', 'On dock failed'),
+    26: ('E026_INSUFFICIENT_POWER_APPOINTMENT_START_FAILED', 'error', 'Insufficient power appointment start failed'),
+    31: ('E031_FOREIGN_OBJECTS_STUCK_IN_SUCTION_PORT', 'error', 'Foreign objects stuck in suction port'),
+    32: ('E032_THE_WIPE_HOLDER_ROTATING_MOTOR_IS_STUCK', 'error', 'The wipe holder rotating motor is stuck'),
+    33: ('E033_THE_WIPING_BRACKET_LIFT_MOTOR_IS_STUCK', 'error', 'The wiping bracket lift motor is stuck'),
+    39: ('E039_POSITIONING_FAILED_END_OF_CLEANING', 'error', 'Positioning failed end of cleaning'),
+    40: ('E040_THE_MOP_CLOTH_IS_DISLODGED', 'error', 'The mop cloth is dislodged'),
+    41: ('E041_THE_AIRDRYING_DEVICE_HEATER_IS_ABNORMAL', 'fault', 'The airdrying device heater is abnormal'),
+    50: ('E050_THE_MACHINE_IS_ON_THE_CARPET_BY_MISTAKE', 'error', 'The machine is on the carpet by mistake'),
+    51: ('E051_THE_CAMERA_BLOCK', 'error', 'The camera block'),
+    52: ('E052_UNABLE_TO_LEAVE_THE_STATION', 'error', 'Unable to leave the station'),
+    55: ('E055_EXPLORING_STATION_FAILED', 'error', 'Exploring station failed'),
+    70: ('E070_CLEAN_DUST_COLLECTOR_AND_FITTER', 'error', 'Clean dust collector and fitter'),
+    71: ('E071_WALL_SENSOR_DO_NOT_WORK', 'error', 'Wall sensor do not work'),
+    72: ('E072_INSUFFICIENT_WATER_OF_ROBOVAC', 'error', 'Insufficient water of robovac'),
+    73: ('E073_DIRTY_TANK_OF_STATION_IS_FULL', 'error', 'Dirty tank of station is full'),
+    74: ('E074_CLEAN_WATER_OF_STATION_IS_INSUFFICIENT', 'error', 'Clean water of station is insufficient'),
+    75: ('E075_WATER_TANK_IS_ABSENT', 'error', 'Water tank is absent'),
+    76: ('E076_CAMERA_IS_ABNORMAL', 'fault', 'Camera is abnormal'),
+    77: ('E077_3D_TOF_IS_ABNORMAL', 'fault', '3d tof is abnormal'),
+    78: ('E078_ULTRASONIC_SENSOR_IS_ABNORMAL', 'fault', 'Ultrasonic sensor is abnormal'),
+    79: ('E079_CLEAN_TRAY_OF_STATION_IS_NOT_INSTALLED', 'error', 'Clean tray of station is not installed'),
+    80: ('E080_ROBOVAC_AND_STATION_COMMUNICATION_IS_ABNORMAL', 'fault', 'Robovac and station communication is abnormal'),
+    81: ('E081_SEWAGE_TANK_IS_LEAKING_GAS', 'error', 'Sewage tank is leaking gas'),
+    82: ('E082_CLEAN_TRAY_OF_STATION_NEED_CLEAN', 'error', 'Clean tray of station need clean'),
+    83: ('E083_POOR_CONTACT_DURING_CHARGING', 'error', 'Poor contact during charging'),
+    101: ('E101_THE_BATTERY_IS_ABNORMAL', 'fault', 'The battery is abnormal'),
+    102: ('E102_WHEEL_MODULE_IS_ABNORMAL', 'fault', 'Wheel module is abnormal'),
+    103: ('E103_THE_SIDE_BRUSH_MODULE_IS_ABNORMAL', 'fault', 'The side brush module is abnormal'),
+    104: ('E104_THE_FAN_IS_ABNORMAL', 'fault', 'The fan is abnormal'),
+    105: ('E105_THE_ROLLER_BRUSH_MOTOR_IS_ABNORMAL', 'fault', 'The roller brush motor is abnormal'),
+    106: ('E106_THE_HOST_PUMP_IS_ABNORMAL', 'fault', 'The host pump is abnormal'),
+    107: ('E107_THE_LASER_SENSOR_IS_ABNORMAL', 'fault', 'The laser sensor is abnormal'),
+    111: ('E111_ROTATION_MOTOR_ABNORMAL', 'fault', 'Rotation motor abnormal'),
+    112: ('E112_LIFT_MOTOR_ABNORMAL', 'fault', 'Lift motor abnormal'),
+    113: ('E113_THE_WATER_SPRAYING_DEVICE_IS_ABNORMAL', 'fault', 'The water spraying device is abnormal'),
+    114: ('E114_THE_WATER_PUMPING_DEVICE_IS_ABNORMAL', 'fault', 'The water pumping device is abnormal'),
+    117: ('E117_ULTRASONIC_SENSOR_IS_ABNORMAL', 'fault', 'Ultrasonic sensor is abnormal'),
+    119: ('E119_WIFI_OR_BLUETOOTH_ABNORMAL', 'fault', 'Wifi or bluetooth abnormal'),
+}
+
+PROMPTS = {
+    1: ('P001_START_SCHEDULED_CLEANING', 'prompt', 'Start scheduled cleaning'),
+    3: ('P003_POWER_IS_LOW_RETURN_TO_BASE_STATION_IMMEDIATELY', 'prompt', 'Power is low return to base station immediately'),
+    4: ('P004_POSITIONING_FAILED_REBUILD_MAP_START_NEW_CLEANING', 'prompt', 'Positioning failed rebuild map start new cleaning'),
+    5: ('P005_POSITIONING_FAILED_MISSION_ENDED_START_BACK_TO_BASE_STATION', 'prompt', 'Positioning failed mission ended start back to base station'),
+    6: ('P006_SOME_AREAS_ARE_NOT_YET_CLEANED_BECAUSE_THEY_ARE_UNREACHABLE', 'prompt', 'Some areas are not yet cleaned because they are unreachable'),
+    7: ('P007_PATH_PLANNING_FAILED_CANT_REACH_THE_DESIGNATED_AREA', 'prompt', 'Path planning failed cant reach the designated area'),
+    9: ('P009_BASE_STATION_EXPLORATION_FAILED_THE_MACHINE_RETURNED_TO_THE_STARTING_POINT', 'prompt', 'Base station exploration failed the machine returned to the starting point'),
+    10: ('P010_POSITION_SUCCESS', 'prompt', 'Position success'),
+    11: ('P011_TASK_FINISHED_AND_RETURN', 'prompt', 'Task finished and return'),
+    12: ('P012_START_TASK_FAILED_DUE_TO_ON_STATION', 'prompt', 'Start task failed due to on station'),
+    13: ('P013_START_SCHEDULE_FAILED_DUE_TO_WORKING', 'prompt', 'Start schedule failed due to working'),
+    14: ('P014_START_TASK_FAILED_DUE_TO_MAP_UPDATING', 'prompt', 'Start task failed due to map updating'),
+    15: ('P015_FINISHED_WASHING_MOP_AND_RESUME_TASK', 'prompt', 'Finished washing mop and resume task'),
+    16: ('P016_LOW_BATTERY_PLZ_CHARGE_AND_TRY_AGAIN', 'prompt', 'Low battery plz charge and try again'),
+    17: ('P017_CLEAN_MOP_COMPLETED', 'prompt', 'Clean mop completed'),
+}
@@ -0,0 +1,200 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..proto.cloud.consumable_pb2 import ConsumableRequest, ConsumableRuntime
+
+_LOGGER = logging.getLogger(__name__)
+
+# ConsumableRuntime field -> nominal life in hours of use, overridable per tracker
+LIFETIMES: dict[str, int] = {
+    'side_brush': 180,
+    'rolling_brush': 360,
+    'filter_mesh': 180,
+    'scrape': 360,
+    'sensor': 30,
+    'mop': 180,
+    'dustbag': 360,
+    'dirty_watertank': 360,
+    'dirty_waterfilter': 360,
+}
+
+# ConsumableRuntime field -> ConsumableRequest.Type to reset it
+RESET_TYPES: dict[str, int] = {
+    'side_brush': ConsumableRequest.SIDE_BRUSH,
+    'rolling_brush': ConsumableRequest.ROLLING_BRUSH,
+    'filter_mesh': ConsumableRequest.FILTER_MESH,
+    'scrape': ConsumableRequest.SCRAPE,
+    'sensor': ConsumableRequest.SENSOR,
+    'mop': ConsumableRequest.MOP,
+    'dustbag': ConsumableRequest.DUSTBAG,
+    'dirty_watertank': ConsumableRequest.DIRTY_WATERTANK,
+    'dirty_waterfilter': ConsumableRequest.DIRTY_WATERFILTER,
+}
+
+DAY = 86400
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS consumable_samples (
+    part TEXT NOT NULL,
+    time REAL NOT NULL,
+    hours INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS consumable_samples_part_time ON consumable_samples (part, time);
+'''
+
+
+class WearFit:
+    """Running least-squares line of hours used against days since the part was fitted.
+
+    Only the sums are kept, so adding a sample and reading the rate are O(1).
+    """
+
+    __slots__ = ('start', 'n', 'sx', 'sy', 'sxx', 'sxy')
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = 0.0
+
+    def add(self, timestamp: float, hours: float) -> None:
+        x = (timestamp - self.start) / DAY
+        self.n += 1
+        self.sx += x
+        self.sy += hours
+        self.sxx += x * x
+        self.sxy += x * hours
+
+    def rate(self) -> float | None:
+        """Hours of use per day, None until there are samples at two different times."""
+        denominator = self.n * self.sxx - self.sx * self.sx
+        if self.n < 2 or denominator <= 1e-12:
+            return None
+        return (self.n * self.sxy - self.sx * self.sy) / denominator
+
+
+class ConsumableTracker:
+    """Runtime hours of the consumables reported on DPS 168, with wear-rate predictions.
+
+    Samples are only kept when a part's hours change, in a bounded per-part
+    history. Each part has a WearFit that restarts whenever its hours go down
+    (the part was replaced and reset), so the predicted replacement date
+    follows the current part only. `version` increases with every change.
+    """
+
+    HISTORY = 256
+
+    def __init__(self, path: str | Path | None = None, lifetimes: dict[str, int] | None = None) -> None:
+        self.path = str(path) if path is not None else None
+        self.lifetimes = {**LIFETIMES, **(lifetimes or {})}
+        self.history: dict[str, deque[tuple[float, int]]] = {part: deque(maxlen=self.HISTORY) for part in LIFETIMES}
+        self.fits: dict[str, WearFit] = {}
+        self.version = 0
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _add(self, part: str, timestamp: float, hours: int) -> None:
+        history = self.history[part]
+        fit = self.fits.get(part)
+        if fit is None or (history and hours < history[-1][1]):
+            fit = self.fits[part] = WearFit(timestamp)
+        history.append((timestamp, hours))
+        fit.add(timestamp, hours)
+
+    def update(self, runtime: ConsumableRuntime, timestamp: float | None = None) -> list[tuple[str, float, int]]:
+        """Record a ConsumableRuntime message, returning the (part, time, hours) samples that changed."""
+        if timestamp is None:
+            timestamp = runtime.last_time / 1e9 if runtime.last_time else time.time()
+        changed = []
+        for part in LIFETIMES:
+            if not runtime.HasField(part):
+                continue
+            hours = getattr(runtime, part).duration
+            history = self.history[part]
+            if history and history[-1][1] == hours:
+                continue
+            self._add(part, timestamp, hours)
+            changed.append((part, timestamp, hours))
+        if changed:
+            self.version += 1
+        return changed
+
+    def parts(self) -> list[str]:
+        """Parts the robot has reported."""
+        return [part for part, history in self.history.items() if history]
+
+    def hours(self, part: str) -> int | None:
+        history = self.history[part]
+        return history[-1][1] if history else None
+
+    def remaining(self, part: str) -> int | None:
+        """Hours of use left before the nominal life is reached."""
+        hours = self.hours(part)
+        return max(self.lifetimes[part] - hours, 0) if hours is not None else None
+
+    def rate(self, part: str) -> float | None:
+        """Fitted hours of use per day of the current part."""
+        fit = self.fits.get(part)
+        return fit.rate() if fit is not None else None
+
+    def replacement_date(self, part: str) -> datetime | None:
+        """When the current part is predicted to reach its nominal life, None without a usable rate."""
+        remaining, rate = self.remaining(part), self.rate(part)
+        if remaining is None or rate is None or rate <= 0:
+            return None
+        last_time = self.history[part][-1][0]
+        return datetime.fromtimestamp(last_time + remaining / rate * DAY, timezone.utc)
+
+    def state(self, part: str) -> dict:
+        rate = self.rate(part)
+        replacement = self.replacement_date(part)
+        return {
+            'hours': self.hours(part),
+            'life_hours': self.lifetimes[part],
+            'remaining_hours': self.remaining(part),
+            'hours_per_day': round(rate, 3) if rate is not None else None,
+            'replacement_date': replacement.isoformat() if replacement is not None else None,
+        }
+
+    def write(self, samples: list[tuple[str, float, int]]) -> None:
+        """Append samples returned by `update` to the database. Blocking."""
+        if self.path is None or not samples:
+            return
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.executemany('INSERT INTO consumable_samples VALUES (?, ?, ?)', samples)
+                # Only the last HISTORY samples of a part are ever read back
+                for part in {part for part, _, _ in samples}:
+                    db.execute('DELETE FROM consumable_samples WHERE part = ? AND time < '
+                               '(SELECT MIN(time) FROM (SELECT time FROM consumable_samples WHERE part = ? '
+                               'ORDER BY time DESC LIMIT ?))', (part, part, self.HISTORY))
+
+    def load(self) -> None:
+        """Restore the history and refit the wear rates from disk. Blocking."""
+        if self.path is None or not Path(self.path).exists():
+            return
+        with self._lock:
+            rows = self._connect().execute('SELECT part, time, hours FROM consumable_samples ORDER BY time').fetchall()
+        for part, timestamp, hours in rows:
+            if part in self.history:
+                self._add(part, timestamp, hours)
+        if rows:
+            self.version += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
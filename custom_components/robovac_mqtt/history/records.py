@@ -0,0 +1,174 @@
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+from ..proto.cloud.clean_record_pb2 import CleanRecordData, CleanRecordDesc
+from ..proto.cloud.clean_record_wrap_pb2 import CleanRecordWrap
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS clean_records (
+    id INTEGER PRIMARY KEY,
+    device_id TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    end_time INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    area INTEGER NOT NULL,
+    clean_type INTEGER NOT NULL,
+    finish_reason INTEGER NOT NULL,
+    mode INTEGER NOT NULL,
+    mus INTEGER NOT NULL,
+    error_code INTEGER NOT NULL,
+    prompt_code INTEGER NOT NULL,
+    map_id INTEGER,
+    releases INTEGER,
+    UNIQUE (device_id, start_time)
+);
+CREATE INDEX IF NOT EXISTS clean_records_start ON clean_records (start_time);
+CREATE INDEX IF NOT EXISTS clean_records_mode ON clean_records (mode, start_time);
+CREATE TABLE IF NOT EXISTS clean_record_data (
+    record_id INTEGER PRIMARY KEY REFERENCES clean_records (id) ON DELETE CASCADE,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+'''
+
+_COLUMNS = ('id', 'device_id', 'start_time', 'end_time', 'duration', 'area', 'clean_type',
+            'finish_reason', 'mode', 'mus', 'error_code', 'prompt_code', 'map_id', 'releases')
+
+
+def _map_version(data: CleanRecordData | None) -> tuple[int | None, int | None]:
+    if data is None:
+        return None, None
+    if data.HasField('map_p2p'):
+        return data.map_p2p.map_id, data.map_p2p.releases
+    if data.HasField('room_outline'):
+        return data.room_outline.map_id, data.room_outline.releases
+    return None, None
+
+
+class CleanRecord:
+    """One archived CleanRecordDesc; the bulky CleanRecordData is loaded on demand."""
+
+    __slots__ = ('_archive',) + _COLUMNS
+
+    def __init__(self, archive: 'CleanRecordArchive', row: tuple) -> None:
+        self._archive = archive
+        for name, value in zip(_COLUMNS, row):
+            setattr(self, name, value)
+
+    def data(self) -> CleanRecordData | None:
+        return self._archive.load_data(self.id)
+
+    def __repr__(self) -> str:
+        return (f'CleanRecord(id={self.id}, device_id={self.device_id!r}, start_time={self.start_time}, '
+                f'duration={self.duration}, area={self.area}, mode={self.mode})')
+
+
+class CleanRecordArchive:
+    """SQLite archive of clean records.
+
+    Descriptors live in one indexed table, so time range and mode queries are
+    index range scans that never touch the zlib compressed CleanRecordData
+    blobs kept in a separate table. Blocking IO, call it from an executor
+    inside an event loop.
+
+    Library only: records are not pushed over MQTT, so the integration does
+    not create or feed an archive; callers add the records they fetched.
+    """
+
+    COMPRESSION = 6
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute('PRAGMA foreign_keys = ON')
+            self._db.execute('PRAGMA journal_mode = WAL')
+            self._db.executescript(_SCHEMA)
+
+    def add(self, device_id: str, desc: CleanRecordDesc, data: CleanRecordData | None = None) -> int:
+        """Archive a record, replacing the one with the same device and start time. Returns its id."""
+        map_id, releases = _map_version(data)
+        values = (device_id, desc.start_time, desc.end_time, desc.duration, desc.area,
+                  desc.clean_type.value, desc.finish_reason, desc.extra.mode, desc.extra.mus,
+                  desc.extra.error_code, desc.extra.prompt_code, map_id, releases)
+        blob = None
+        if data is not None:
+            raw = data.SerializeToString()
+            blob = (len(raw), zlib.compress(raw, self.COMPRESSION))
+
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                f'INSERT INTO clean_records ({", ".join(_COLUMNS[1:])}) VALUES ({", ".join("?" * (len(_COLUMNS) - 1))}) '
+                'ON CONFLICT (device_id, start_time) DO UPDATE SET '
+                + ', '.join(f'{column} = excluded.{column}' for column in _COLUMNS[3:])
+                + ' RETURNING id', values)
+            record_id = cursor.fetchone()[0]
+            if blob is not None:
+                self._db.execute('INSERT OR REPLACE INTO clean_record_data (record_id, size, data) VALUES (?, ?, ?)',
+                                 (record_id, *blob))
+        return record_id
+
+    def add_wrapped(self, device_id: str, wrap: CleanRecordWrap) -> int:
+        """Archive a CleanRecordWrap (serialized descriptor and data)."""
+        data = CleanRecordData.FromString(wrap.data) if wrap.data else None
+        return self.add(device_id, CleanRecordDesc.FromString(wrap.desc), data)
+
+    def query(self, device_id: str | None = None, start: int | None = None, end: int | None = None,
+              mode: int | None = None, limit: int | None = None) -> list[CleanRecord]:
+        """Records started in [start, end) (seconds), newest first, optionally filtered by device and Extra.Mode."""
+        where, params = self._where(device_id, start, end, mode)
+        sql = f'SELECT {", ".join(_COLUMNS)} FROM clean_records{where} ORDER BY start_time DESC'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [CleanRecord(self, row) for row in rows]
+
+    def totals(self, device_id: str | None = None, start: int | None = None, end: int | None = None,
+               mode: int | None = None) -> tuple[int, int, int]:
+        """(record count, total duration in s, total area in m²) over the same filters as query()."""
+        where, params = self._where(device_id, start, end, mode)
+        with self._lock:
+            count, duration, area = self._db.execute(
+                f'SELECT COUNT(*), TOTAL(duration), TOTAL(area) FROM clean_records{where}', params).fetchone()
+        return count, int(duration), int(area)
+
+    @staticmethod
+    def _where(device_id: str | None, start: int | None, end: int | None, mode: int | None) -> tuple[str, list]:
+        clauses, params = [], []
+        if mode is not None:
+            clauses.append('mode = ?')
+            params.append(mode)
+        if start is not None:
+            clauses.append('start_time >= ?')
+            params.append(start)
+        if end is not None:
+            clauses.append('start_time < ?')
+            params.append(end)
+        if device_id is not None:
+            clauses.append('device_id = ?')
+            params.append(device_id)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+    def load_data(self, record_id: int) -> CleanRecordData | None:
+        with self._lock:
+            row = self._db.execute('SELECT size, data FROM clean_record_data WHERE record_id = ?', (record_id,)).fetchone()
+        if row is None:
+            return None
+        size, blob = row
+        return CleanRecordData.FromString(zlib.decompress(blob, bufsize=size))
+
+    def delete_before(self, timestamp: int) -> int:
+        """Drop records started before `timestamp`, with their data. Returns the number removed."""
+        with self._lock, self._db:
+            return self._db.execute('DELETE FROM clean_records WHERE start_time < ?', (timestamp,)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
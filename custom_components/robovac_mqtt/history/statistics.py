@@ -0,0 +1,200 @@
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, tzinfo
+from pathlib import Path
+
+import numpy as np
+
+from ..proto.cloud.clean_statistics_pb2 import CleanStatistics
+
+_LOGGER = logging.getLogger(__name__)
+
+SAMPLE_DTYPE = np.dtype([('time', np.float64), ('duration', np.int64), ('area', np.int64), ('count', np.int64)])
+
+HOUR = 'hour'
+DAY = 'day'
+MONTH = 'month'
+GRANULARITIES = (HOUR, DAY, MONTH)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS statistics_samples (
+    time REAL NOT NULL,
+    duration INTEGER NOT NULL,
+    area INTEGER NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS statistics_samples_time ON statistics_samples (time);
+CREATE TABLE IF NOT EXISTS statistics_rollups (
+    granularity TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    area INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (granularity, bucket)
+);
+CREATE TABLE IF NOT EXISTS statistics_state (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    duration INTEGER NOT NULL,
+    area INTEGER NOT NULL,
+    count INTEGER NOT NULL
+);
+'''
+
+
+class CleanStatisticsRecorder:
+    """Time series of the lifetime cleaning counters reported on DPS 167.
+
+    Each CleanStatistics update is diffed against the previous `total`; only
+    non-zero deltas are appended to a fixed size ring buffer and added to the
+    hourly, daily and monthly rollups, so both are O(1) per update. Samples
+    and changed rollup buckets are written to SQLite in batches by `compact`
+    (blocking, run it from an executor). Rollup buckets are keyed by the
+    timestamp of their start in `tz` (local time by default).
+    """
+
+    CAPACITY = 4096
+    COMPACT_INTERVAL = 3600
+
+    def __init__(self, path: str | Path | None = None, tz: tzinfo | None = None) -> None:
+        self.path = str(path) if path is not None else None
+        self.tz = tz
+        self.samples = np.zeros(self.CAPACITY, dtype=SAMPLE_DTYPE)
+        self._head = 0
+        self._size = 0
+        # Samples appended since the last compaction
+        self._pending = 0
+        self.rollups: dict[str, dict[int, list[int]]] = {granularity: {} for granularity in GRANULARITIES}
+        self._dirty: dict[str, set[int]] = {granularity: set() for granularity in GRANULARITIES}
+        self.last: tuple[int, int, int] | None = None
+        self._last_compaction = time.monotonic()
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _bucket_starts(self, timestamp: float) -> dict[str, int]:
+        moment = datetime.fromtimestamp(timestamp, self.tz)
+        hour = moment.replace(minute=0, second=0, microsecond=0)
+        day = hour.replace(hour=0)
+        month = day.replace(day=1)
+        return {HOUR: int(hour.timestamp()), DAY: int(day.timestamp()), MONTH: int(month.timestamp())}
+
+    def update(self, statistics: CleanStatistics, timestamp: float | None = None) -> bool:
+        """Record a CleanStatistics message, returning True if a delta was appended."""
+        total = statistics.total
+        current = (total.clean_duration, total.clean_area, total.clean_count)
+        previous, self.last = self.last, current
+        if previous is None or current == previous:
+            return False
+        delta = tuple(now - before for now, before in zip(current, previous))
+        if any(value < 0 for value in delta):
+            # Counters were reset, the new values are the baseline from here on
+            _LOGGER.debug('Clean statistics went backwards from %s to %s', previous, current)
+            return False
+        self.append(time.time() if timestamp is None else timestamp, *delta)
+        return True
+
+    def append(self, timestamp: float, duration: int, area: int, count: int) -> None:
+        self.samples[self._head] = (timestamp, duration, area, count)
+        self._head = (self._head + 1) % self.CAPACITY
+        self._size = min(self._size + 1, self.CAPACITY)
+        if self._pending == self.CAPACITY and self.path is not None:
+            _LOGGER.warning('Clean statistics ring buffer full, dropping the oldest uncompacted sample')
+        self._pending = min(self._pending + 1, self.CAPACITY)
+        for granularity, bucket in self._bucket_starts(timestamp).items():
+            totals = self.rollups[granularity].setdefault(bucket, [0, 0, 0])
+            totals[0] += duration
+            totals[1] += area
+            totals[2] += count
+            self._dirty[granularity].add(bucket)
+
+    def recent(self) -> np.ndarray:
+        """Samples in the ring buffer, oldest first."""
+        if self._size < self.CAPACITY:
+            return self.samples[:self._size].copy()
+        return np.roll(self.samples, -self._head)
+
+    def rollup(self, granularity: str, start: float | None = None, end: float | None = None) -> list[tuple[int, int, int, int]]:
+        """(bucket start, duration, area, count) per bucket overlapping [start, end), in time order."""
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'Invalid granularity: {granularity}, allowed values: {GRANULARITIES}')
+        first = self._bucket_starts(start)[granularity] if start is not None else None
+        return [
+            (bucket, *totals) for bucket, totals in sorted(self.rollups[granularity].items())
+            if (first is None or bucket >= first) and (end is None or bucket < end)
+        ]
+
+    def compaction_due(self) -> bool:
+        """True every COMPACT_INTERVAL seconds, or sooner once half the ring buffer is uncompacted."""
+        if not self._pending:
+            return False
+        return self._pending >= self.CAPACITY // 2 or time.monotonic() - self._last_compaction >= self.COMPACT_INTERVAL
+
+    def take_batch(self) -> tuple[np.ndarray, dict[str, list[tuple[int, int, int, int]]], tuple | None]:
+        """Detach the samples and rollup buckets changed since the last compaction."""
+        count = self._pending
+        indices = (self._head - count + np.arange(count)) % self.CAPACITY
+        samples = self.samples[indices]
+        rollups = {granularity: [(bucket, *self.rollups[granularity][bucket]) for bucket in buckets]
+                   for granularity, buckets in self._dirty.items()}
+        self._pending = 0
+        self._dirty = {granularity: set() for granularity in GRANULARITIES}
+        self._last_compaction = time.monotonic()
+        return samples, rollups, self.last
+
+    def write(self, batch: tuple[np.ndarray, dict[str, list[tuple[int, int, int, int]]], tuple | None]) -> None:
+        """Persist a batch from `take_batch`. Blocking."""
+        if self.path is None:
+            return
+        samples, rollups, last = batch
+        with self._lock:
+            db = self._connect()
+            with db:
+                db.executemany('INSERT INTO statistics_samples VALUES (?, ?, ?, ?)', samples.tolist())
+                for granularity, rows in rollups.items():
+                    db.executemany('INSERT OR REPLACE INTO statistics_rollups VALUES (?, ?, ?, ?, ?)',
+                                   [(granularity, *row) for row in rows])
+                if last is not None:
+                    db.execute('INSERT OR REPLACE INTO statistics_state VALUES (0, ?, ?, ?)', last)
+
+    def compact(self) -> None:
+        """Write everything recorded since the last compaction. Blocking."""
+        if self._pending:
+            self.write(self.take_batch())
+
+    def load(self) -> None:
+        """Restore rollups, recent samples and the last totals from disk. Blocking."""
+        if self.path is None or not Path(self.path).exists():
+            return
+        with self._lock:
+            db = self._connect()
+            rollups = db.execute('SELECT granularity, bucket, duration, area, count FROM statistics_rollups').fetchall()
+            recent = db.execute('SELECT time, duration, area, count FROM statistics_samples ORDER BY time DESC LIMIT ?',
+                                (self.CAPACITY,)).fetchall()
+            state = db.execute('SELECT duration, area, count FROM statistics_state').fetchone()
+        for granularity, bucket, duration, area, count in rollups:
+            if granularity in self.rollups:
+                self.rollups[granularity][bucket] = [duration, area, count]
+        recent.reverse()
+        self._size = len(recent)
+        self._head = self._size % self.CAPACITY
+        if recent:
+            self.samples[:self._size] = np.array([tuple(row) for row in recent], dtype=SAMPLE_DTYPE)
+        if state is not None and self.last is None:
+            self.last = tuple(state)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import time
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.components.vacuum import VacuumActivity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .constants.hass import (CONF_MAP_MAX_FPS, DEFAULT_MAP_MAX_FPS, DEVICES,
+                             DOMAIN)
+from .controllers.MqttConnect import MqttConnect
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    max_fps = config_entry.options.get(CONF_MAP_MAX_FPS, DEFAULT_MAP_MAX_FPS)
+    for device_id, device in hass.data[DOMAIN][DEVICES].items():
+        _LOGGER.info("Adding map image for %s", device_id)
+        async_add_entities([RoboVacMapImage(device, hass, max_fps)])
+
+
+class RoboVacMapImage(ImageEntity):
+    """Live map of a vacuum.
+
+    The PNG is only encoded when the image is fetched and the map changed since
+    the last encode. While cleaning, re-encoding is limited to `max_fps`; while
+    docked at most one frame is encoded until the vacuum leaves the dock.
+    """
+
+    _attr_content_type = "image/png"
+
+    def __init__(self, item: MqttConnect, hass: HomeAssistant, max_fps: float) -> None:
+        super().__init__(hass)
+        self.vacuum = item
+        self._attr_name = "Map"
+        self._attr_unique_id = item.device_id + "_map"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, item.device_id)},
+            name=item.device_model_desc,
+            manufacturer="Eufy",
+            model=item.device_model,
+        )
+        self._min_interval = 1 / max_fps if max_fps > 0 else 0
+        self._docked = False
+        self._docked_frame_done = False
+        self._image: bytes | None = None
+        self._image_key = None
+        self._last_encode = 0.0
+        self._published_key = None
+        # Captures must be rendered one at a time and in order
+        self._render_lock = asyncio.Lock()
+
+    async def async_added_to_hass(self) -> None:
+        # self.hass is only set once the entity is added, listen from then on
+        self.vacuum.add_listener(self._threadsafe_update)
+        self.async_on_remove(lambda: self.vacuum.remove_listener(self._threadsafe_update))
+
+    def _threadsafe_update(self) -> None:
+        self.hass.loop.call_soon_threadsafe(
+            lambda: self.hass.async_create_task(self.pushed_update_handler())
+        )
+
+    async def pushed_update_handler(self):
+        docked = await self.vacuum.get_work_status() == VacuumActivity.DOCKED
+        if docked != self._docked:
+            self._docked = docked
+            self._docked_frame_done = False
+        elif docked:
+            return
+
+        # Bumping image_last_updated makes frontends fetch the image again
+        key = self.vacuum.map_renderer.state_key()
+        if key != self._published_key and self.entity_id is not None:
+            self._published_key = key
+            self._attr_image_last_updated = dt_util.utcnow()
+            self.async_write_ha_state()
+
+    async def async_image(self) -> bytes | None:
+        if self._image is not None:
+            if self._docked and self._docked_frame_done:
+                return self._image
+            if not self._docked and time.monotonic() - self._last_encode < self._min_interval:
+                return self._image
+
+        renderer = self.vacuum.map_renderer
+        async with self._render_lock:
+            key = renderer.state_key()
+            if key != self._image_key:
+                # The map keeps changing on the loop: capture it here, composite and encode in the executor
+                state = renderer.capture()
+                self._image = await self.hass.async_add_executor_job(renderer.image, state)
+                self._image_key = key
+                self._last_encode = time.monotonic()
+        if self._docked:
+            self._docked_frame_done = True
+        return self._image
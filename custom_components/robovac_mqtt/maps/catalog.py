@@ -0,0 +1,107 @@
+from ..proto.cloud.p2pdata_pb2 import CompleteMap, MapInfo
+from ..proto.cloud.stream_pb2 import RoomParams
+from ..proto.cloud.universal_data_pb2 import UniversalDataResponse
+
+RoomTable = UniversalDataResponse.RoomTable
+
+
+class MapEntry:
+    """What is known about one saved map: its release, name and room names."""
+
+    def __init__(self, map_id: int, releases: int = 0, name: str = '') -> None:
+        self.map_id = map_id
+        self.releases = releases
+        self.name = name
+        # room id -> room name and case-folded name -> room id, for `rooms_releases`
+        self.rooms: dict[int, str] = {}
+        self.room_ids: dict[str, int] = {}
+        self.rooms_releases: int | None = None
+
+    def set_rooms(self, rooms: dict[int, str], releases: int | None) -> None:
+        self.rooms = rooms
+        self.room_ids = {name.casefold(): room_id for room_id, name in rooms.items() if name}
+        self.rooms_releases = releases
+
+    def room_id(self, name: str) -> int | None:
+        return self.room_ids.get(name.casefold())
+
+    def __repr__(self) -> str:
+        return f'MapEntry(map_id={self.map_id}, releases={self.releases}, name={self.name!r}, rooms={self.rooms})'
+
+
+class MapCatalog:
+    """Saved maps of one robot as reported by multi-map management responses and room tables.
+
+    Keeps track of which map is active so commands that need a map id do not
+    have to guess one.
+    """
+
+    def __init__(self) -> None:
+        self.maps: dict[int, MapEntry] = {}
+        self.active_map_id: int | None = None
+
+    def __len__(self) -> int:
+        return len(self.maps)
+
+    def get(self, map_id: int) -> MapEntry | None:
+        return self.maps.get(map_id)
+
+    def _entry(self, map_id: int) -> MapEntry:
+        entry = self.maps.get(map_id)
+        if entry is None:
+            entry = self.maps[map_id] = MapEntry(map_id)
+        return entry
+
+    def update(self, message: CompleteMap | MapInfo) -> MapEntry:
+        """Record a p2p.CompleteMap or p2p.MapInfo; room names are taken from CompleteMap.room_params."""
+        entry = self._entry(message.map_id)
+        if message.name:
+            entry.name = message.name
+        if isinstance(message, CompleteMap) and message.HasField('room_params'):
+            entry.set_rooms({room.id: room.name for room in message.room_params.rooms}, message.releases)
+        elif message.releases != entry.rooms_releases:
+            # Room names belong to a release, wait for the new ones
+            entry.set_rooms({}, None)
+        entry.releases = message.releases
+        return entry
+
+    def replace(self, messages: list[CompleteMap]) -> None:
+        """Replace the catalog with the complete list of saved maps."""
+        previous = self.maps
+        self.maps = {}
+        for message in messages:
+            if message.map_id in previous:
+                self.maps[message.map_id] = previous[message.map_id]
+            self.update(message)
+        if self.active_map_id not in self.maps:
+            self.active_map_id = None
+
+    def update_room_table(self, table: RoomTable, releases: int | None) -> MapEntry:
+        """Record a UniversalDataResponse.RoomTable of the given map release."""
+        entry = self._entry(table.map_id)
+        entry.set_rooms({room.id: room.name for room in table.data}, releases)
+        return entry
+
+    def update_room_params(self, params: RoomParams) -> MapEntry:
+        """Record the room names of a stream.RoomParams message."""
+        entry = self._entry(params.map_id)
+        entry.set_rooms({room.id: room.name for room in params.rooms}, params.releases)
+        return entry
+
+    def rename(self, map_id: int, name: str) -> None:
+        self._entry(map_id).name = name
+
+    def remove(self, map_id: int) -> None:
+        self.maps.pop(map_id, None)
+        if self.active_map_id == map_id:
+            self.active_map_id = None
+
+    def resolve(self, current_map_id: int | None = None) -> int | None:
+        """Map id to clean on: the map the robot reports, the last one loaded, or the only saved one."""
+        if current_map_id is not None:
+            return current_map_id
+        if self.active_map_id is not None:
+            return self.active_map_id
+        if len(self.maps) == 1:
+            return next(iter(self.maps))
+        return None
@@ -0,0 +1,158 @@
+from html import escape
+
+import numpy as np
+
+from .live_map import LiveMap
+from .lod import rdp
+from .rooms import RoomIndex
+from .transform import MapTransform
+
+# Edge midpoints of a marching squares cell, doubled so they stay integral:
+# top, right, bottom, left relative to the cell's top-left corner
+_EDGES = np.array([(1, 0), (2, 1), (1, 2), (0, 1)], dtype=np.intp)
+TOP, RIGHT, BOTTOM, LEFT = range(4)
+
+# Corner bits: top-left 8, top-right 4, bottom-right 2, bottom-left 1.
+# Saddles (5, 10) cut off each set corner, diagonal neighbours trace separate contours.
+_CASE_SEGMENTS = {
+    1: [(LEFT, BOTTOM)],
+    2: [(BOTTOM, RIGHT)],
+    3: [(LEFT, RIGHT)],
+    4: [(TOP, RIGHT)],
+    5: [(TOP, RIGHT), (LEFT, BOTTOM)],
+    6: [(TOP, BOTTOM)],
+    7: [(LEFT, TOP)],
+    8: [(LEFT, TOP)],
+    9: [(TOP, BOTTOM)],
+    10: [(LEFT, TOP), (BOTTOM, RIGHT)],
+    11: [(TOP, RIGHT)],
+    12: [(LEFT, RIGHT)],
+    13: [(BOTTOM, RIGHT)],
+    14: [(LEFT, BOTTOM)],
+}
+
+
+def _segments(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Marching squares segments of a zero-padded mask as doubled integer coordinates."""
+    m = mask.astype(np.uint8)
+    cases = (m[:-1, :-1] << 3) | (m[:-1, 1:] << 2) | (m[1:, 1:] << 1) | m[1:, :-1]
+    starts, ends = [], []
+    for case, pairs in _CASE_SEGMENTS.items():
+        rows, cols = np.nonzero(cases == case)
+        if not len(rows):
+            continue
+        corner = np.column_stack((cols, rows)) * 2
+        for a, b in pairs:
+            starts.append(corner + _EDGES[a])
+            ends.append(corner + _EDGES[b])
+    if not starts:
+        empty = np.empty((0, 2), dtype=np.intp)
+        return empty, empty
+    return np.concatenate(starts), np.concatenate(ends)
+
+
+def trace_contours(mask: np.ndarray) -> list[np.ndarray]:
+    """Closed contours of a boolean mask as (n, 2) float arrays of (x, y) pixel coordinates.
+
+    Vertices lie halfway between pixel centres, pixel (x, y) being centred on (x, y).
+    """
+    padded = np.pad(mask, 1)
+    starts, ends = _segments(padded)
+
+    neighbours: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    for a, b in zip(map(tuple, starts.tolist()), map(tuple, ends.tolist())):
+        neighbours.setdefault(a, []).append(b)
+        neighbours.setdefault(b, []).append(a)
+
+    contours = []
+    while neighbours:
+        first, nexts = next(iter(neighbours.items()))
+        loop = [first]
+        previous, current = first, nexts[0]
+        del neighbours[first]
+        while current != first:
+            loop.append(current)
+            candidates = neighbours.pop(current)
+            following = candidates[0] if candidates[0] != previous else candidates[1]
+            previous, current = current, following
+        # Undo the doubling and the one pixel padding
+        contours.append(np.array(loop, dtype=np.float64) / 2 - 1)
+    return contours
+
+
+def simplify_contour(contour: np.ndarray, tolerance: float) -> np.ndarray:
+    """RDP-simplify a closed contour, keeping it closed."""
+    if len(contour) <= 4:
+        return contour
+    closed = np.vstack((contour, contour[:1]))
+    return closed[rdp(closed, tolerance)][:-1]
+
+
+class RoomContours:
+    """Room polygons in world coordinates traced from the room label raster.
+
+    Polygons and the SVG floor plan are cached per outline release and map transform.
+    """
+
+    TOLERANCE = 1.0  # pixels
+
+    def __init__(self, room_index: RoomIndex, live_map: LiveMap | None = None) -> None:
+        self.room_index = room_index
+        self.live_map = live_map
+        self._key = None
+        self._polygons: dict[int, list[np.ndarray]] = {}
+        self._svg: dict[tuple, str] = {}
+
+    def _transform(self) -> MapTransform | None:
+        return self.room_index.transform(self.live_map.info if self.live_map is not None else None)
+
+    def polygons(self) -> dict[int, list[np.ndarray]]:
+        """Room id -> list of (n, 2) world coordinate polygons (outer boundaries and holes)."""
+        index = self.room_index
+        transform = self._transform()
+        if transform is None:
+            return {}
+        key = (index.map_id, index.releases, transform.key)
+        if key == self._key:
+            return self._polygons
+
+        polygons = {}
+        for room_id in index.room_ids:
+            x0, y0, x1, y1 = index.bounding_box(room_id)
+            mask = index.labels[y0:y1 + 1, x0:x1 + 1] == room_id
+            polygons[room_id] = [
+                transform.to_world_array(simplify_contour(contour, self.TOLERANCE) + (x0 + 0.5, y0 + 0.5))
+                for contour in trace_contours(mask)
+            ]
+        self._key = key
+        self._polygons = polygons
+        self._svg = {}
+        return polygons
+
+    def svg(self, names: dict[int, str] | None = None, colours: dict[int, str] | None = None) -> str:
+        """SVG floor plan in world units (m x 100), one even-odd filled path per room."""
+        polygons = self.polygons()
+        cache_key = (tuple(sorted((names or {}).items())), tuple(sorted((colours or {}).items())))
+        if cache_key in self._svg:
+            return self._svg[cache_key]
+
+        points = [p for room in polygons.values() for p in room]
+        if points:
+            stacked = np.vstack(points)
+            (min_x, min_y), (max_x, max_y) = stacked.min(axis=0), stacked.max(axis=0)
+        else:
+            min_x = min_y = max_x = max_y = 0
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{min_x:.0f} {min_y:.0f} '
+                 f'{max_x - min_x:.0f} {max_y - min_y:.0f}">']
+        for room_id, room in polygons.items():
+            d = ' '.join('M' + ' L'.join(f'{x:.0f},{y:.0f}' for x, y in polygon) + ' Z' for polygon in room)
+            fill = (colours or {}).get(room_id, '#cfd8e3')
+            parts.append(f'<path data-room-id="{room_id}" d="{d}" fill="{escape(fill)}" '
+                         f'fill-rule="evenodd" stroke="#555" stroke-width="2">')
+            if names and room_id in names:
+                parts.append(f'<title>{escape(names[room_id])}</title>')
+            parts.append('</path>')
+        parts.append('</svg>')
+        svg = ''.join(parts)
+        self._svg[cache_key] = svg
+        return svg
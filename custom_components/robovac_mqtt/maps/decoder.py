@@ -0,0 +1,83 @@
+import numpy as np
+
+from ..proto.cloud.p2pdata_pb2 import CompleteMap
+from ..proto.cloud.stream_pb2 import Map
+from .lz4_block import decompress, decompress_into
+
+# Cell values of the SLAM raster, see stream.Map.PixelValue
+UNKNOW = Map.UNKNOW
+OBSTACLE = Map.OBSTACLE
+FREE = Map.FREE
+CARPET = Map.CARPET
+
+PIXELS_PER_BYTE = 4
+_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+# Row b holds the four cells packed into byte value b, so unpacking is a single gather
+_UNPACK_LUT = (np.arange(256, dtype=np.uint8)[:, None] >> _SHIFTS) & 3
+
+
+def decompress_pixels(pixels: bytes, pixel_size: int, out: bytearray | None = None) -> bytes | memoryview:
+    """Return the raw pixel bytes; a `pixel_size` of 0 means the payload is not compressed.
+
+    When `out` is given it is used as the decompression buffer (grown if too small)
+    and a memoryview over the decompressed bytes is returned.
+    """
+    if not pixel_size:
+        return pixels
+    if out is None:
+        return decompress(pixels, pixel_size)
+    if len(out) < pixel_size:
+        out.extend(bytes(pixel_size - len(out)))
+    decompress_into(pixels, out, pixel_size)
+    return memoryview(out)[:pixel_size]
+
+
+def map_dimensions(message: Map | CompleteMap) -> tuple[int, int]:
+    """Return (width, height) in pixels for a stream.Map or p2p.CompleteMap."""
+    if isinstance(message, CompleteMap):
+        return message.map_width, message.map_height
+    return message.info.width, message.info.height
+
+
+def unpack_pixels(packed: bytes, width: int, height: int, out: np.ndarray | None = None) -> np.ndarray:
+    """Unpack 2-bit cells (four per byte, low bits first) into a (height, width) uint8 grid.
+
+    When `out` is given the cells are written into it in place and it is returned.
+    Cells not covered by `packed` are set to UNKNOW.
+    """
+    size = width * height
+    if out is None:
+        out = np.empty((height, width), dtype=np.uint8)
+    elif out.shape != (height, width) or out.dtype != np.uint8:
+        raise ValueError(f'Output grid must be uint8 of shape {(height, width)}, got {out.dtype} {out.shape}')
+
+    flat = out.reshape(-1)
+    data = np.frombuffer(packed, dtype=np.uint8)
+
+    # Whole bytes are gathered straight into the output, viewed as (n, 4)
+    full = min(len(data), size // PIXELS_PER_BYTE)
+    if full:
+        cells = flat[:full * PIXELS_PER_BYTE].reshape(full, PIXELS_PER_BYTE)
+        np.take(_UNPACK_LUT, data[:full], axis=0, out=cells)
+
+    filled = full * PIXELS_PER_BYTE
+    remainder = size - filled
+    if remainder and full < len(data):
+        tail = _UNPACK_LUT[data[full], :remainder]
+        flat[filled:filled + len(tail)] = tail
+        filled += len(tail)
+    if filled < size:
+        flat[filled:] = UNKNOW
+
+    return out
+
+
+def decode_map(message: Map | CompleteMap, out: np.ndarray | None = None) -> np.ndarray:
+    """Decode the SLAM raster of a stream.Map or p2p.CompleteMap into a (height, width) uint8 grid."""
+    width, height = map_dimensions(message)
+    if isinstance(message, CompleteMap):
+        pixels, pixel_size = message.map.pixels, message.map.pixel_size
+    else:
+        pixels, pixel_size = message.pixels, message.pixel_size
+
+    return unpack_pixels(decompress_pixels(pixels, pixel_size), width, height, out)
@@ -0,0 +1,141 @@
+import logging
+
+import numpy as np
+
+from ..proto.cloud.stream_pb2 import Map, MapInfo
+from .decoder import UNKNOW, decompress_pixels, unpack_pixels
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LiveMap:
+    """Live SLAM raster of one device, updated in place from stream.Map frames.
+
+    I-frames replace the whole raster, P-frames overwrite only the cells they carry
+    (anything but UNKNOW). Changed regions are collected in `dirty` as
+    (x0, y0, x1, y1) rectangles, aligned to TILE pixels and exclusive at the end.
+    """
+
+    TILE = 64
+
+    def __init__(self) -> None:
+        self.grid: np.ndarray | None = None
+        self.info: MapInfo | None = None
+        self.info_revision = 0
+        self.map_id = 0
+        self.releases = 0
+        self.index = 0
+        self.revision = 0
+        self.dirty: set[tuple[int, int, int, int]] = set()
+        self._frame: np.ndarray | None = None
+        self._changed: np.ndarray | None = None
+        self._differs: np.ndarray | None = None
+        self._raw = bytearray()
+
+    @property
+    def width(self) -> int:
+        return 0 if self.grid is None else self.grid.shape[1]
+
+    @property
+    def height(self) -> int:
+        return 0 if self.grid is None else self.grid.shape[0]
+
+    @property
+    def version(self) -> tuple[int, int, int, int]:
+        """(map_id, releases, index, revision); revision increases on every applied frame."""
+        return self.map_id, self.releases, self.index, self.revision
+
+    def apply(self, message: Map, frame: np.ndarray | None = None) -> bool:
+        """Apply a stream.Map frame, returning False if it was dropped.
+
+        `frame` is the frame's raster from decode() when it was decoded ahead
+        of time; otherwise it is decoded here.
+        """
+        if message.frame == Map.I:
+            return self._apply_full(message, frame)
+        return self._apply_incremental(message, frame)
+
+    def decode(self, message: Map) -> np.ndarray | None:
+        """Decompress and unpack the raster of a frame without applying it.
+
+        Only reads the map's dimensions, so it can run in an executor while
+        the map is not being changed. Returns None if there are no dimensions
+        to decode with; apply() drops those frames.
+        """
+        if message.frame == Map.I:
+            width, height = message.info.width, message.info.height
+        else:
+            width, height = self.width, self.height
+        if not width or not height:
+            return None
+        return unpack_pixels(decompress_pixels(message.pixels, message.pixel_size), width, height)
+
+    def pop_dirty(self) -> set[tuple[int, int, int, int]]:
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def _apply_full(self, message: Map, frame: np.ndarray | None) -> bool:
+        width, height = message.info.width, message.info.height
+        if not width or not height:
+            _LOGGER.warning('Dropping I-frame without map dimensions')
+            return False
+
+        # Decode into the scratch frame so a corrupt I-frame leaves the current map untouched
+        shape = (height, width)
+        if frame is None or frame.shape != shape:
+            frame = self._frame if self._frame is not None and self._frame.shape == shape else np.empty(shape, np.uint8)
+            unpack_pixels(decompress_pixels(message.pixels, message.pixel_size, self._raw), width, height, frame)
+
+        if self.grid is None or self.grid.shape != shape:
+            self.grid = frame
+            self._frame = np.empty_like(frame)
+            self._changed = np.empty(shape, dtype=bool)
+            self._differs = np.empty(shape, dtype=bool)
+        else:
+            self.grid, self._frame = frame, self.grid
+        self.info = message.info
+        self.info_revision += 1
+        self.map_id = message.id
+        self.releases = message.releases
+        self.index = message.index.value
+        self.revision += 1
+        self.dirty = {(0, 0, width, height)}
+        return True
+
+    def _apply_incremental(self, message: Map, frame: np.ndarray | None) -> bool:
+        if self.grid is None:
+            _LOGGER.debug('Dropping P-frame received before any I-frame')
+            return False
+        if (message.id, message.releases) != (self.map_id, self.releases):
+            _LOGGER.debug('Dropping P-frame for map %s/%s, current map is %s/%s',
+                          message.id, message.releases, self.map_id, self.releases)
+            return False
+        if message.HasField('info') and (message.info.width, message.info.height) != (self.width, self.height):
+            _LOGGER.debug('Dropping P-frame with mismatched dimensions, waiting for next I-frame')
+            return False
+
+        changed = self._changed
+        if frame is None or frame.shape != self.grid.shape:
+            frame = self._frame
+            unpack_pixels(decompress_pixels(message.pixels, message.pixel_size, self._raw), self.width, self.height, frame)
+        np.not_equal(frame, UNKNOW, out=changed)
+        np.not_equal(frame, self.grid, out=self._differs)
+        np.logical_and(changed, self._differs, out=changed)
+        np.copyto(self.grid, frame, where=changed)
+
+        if message.HasField('info'):
+            self.info = message.info
+            self.info_revision += 1
+        self.index = message.index.value
+        self.revision += 1
+        self._mark_dirty(changed)
+        return True
+
+    def _mark_dirty(self, changed: np.ndarray) -> None:
+        tile = self.TILE
+        height, width = changed.shape
+        tiles = np.logical_or.reduceat(changed, np.arange(0, height, tile), axis=0)
+        tiles = np.logical_or.reduceat(tiles, np.arange(0, width, tile), axis=1)
+        for ty, tx in zip(*np.nonzero(tiles)):
+            x0, y0 = int(tx) * tile, int(ty) * tile
+            self.dirty.add((x0, y0, min(x0 + tile, width), min(y0 + tile, height)))
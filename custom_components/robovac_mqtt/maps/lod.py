@@ -0,0 +1,124 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from .path import PATH_DTYPE, PathBuffer
+
+
+def radial_filter(xy: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices of points kept after dropping consecutive points in the same tolerance-sized cell.
+
+    The first and last points are always kept.
+    """
+    if len(xy) <= 2 or tolerance <= 0:
+        return np.arange(len(xy))
+    cells = np.floor_divide(xy, tolerance)
+    keep = np.empty(len(xy), dtype=bool)
+    keep[0] = True
+    np.any(cells[1:] != cells[:-1], axis=1, out=keep[1:])
+    keep[-1] = True
+    return np.flatnonzero(keep)
+
+
+def rdp(xy: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices of points kept by Ramer-Douglas-Peucker simplification of an (n, 2) polyline."""
+    n = len(xy)
+    if n <= 2:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = xy[first], xy[last]
+        chord = end - start
+        length = np.hypot(chord[0], chord[1])
+        inner = xy[first + 1:last] - start
+        if length:
+            distances = np.abs(inner[:, 0] * chord[1] - inner[:, 1] * chord[0]) / length
+        else:
+            distances = np.hypot(inner[:, 0], inner[:, 1])
+        farthest = int(distances.argmax())
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def simplify_points(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Simplify one break-free run of PATH_DTYPE points."""
+    if len(points) <= 2:
+        return points
+    xy = np.column_stack((points['x'], points['y'])).astype(np.float64)
+    prefiltered = radial_filter(xy, tolerance / 2)
+    kept = prefiltered[rdp(xy[prefiltered], tolerance)]
+    return points[kept]
+
+
+def split_segments(points: np.ndarray) -> list[np.ndarray]:
+    """Split PATH_DTYPE points into runs starting at each break flag."""
+    starts = np.flatnonzero(points['break'][1:]) + 1
+    return np.split(points, starts)
+
+
+class _LodState:
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.size = 0
+        self.tail_start = 0
+        self.completed: list[np.ndarray] = []
+        self.tail = np.empty(0, dtype=PATH_DTYPE)
+        self.result: np.ndarray | None = None
+
+
+class PathLevelOfDetail:
+    """Cached, incrementally updated path simplification per tolerance.
+
+    Completed segments (closed by a later break) are simplified once; when the
+    path grows only the trailing, still open segment is simplified again.
+    Tolerances are in path units, use `tolerance_for` to derive one from the
+    size of an output pixel.
+    """
+
+    MAX_TOLERANCES = 8
+
+    def __init__(self, path: PathBuffer) -> None:
+        self.path = path
+        self._states: OrderedDict[float, _LodState] = OrderedDict()
+
+    @staticmethod
+    def tolerance_for(pixel_size: float) -> float:
+        """Deviations under half an output pixel are invisible."""
+        return pixel_size / 2
+
+    def simplified(self, tolerance: float) -> np.ndarray:
+        """Simplified path as PATH_DTYPE points, segments still marked by break flags."""
+        generation, size = self.path.version
+        state = self._states.get(tolerance)
+        if state is None or state.generation != generation or state.size > size:
+            state = _LodState(generation)
+            self._states[tolerance] = state
+            while len(self._states) > self.MAX_TOLERANCES:
+                self._states.popitem(last=False)
+        self._states.move_to_end(tolerance)
+
+        if state.result is not None and state.size == size:
+            return state.result
+
+        segments = split_segments(self.path.array(state.tail_start)) if size > state.tail_start else []
+        for segment in segments[:-1]:
+            state.completed.append(simplify_points(segment, tolerance))
+            state.tail_start += len(segment)
+        state.tail = simplify_points(segments[-1], tolerance) if segments else state.tail
+        state.size = size
+
+        if len(state.completed) > 1:
+            # Keep the completed part as a single array so later concatenations stay cheap
+            state.completed = [np.concatenate(state.completed)]
+        state.result = np.concatenate(state.completed + [state.tail])
+        return state.result
@@ -0,0 +1,136 @@
+"""LZ4 block format decompression.
+
+The robot compresses map rasters and path blobs with raw LZ4 blocks (no frame
+header), so the decompressed length always comes from a sibling field such as
+``pixel_size`` or ``path_lz4len``.
+
+The bundled pure-Python decoder is always available; when the optional ``lz4``
+package is installed its C implementation is used instead.
+"""
+import logging
+from typing import Callable
+
+try:
+    import lz4.block as _lz4_block
+except ImportError:
+    _lz4_block = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _decompress_into_python(src: bytes, dst: memoryview) -> int:
+    src = memoryview(src).cast('B')
+    capacity = len(dst)
+    src_len = len(src)
+    i = 0
+    o = 0
+
+    while i < src_len:
+        token = src[i]
+        i += 1
+
+        literal_len = token >> 4
+        if literal_len == 15:
+            while True:
+                if i >= src_len:
+                    raise ValueError('Truncated LZ4 length extension')
+                b = src[i]
+                i += 1
+                literal_len += b
+                if b != 255:
+                    break
+        if literal_len:
+            if o + literal_len > capacity or i + literal_len > src_len:
+                raise ValueError('LZ4 literal run exceeds buffer bounds')
+            dst[o:o + literal_len] = src[i:i + literal_len]
+            i += literal_len
+            o += literal_len
+
+        # The last sequence only carries literals
+        if i >= src_len:
+            break
+
+        if i + 1 >= src_len:
+            raise ValueError('Truncated LZ4 match offset')
+        offset = src[i] | (src[i + 1] << 8)
+        i += 2
+        if offset == 0 or offset > o:
+            raise ValueError(f'Invalid LZ4 match offset {offset} at output position {o}')
+
+        match_len = token & 0x0F
+        if match_len == 15:
+            while True:
+                if i >= src_len:
+                    raise ValueError('Truncated LZ4 length extension')
+                b = src[i]
+                i += 1
+                match_len += b
+                if b != 255:
+                    break
+        match_len += 4
+        if o + match_len > capacity:
+            raise ValueError('LZ4 match exceeds output buffer')
+
+        start = o - offset
+        if offset >= match_len:
+            dst[o:o + match_len] = dst[start:start + match_len]
+        else:
+            # Overlapping copy: repeat the last `offset` bytes
+            pattern = dst[start:o].tobytes()
+            repeats, remainder = divmod(match_len, offset)
+            dst[o:o + match_len] = pattern * repeats + pattern[:remainder]
+        o += match_len
+
+    return o
+
+
+def _decompress_lz4(src: bytes, uncompressed_size: int) -> bytes:
+    try:
+        return _lz4_block.decompress(src, uncompressed_size=uncompressed_size)
+    except _lz4_block.LZ4BlockError as error:
+        raise ValueError(f'Malformed LZ4 block: {error}') from error
+
+
+def _decompress_into_lz4(src: bytes, dst: memoryview) -> int:
+    data = _decompress_lz4(src, len(dst))
+    dst[:len(data)] = data
+    return len(data)
+
+
+BACKENDS: dict[str, Callable[[bytes, memoryview], int]] = {'python': _decompress_into_python}
+if _lz4_block is not None:
+    BACKENDS['lz4'] = _decompress_into_lz4
+
+BACKEND = 'lz4' if 'lz4' in BACKENDS else 'python'
+_LOGGER.debug('Using %s LZ4 backend', BACKEND)
+
+
+def decompress_into(src: bytes, dst: bytearray | memoryview, uncompressed_size: int | None = None) -> int:
+    """Decompress an LZ4 block into the caller-supplied buffer `dst`.
+
+    `uncompressed_size` defaults to len(dst); the block must decompress to exactly
+    that many bytes. Returns the number of bytes written; malformed blocks raise
+    ValueError with either backend.
+    """
+    out = memoryview(dst).cast('B')
+    if uncompressed_size is None:
+        uncompressed_size = len(out)
+    elif uncompressed_size > len(out):
+        raise ValueError(f'Output buffer holds {len(out)} bytes, {uncompressed_size} required')
+
+    written = BACKENDS[BACKEND](src, out[:uncompressed_size])
+    if written != uncompressed_size:
+        raise ValueError(f'LZ4 block decompressed to {written} bytes, expected {uncompressed_size}')
+    return written
+
+
+def decompress(src: bytes, uncompressed_size: int) -> bytes:
+    """Decompress a single LZ4 block of known uncompressed size."""
+    if BACKEND == 'lz4':
+        data = _decompress_lz4(src, uncompressed_size)
+        if len(data) != uncompressed_size:
+            raise ValueError(f'LZ4 block decompressed to {len(data)} bytes, expected {uncompressed_size}')
+        return data
+    dst = bytearray(uncompressed_size)
+    decompress_into(src, dst)
+    return bytes(dst)
@@ -0,0 +1,225 @@
+import math
+
+import numpy as np
+
+from ..proto.cloud.stream_pb2 import ObstacleInfo
+from .rooms import MAX_ROOMS, NO_ROOM, RoomIndex
+from .transform import MapTransform
+
+Obstacle = ObstacleInfo.Obstacle
+
+
+def decode_bitmap(bitmap: Obstacle.Bitmap) -> np.ndarray:
+    """Unpack a 1-bit obstacle mask (most significant bit first, rows back to back) into a (height, width) bool array."""
+    size = bitmap.width * bitmap.height
+    data = np.frombuffer(bitmap.data, dtype=np.uint8)
+    if bitmap.data_len:
+        data = data[:bitmap.data_len]
+    # Missing trailing bits are padded with zeros
+    bits = np.unpackbits(data, count=size)
+    return bits.view(bool).reshape(bitmap.height, bitmap.width)
+
+
+def bitmap_pixels(bitmap: Obstacle.Bitmap, transform: MapTransform) -> np.ndarray:
+    """(n, 2) integer pixel coordinates of the set cells; the bitmap's top-left cell sits on `ref_point`."""
+    x0, y0 = (math.floor(v) for v in transform.to_pixel(bitmap.ref_point.x, bitmap.ref_point.y))
+    rows, cols = np.nonzero(decode_bitmap(bitmap))
+    return np.column_stack((cols + x0, rows + y0))
+
+
+class ObstacleEntry:
+    """One obstacle with its representative points in world coordinates (m x 100)."""
+
+    def __init__(self, obstacle: Obstacle, points: np.ndarray, pixels: np.ndarray | None = None) -> None:
+        self.obstacle = obstacle
+        self.object_type = obstacle.object_type
+        self.show_type = obstacle.show_type
+        # Vertices / position for shapes, cell centres for bitmaps
+        self.points = points
+        # Set cells of a bitmap obstacle in map pixels
+        self.pixels = pixels
+        self.bounds = (*points.min(axis=0), *points.max(axis=0)) if len(points) else None
+        self.rooms: frozenset[int] | None = None
+
+    def distance(self, x: float, y: float) -> float:
+        """Distance from a world point to the nearest representative point."""
+        if len(self.points) == 1:
+            px, py = self.points[0].tolist()
+            return math.hypot(px - x, py - y)
+        d = self.points - (x, y)
+        return float(np.sqrt((d * d).sum(axis=1).min()))
+
+
+class ObstacleIndex:
+    """Obstacles of the current map with a grid-bucket spatial index.
+
+    Each ObstacleInfo frame is diffed against the previous one so only added
+    and removed obstacles touch the index. Buckets are CELL (m x 100) wide
+    squares, so radius queries only look at the obstacles in the buckets the
+    query circle overlaps. Room membership is derived from the room label
+    raster and recomputed only when the outline release changes.
+    """
+
+    CELL = 50
+
+    def __init__(self, room_index: RoomIndex | None = None) -> None:
+        self.room_index = room_index
+        self.map_id: int | None = None
+        self.releases: int | None = None
+        self.version = 0
+        self.entries: dict[bytes, ObstacleEntry] = {}
+        self._buckets: dict[tuple[int, int], set[bytes]] = {}
+        self._transform_key = None
+        # room id -> obstacle keys, kept up to date incrementally once built
+        self._rooms: dict[int, set[bytes]] | None = None
+        self._rooms_key = None
+        self._rooms_transform: MapTransform | None = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def update(self, info: ObstacleInfo, transform: MapTransform | None = None) -> bool:
+        """Apply an ObstacleInfo frame, returning True if any obstacle was added or removed.
+
+        `transform` is needed to place bitmap obstacles; without it only their
+        reference point is indexed.
+        """
+        transform_key = transform.key if transform is not None else None
+        if (info.map_id, info.releases) != (self.map_id, self.releases) or transform_key != self._transform_key:
+            self.clear()
+            self.map_id, self.releases = info.map_id, info.releases
+            self._transform_key = transform_key
+
+        current = {obstacle.SerializeToString(deterministic=True): obstacle for obstacle in info.obstacles}
+        removed = [key for key in self.entries if key not in current]
+        added = [key for key in current if key not in self.entries]
+        for key in removed:
+            self._remove(key)
+        for key in added:
+            self._add(key, current[key], transform)
+        if removed or added:
+            self.version += 1
+            return True
+        return False
+
+    def clear(self) -> None:
+        if self.entries:
+            self.version += 1
+        self.entries = {}
+        self._buckets = {}
+        self._rooms = None
+
+    def _cells(self, points: np.ndarray) -> set[tuple[int, int]]:
+        return set(map(tuple, np.floor_divide(points, self.CELL).astype(np.int64).tolist()))
+
+    def _bucket_range(self, x0: float, y0: float, x1: float, y1: float):
+        cell = self.CELL
+        for bx in range(math.floor(x0 / cell), math.floor(x1 / cell) + 1):
+            for by in range(math.floor(y0 / cell), math.floor(y1 / cell) + 1):
+                yield bx, by
+
+    def _add(self, key: bytes, obstacle: Obstacle, transform: MapTransform | None) -> None:
+        pixels = None
+        if obstacle.show_type == Obstacle.BITMAP and transform is not None:
+            pixels = bitmap_pixels(obstacle.bitmap, transform)
+            points = transform.to_world_array(pixels + 0.5)
+        elif obstacle.show_type == Obstacle.BITMAP:
+            points = np.array([(obstacle.bitmap.ref_point.x, obstacle.bitmap.ref_point.y)], dtype=np.float64)
+        else:
+            points = np.array([(p.x, p.y) for p in obstacle.show_points], dtype=np.float64).reshape(-1, 2)
+        entry = ObstacleEntry(obstacle, points, pixels)
+        self.entries[key] = entry
+        if entry.bounds is None:
+            return
+        if self._rooms is not None:
+            self._assign_rooms(key, entry)
+        # Bucket every cell a point falls in; large shapes only cover the buckets of their points
+        for cell in self._cells(points):
+            self._buckets.setdefault(cell, set()).add(key)
+
+    def _remove(self, key: bytes) -> None:
+        entry = self.entries.pop(key)
+        if entry.bounds is None:
+            return
+        if self._rooms is not None:
+            for room in entry.rooms or ():
+                self._rooms[room].discard(key)
+        for cell in self._cells(entry.points):
+            bucket = self._buckets.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[cell]
+
+    def within(self, x: float, y: float, radius: float) -> list[ObstacleEntry]:
+        """Obstacles with a representative point within `radius` of the world point (x, y), nearest first."""
+        candidates = set()
+        for cell in self._bucket_range(x - radius, y - radius, x + radius, y + radius):
+            bucket = self._buckets.get(cell)
+            if bucket:
+                candidates |= bucket
+        found = []
+        for key in candidates:
+            entry = self.entries[key]
+            distance = entry.distance(x, y)
+            if distance <= radius:
+                found.append((distance, entry))
+        found.sort(key=lambda item: item[0])
+        return [entry for _, entry in found]
+
+    def in_room(self, room_id: int, transform: MapTransform | None = None) -> list[ObstacleEntry]:
+        """Obstacles with at least one representative point inside a room."""
+        rooms = self._room_members(transform)
+        return [self.entries[key] for key in rooms.get(room_id, ())]
+
+    def _room_members(self, transform: MapTransform | None) -> dict[int, set[bytes]]:
+        index = self.room_index
+        if index is None or index.labels is None:
+            return {}
+        transform = transform or index.transform()
+        if transform is None:
+            return {}
+        key = (index.map_id, index.releases, transform.key)
+        if self._rooms is not None and key == self._rooms_key:
+            return self._rooms
+
+        self._rooms = {}
+        self._rooms_key = key
+        self._rooms_transform = transform
+        entries = [(entry_key, entry) for entry_key, entry in self.entries.items() if entry.bounds is not None]
+        if not entries:
+            return self._rooms
+
+        # Look up the labels of all obstacles at once, then group them per obstacle
+        points = np.concatenate([entry.points for _, entry in entries])
+        owners = np.repeat(np.arange(len(entries)), [len(entry.points) for _, entry in entries])
+        labels = self._labels_at(np.floor(transform.to_pixel_array(points)).astype(np.int64))
+        room = labels < MAX_ROOMS
+        pairs = np.unique(owners[room] * MAX_ROOMS + labels[room])
+        for entry_key, entry in entries:
+            entry.rooms = frozenset()
+        for owner, room_id in zip((pairs // MAX_ROOMS).tolist(), (pairs % MAX_ROOMS).tolist()):
+            entry_key, entry = entries[owner]
+            entry.rooms |= {room_id}
+            self._rooms.setdefault(room_id, set()).add(entry_key)
+        return self._rooms
+
+    def _entry_pixels(self, entry: ObstacleEntry) -> np.ndarray:
+        if entry.pixels is not None:
+            return entry.pixels
+        return np.floor(self._rooms_transform.to_pixel_array(entry.points)).astype(np.int64)
+
+    def _labels_at(self, pixels: np.ndarray) -> np.ndarray:
+        """Room labels under (n, 2) pixels, NO_ROOM outside the raster."""
+        labels = self.room_index.labels
+        height, width = labels.shape
+        inside = (pixels[:, 0] >= 0) & (pixels[:, 1] >= 0) & (pixels[:, 0] < width) & (pixels[:, 1] < height)
+        found = np.full(len(pixels), NO_ROOM, dtype=np.uint8)
+        found[inside] = labels[pixels[inside, 1], pixels[inside, 0]]
+        return found
+
+    def _assign_rooms(self, key: bytes, entry: ObstacleEntry) -> None:
+        labels = self._labels_at(self._entry_pixels(entry))
+        entry.rooms = frozenset(np.unique(labels[labels < MAX_ROOMS]).tolist())
+        for room in entry.rooms:
+            self._rooms.setdefault(room, set()).add(key)
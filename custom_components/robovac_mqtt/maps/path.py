@@ -0,0 +1,112 @@
+from typing import Iterable
+
+import numpy as np
+
+from ..proto.cloud.p2pdata_pb2 import CompletePath
+from ..proto.cloud.stream_pb2 import PathPoint
+from .lz4_block import decompress
+
+PATH_DTYPE = np.dtype([('x', np.int16), ('y', np.int16), ('type', np.uint8), ('break', np.bool_)])
+
+# p2p.CompletePath records: big-endian x and y, then one flags byte
+_COMPLETE_PATH_RECORD = np.dtype([('x', '>i2'), ('y', '>i2'), ('flags', np.uint8)])
+
+TYPE_MASK = 0x0F
+BREAK_BIT = 0x10
+
+
+def _from_fields(x: np.ndarray, y: np.ndarray, flags: np.ndarray) -> np.ndarray:
+    out = np.empty(len(x), dtype=PATH_DTYPE)
+    out['x'] = x
+    out['y'] = y
+    out['type'] = flags & TYPE_MASK
+    out['break'] = (flags & BREAK_BIT) != 0
+    return out
+
+
+def decode_path_points(points: Iterable[PathPoint]) -> np.ndarray:
+    """Decode stream.PathPoint messages (x/y packed in `xy`, flags in `flags`)."""
+    points = list(points)
+    xy = np.fromiter((p.xy for p in points), dtype=np.uint32, count=len(points))
+    flags = np.fromiter((p.flags for p in points), dtype=np.uint32, count=len(points))
+    return _from_fields((xy & 0xFFFF).astype(np.uint16).view(np.int16),
+                        (xy >> 16).astype(np.uint16).view(np.int16),
+                        flags.astype(np.uint8))
+
+
+def decode_complete_path(message: CompletePath) -> np.ndarray:
+    """Decode the LZ4 compressed 5-byte records of a p2p.CompletePath."""
+    raw = decompress(message.path, message.path_lz4len) if message.path_lz4len else message.path
+    records = np.frombuffer(raw, dtype=_COMPLETE_PATH_RECORD, count=len(raw) // _COMPLETE_PATH_RECORD.itemsize)
+    return _from_fields(records['x'], records['y'], records['flags'])
+
+
+class PathBuffer:
+    """Append-only path storage made of fixed-size PATH_DTYPE chunks.
+
+    Appending never copies existing points. `generation` changes when the path is
+    cleared, so (generation, len) identifies a path state and a longer length
+    within the same generation means points were only appended.
+    """
+
+    CHUNK = 4096
+
+    def __init__(self) -> None:
+        self._chunks: list[np.ndarray] = []
+        self._size = 0
+        self.generation = 0
+        self._array: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def version(self) -> tuple[int, int]:
+        return self.generation, self._size
+
+    def clear(self) -> None:
+        self._chunks = []
+        self._size = 0
+        self._array = None
+        self.generation += 1
+
+    def append(self, points: np.ndarray) -> None:
+        """Append already decoded PATH_DTYPE points."""
+        start = 0
+        while start < len(points):
+            offset = self._size % self.CHUNK
+            if offset == 0:
+                self._chunks.append(np.empty(self.CHUNK, dtype=PATH_DTYPE))
+            count = min(self.CHUNK - offset, len(points) - start)
+            self._chunks[-1][offset:offset + count] = points[start:start + count]
+            self._size += count
+            start += count
+        if len(points):
+            self._array = None
+
+    def extend_points(self, points: Iterable[PathPoint]) -> None:
+        self.append(decode_path_points(points))
+
+    def load_complete_path(self, message: CompletePath) -> None:
+        """Replace the buffer with the full path of a p2p.CompletePath."""
+        self.clear()
+        self.append(decode_complete_path(message))
+
+    def array(self, start: int = 0) -> np.ndarray:
+        """Contiguous copy of the points from `start` on; the full array is cached."""
+        if start == 0 and self._array is not None:
+            return self._array
+
+        first, offset = divmod(start, self.CHUNK)
+        parts = self._chunks[first:]
+        if parts and start < self._size:
+            tail = self._size % self.CHUNK
+            if tail:
+                parts[-1] = parts[-1][:tail]
+            parts[0] = parts[0][offset:]
+        else:
+            parts = []
+        result = np.concatenate(parts) if parts else np.empty(0, dtype=PATH_DTYPE)
+        if start == 0:
+            self._array = result
+        return result
@@ -0,0 +1,29 @@
+import struct
+import zlib
+
+import numpy as np
+
+_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def encode_png(rgba: np.ndarray, level: int = 6) -> bytes:
+    """Encode a (height, width, 4) uint8 array as an 8-bit RGBA PNG."""
+    height, width, channels = rgba.shape
+    if channels != 4 or rgba.dtype != np.uint8:
+        raise ValueError(f'Expected (height, width, 4) uint8 array, got {rgba.dtype} {rgba.shape}')
+
+    # Every scanline starts with filter type 0 (None)
+    scanlines = np.zeros((height, 1 + width * 4), dtype=np.uint8)
+    scanlines[:, 1:] = rgba.reshape(height, width * 4)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b''.join((
+        _SIGNATURE,
+        _chunk(b'IHDR', header),
+        _chunk(b'IDAT', zlib.compress(scanlines.tobytes(), level)),
+        _chunk(b'IEND', b''),
+    ))
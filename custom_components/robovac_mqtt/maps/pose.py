@@ -0,0 +1,78 @@
+import logging
+from typing import Callable
+
+from ..proto.cloud.stream_pb2 import DynamicData
+from .live_map import LiveMap
+from .rooms import MAX_ROOMS, RoomIndex
+from .transform import MapTransform
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RoomTracker:
+    """Resolves the robot pose from stream.DynamicData to the room it is in.
+
+    The transform and label raster are cached and only refreshed when the room
+    index is rebuilt or the map info changes, so each pose update is a couple of
+    multiplications and one raster lookup. Listeners are called with
+    (previous_room, current_room) only when the room actually changes.
+    """
+
+    def __init__(self, room_index: RoomIndex, live_map: LiveMap | None = None) -> None:
+        self.room_index = room_index
+        self.live_map = live_map
+        self.current_room: int | None = None
+        self._listeners: list[Callable[[int | None, int | None], None]] = []
+        self._labels = None
+        self._transform: MapTransform | None = None
+        self._source: tuple | None = None
+        self._info = None
+
+    def add_listener(self, listener: Callable[[int | None, int | None], None]) -> None:
+        self._listeners.append(listener)
+
+    def update(self, data: DynamicData) -> bool:
+        """Feed a pose update, returning True if the current room changed."""
+        return self.update_position(data.cur_pose.x, data.cur_pose.y)
+
+    def update_position(self, x: int, y: int) -> bool:
+        room = self.room_at(x, y)
+        if room == self.current_room:
+            return False
+
+        previous, self.current_room = self.current_room, room
+        for listener in self._listeners:
+            try:
+                listener(previous, room)
+            except Exception as error:
+                _LOGGER.error(error)
+        return True
+
+    def room_at(self, x: int, y: int) -> int | None:
+        """Room id at world position (x, y), or None outside any room."""
+        self._refresh()
+        labels = self._labels
+        if labels is None:
+            return None
+
+        px, py = self._transform.to_pixel(x, y)
+        col, row = int(px), int(py)
+        height, width = labels.shape
+        if px < 0 or py < 0 or col >= width or row >= height:
+            return None
+        label = labels.item(row, col)
+        return label if label < MAX_ROOMS else None
+
+    def _refresh(self) -> None:
+        index = self.room_index
+        info = self.live_map.info if self.live_map is not None else None
+        source = (index.map_id, index.releases)
+        if source == self._source and info is self._info:
+            return
+
+        self._source = source
+        self._info = info
+        self._transform = index.transform(info)
+        self._labels = index.labels if self._transform is not None else None
+        if index.labels is not None and self._transform is None:
+            _LOGGER.debug('No resolution known for room outline %s/%s', index.map_id, index.releases)
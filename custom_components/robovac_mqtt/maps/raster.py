@@ -0,0 +1,79 @@
+"""Vectorized rasterization of map primitives into flat pixel indices.
+
+All functions take pixel coordinates as (x, y) and a raster shape of
+(height, width); pixels outside the raster are dropped.
+"""
+import numpy as np
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def _flat(xs: np.ndarray, ys: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    height, width = shape
+    inside = (xs >= 0) & (ys >= 0) & (xs < width) & (ys < height)
+    return ys[inside].astype(np.intp) * width + xs[inside].astype(np.intp)
+
+
+def pixel_indices(pixels: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Flat indices of an (n, 2) array of integer pixel coordinates."""
+    pixels = np.asarray(pixels).reshape(-1, 2)
+    return _flat(pixels[:, 0], pixels[:, 1], shape)
+
+
+def segment_indices(starts: np.ndarray, ends: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Flat indices of the pixels on each line segment starts[i] -> ends[i]."""
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    if not len(starts):
+        return _EMPTY
+
+    delta = ends - starts
+    steps = np.ceil(np.abs(delta).max(axis=1)).astype(np.intp) + 1
+    owner = np.repeat(np.arange(len(starts)), steps)
+    offsets = np.arange(steps.sum()) - np.repeat(np.cumsum(steps) - steps, steps)
+    t = offsets / np.maximum(steps - 1, 1)[owner]
+    points = starts[owner] + delta[owner] * t[:, None]
+    points = np.rint(points).astype(np.intp)
+    return np.unique(_flat(points[:, 0], points[:, 1], shape))
+
+
+def polyline_indices(points: np.ndarray, shape: tuple[int, int], breaks: np.ndarray | None = None) -> np.ndarray:
+    """Flat indices of a polyline; no segment is drawn into a point whose `breaks` flag is set."""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 2:
+        return segment_indices(points, points, shape)
+    connect = np.ones(len(points) - 1, dtype=bool) if breaks is None else ~np.asarray(breaks[1:], dtype=bool)
+    return segment_indices(points[:-1][connect], points[1:][connect], shape)
+
+
+def polygon_indices(polygon: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Flat indices of the pixels whose centre lies inside a simple polygon (even-odd rule)."""
+    polygon = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    if len(polygon) < 3:
+        return _EMPTY
+    height, width = shape
+    x0, y0 = np.maximum(np.floor(polygon.min(axis=0)).astype(int), 0)
+    x1 = min(int(np.ceil(polygon[:, 0].max())), width - 1)
+    y1 = min(int(np.ceil(polygon[:, 1].max())), height - 1)
+    if x0 > x1 or y0 > y1:
+        return _EMPTY
+
+    ys, xs = np.mgrid[y0:y1 + 1, x0:x1 + 1]
+    px, py = xs + 0.5, ys + 0.5
+    inside = np.zeros(xs.shape, dtype=bool)
+    for (ax, ay), (bx, by) in zip(polygon, np.roll(polygon, -1, axis=0)):
+        if ay == by:
+            continue
+        crosses = (ay > py) != (by > py)
+        x_cross = ax + (py - ay) * (bx - ax) / (by - ay)
+        inside ^= crosses & (px < x_cross)
+    return ys[inside].astype(np.intp) * width + xs[inside].astype(np.intp)
+
+
+def disc_indices(center: tuple[float, float], radius: float, shape: tuple[int, int]) -> np.ndarray:
+    """Flat indices of a filled disc."""
+    cx, cy = center
+    r = int(np.ceil(radius))
+    ys, xs = np.mgrid[int(cy) - r:int(cy) + r + 1, int(cx) - r:int(cx) + r + 1]
+    inside = (xs - cx) ** 2 + (ys - cy) ** 2 <= radius ** 2
+    return _flat(xs[inside], ys[inside], shape)
@@ -0,0 +1,309 @@
+import math
+
+import numpy as np
+
+from ..proto.cloud.common_pb2 import Pose
+from ..proto.cloud.stream_pb2 import ObstacleInfo, RestrictedZone
+from .decoder import CARPET, FREE, OBSTACLE, UNKNOW
+from .live_map import LiveMap
+from .lod import PathLevelOfDetail
+from .path import PathBuffer
+from .png import encode_png
+from .obstacles import bitmap_pixels
+from .raster import (disc_indices, pixel_indices, polygon_indices,
+                     polyline_indices, segment_indices)
+from .rooms import MAX_ROOMS, RoomIndex
+from .transform import MapTransform
+
+CELL_COLOURS = np.zeros((4, 4), dtype=np.uint8)
+CELL_COLOURS[UNKNOW] = (0, 0, 0, 0)
+CELL_COLOURS[OBSTACLE] = (80, 80, 80, 255)
+CELL_COLOURS[FREE] = (200, 215, 230, 255)
+CELL_COLOURS[CARPET] = (170, 160, 150, 255)
+
+ROOM_COLOURS = np.array([
+    (171, 205, 239, 255), (255, 204, 153, 255), (204, 230, 179, 255), (230, 190, 230, 255),
+    (255, 236, 153, 255), (179, 222, 222, 255), (240, 180, 180, 255), (200, 200, 240, 255),
+], dtype=np.uint8)[np.arange(MAX_ROOMS) % 8]
+
+WALL_COLOUR = (220, 40, 40, 255)
+FORBIDDEN_COLOUR = (220, 40, 40, 80)
+NO_MOP_COLOUR = (40, 90, 220, 80)
+NO_MOP_OUTLINE_COLOUR = (40, 90, 220, 255)
+OBSTACLE_COLOUR = (240, 140, 0, 255)
+PATH_COLOUR = (255, 255, 255, 200)
+DOCK_COLOUR = (40, 170, 70, 255)
+ROBOT_COLOUR = (30, 30, 30, 255)
+
+ROBOT_RADIUS = 4
+DOCK_RADIUS = 3
+OBSTACLE_RADIUS = 2
+
+Layer = list[tuple[np.ndarray, tuple[int, int, int, int]]]
+
+
+def _blend(flat: np.ndarray, indices: np.ndarray, colour: tuple[int, int, int, int]) -> None:
+    alpha = colour[3]
+    if alpha == 255:
+        flat[indices] = colour
+        return
+    under = flat[indices].astype(np.uint16)
+    over = np.array(colour, dtype=np.uint16)
+    blended = (under * (255 - alpha) + over * alpha) // 255
+    blended[:, 3] = np.maximum(under[:, 3], alpha)
+    flat[indices] = blended
+
+
+class RenderState:
+    """Everything one render reads from the live map and its overlays.
+
+    Taken by MapRenderer.capture() on the thread that updates the map: the
+    grid is copied, the dirty rectangles are popped, and the overlays are
+    messages that are replaced rather than changed in place. A render can then
+    run in an executor while the map keeps changing.
+    """
+
+    __slots__ = ('key', 'grid', 'dirty', 'labels', 'base_key', 'transform', 'zones', 'obstacles', 'path',
+                 'docks', 'pose')
+
+    def __init__(self, key: tuple) -> None:
+        self.key = key
+        self.grid: np.ndarray | None = None
+        self.dirty: set[tuple[int, int, int, int]] = set()
+        self.labels: np.ndarray | None = None
+        self.base_key = None
+        self.transform: MapTransform | None = None
+        self.zones: RestrictedZone | None = None
+        self.obstacles: ObstacleInfo | None = None
+        # Simplified path points, None when the cached path layer is still current
+        self.path: np.ndarray | None = None
+        self.docks = ()
+        self.pose: Pose | None = None
+
+
+class MapRenderer:
+    """Composites the live map and its overlays into an RGBA image.
+
+    Each layer is rasterized once per version of its source and cached; overlays
+    are kept as sparse pixel index lists so compositing only touches the pixels
+    they cover. The base layer is recoloured only inside the dirty rectangles
+    reported by the LiveMap, whose dirty set this renderer consumes.
+    Composited frames and PNG bytes are memoized by the tuple of layer versions.
+
+    To render off the event loop, take a capture() on the loop and pass it to
+    image() / render() in the executor; captures must be rendered one at a
+    time and in order.
+    """
+
+    LAYERS = ('zones', 'obstacles', 'path', 'docks', 'robot')
+    # Map images are mostly flat colour, fast zlib levels compress them nearly as well
+    PNG_COMPRESSION = 1
+
+    def __init__(self, live_map: LiveMap, room_index: RoomIndex, path: PathBuffer) -> None:
+        self.live_map = live_map
+        self.room_index = room_index
+        self.path = path
+        self.lod = PathLevelOfDetail(path)
+        self.restricted_zones: RestrictedZone | None = None
+        self.obstacles: ObstacleInfo | None = None
+        self.pose: Pose | None = None
+        self._zones_version = 0
+        self._obstacles_version = 0
+        self._pose_version = 0
+
+        self._base: np.ndarray | None = None
+        self._base_key = None
+        self._layers: dict[str, tuple[object, Layer]] = {}
+        self._frame: np.ndarray | None = None
+        self._frame_key = None
+        self._png: bytes | None = None
+        self._png_key = None
+
+    def set_restricted_zones(self, zones: RestrictedZone) -> None:
+        self.restricted_zones = zones
+        self._zones_version += 1
+
+    def set_obstacles(self, obstacles: ObstacleInfo) -> None:
+        self.obstacles = obstacles
+        self._obstacles_version += 1
+
+    def set_pose(self, pose: Pose) -> None:
+        if self.pose is not None and (pose.x, pose.y, pose.theta) == (self.pose.x, self.pose.y, self.pose.theta):
+            return
+        self.pose = Pose(x=pose.x, y=pose.y, theta=pose.theta)
+        self._pose_version += 1
+
+    def _transform(self) -> MapTransform | None:
+        info = self.live_map.info
+        if info is None or not info.resolution:
+            return None
+        return MapTransform.from_info(info)
+
+    def state_key(self) -> tuple:
+        """Versions of all layers; equal keys mean an identical image. Cheap to compute."""
+        transform = self._transform()
+        world = transform.key if transform is not None else None
+        return (
+            (self.live_map.map_id, self.live_map.releases, self.live_map.revision,
+             self.room_index.map_id, self.room_index.releases),
+            (world, self._zones_version),
+            (world, self._obstacles_version),
+            (world, self.path.version),
+            (world, self.live_map.info_revision),
+            (world, self._pose_version),
+        )
+
+    def capture(self) -> RenderState:
+        """Snapshot of what the next render needs; cheap when nothing changed since the last one."""
+        state = RenderState(self.state_key())
+        if state.key in (self._frame_key, self._png_key):
+            return state
+
+        grid = self.live_map.grid
+        if grid is not None:
+            state.grid = grid.copy()
+            state.dirty = self.live_map.pop_dirty()
+            labels = self.room_index.labels
+            state.labels = labels if labels is not None and labels.shape == grid.shape else None
+            state.base_key = (self.live_map.map_id, self.live_map.releases, grid.shape,
+                              self.room_index.map_id, self.room_index.releases)
+        state.transform = transform = self._transform()
+        state.zones = self.restricted_zones
+        state.obstacles = self.obstacles
+        state.pose = self.pose
+        if transform is not None:
+            state.docks = tuple(self.live_map.info.docks_v2)
+            cached = self._layers.get('path')
+            if cached is None or cached[0] != state.key[3]:
+                # Simplification is incremental and reads the live path buffer, so it stays here
+                state.path = self.lod.simplified(PathLevelOfDetail.tolerance_for(transform.resolution)) \
+                    if len(self.path) else None
+        return state
+
+    def render(self, state: RenderState | None = None) -> np.ndarray | None:
+        """Composited (height, width, 4) RGBA frame, or None before the first map frame."""
+        state = self.capture() if state is None else state
+        if state.key == self._frame_key:
+            return self._frame
+
+        base = self._render_base(state)
+        if base is None:
+            return None
+
+        frame = base.copy()
+        flat = frame.reshape(-1, 4)
+        if state.transform is not None:
+            for name, layer_key in zip(self.LAYERS, state.key[1:]):
+                for indices, colour in self._layer(name, layer_key, state, base.shape[:2]):
+                    _blend(flat, indices, colour)
+
+        self._frame = frame
+        self._frame_key = state.key
+        return frame
+
+    def image(self, state: RenderState | None = None) -> bytes | None:
+        """PNG encoded frame, only re-encoded when a layer changed."""
+        state = self.capture() if state is None else state
+        if state.key == self._png_key:
+            return self._png
+        frame = self.render(state)
+        self._png = encode_png(frame, self.PNG_COMPRESSION) if frame is not None else None
+        self._png_key = state.key
+        return self._png
+
+    def _render_base(self, state: RenderState) -> np.ndarray | None:
+        grid = state.grid
+        if grid is None:
+            return None
+
+        labels = state.labels
+        if self._base is None or state.base_key != self._base_key:
+            self._base = np.empty(grid.shape + (4,), dtype=np.uint8)
+            self._colour(grid, labels, slice(None), slice(None))
+            self._base_key = state.base_key
+        else:
+            for x0, y0, x1, y1 in state.dirty:
+                self._colour(grid, labels, slice(y0, y1), slice(x0, x1))
+        return self._base
+
+    def _colour(self, grid: np.ndarray, labels: np.ndarray | None, rows: slice, cols: slice) -> None:
+        cells = grid[rows, cols]
+        rgba = CELL_COLOURS[cells]
+        if labels is not None:
+            rooms = labels[rows, cols]
+            floor = ((cells == FREE) | (cells == CARPET)) & (rooms < MAX_ROOMS)
+            rgba[floor] = ROOM_COLOURS[rooms[floor]]
+        self._base[rows, cols] = rgba
+
+    def _layer(self, name: str, key: object, state: RenderState, shape: tuple[int, int]) -> Layer:
+        cached = self._layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        layer = getattr(self, f'_build_{name}')(state, state.transform, shape)
+        self._layers[name] = (key, layer)
+        return layer
+
+    def _build_zones(self, state: RenderState, transform: MapTransform, shape: tuple[int, int]) -> Layer:
+        zones = state.zones
+        if zones is None:
+            return []
+
+        def corners(quad) -> np.ndarray:
+            return transform.to_pixel_array([(p.x, p.y) for p in (quad.p0, quad.p1, quad.p2, quad.p3)])
+
+        layer: Layer = []
+        for quads, fill, outline in ((zones.forbidden_zones, FORBIDDEN_COLOUR, WALL_COLOUR),
+                                     (zones.ban_mop_zones, NO_MOP_COLOUR, NO_MOP_OUTLINE_COLOUR)):
+            for quad in quads:
+                polygon = corners(quad)
+                layer.append((polygon_indices(polygon, shape), fill))
+                layer.append((polyline_indices(np.vstack((polygon, polygon[:1])), shape), outline))
+        if zones.virtual_walls:
+            starts = transform.to_pixel_array([(w.p0.x, w.p0.y) for w in zones.virtual_walls])
+            ends = transform.to_pixel_array([(w.p1.x, w.p1.y) for w in zones.virtual_walls])
+            layer.append((segment_indices(starts, ends, shape), WALL_COLOUR))
+        return layer
+
+    def _build_obstacles(self, state: RenderState, transform: MapTransform, shape: tuple[int, int]) -> Layer:
+        if state.obstacles is None:
+            return []
+        layer: Layer = []
+        for obstacle in state.obstacles.obstacles:
+            if obstacle.show_type == ObstacleInfo.Obstacle.BITMAP and obstacle.HasField('bitmap'):
+                layer.append((pixel_indices(bitmap_pixels(obstacle.bitmap, transform), shape), OBSTACLE_COLOUR))
+                continue
+            if not obstacle.show_points:
+                continue
+            points = transform.to_pixel_array([(p.x, p.y) for p in obstacle.show_points])
+            if obstacle.show_type == ObstacleInfo.Obstacle.FILL and len(points) >= 3:
+                indices = polygon_indices(points, shape)
+            elif obstacle.show_type == ObstacleInfo.Obstacle.OUTLINE and len(points) >= 2:
+                indices = polyline_indices(np.vstack((points, points[:1])), shape)
+            else:
+                indices = disc_indices(tuple(points[0]), OBSTACLE_RADIUS, shape)
+            layer.append((indices, OBSTACLE_COLOUR))
+        return layer
+
+    def _build_path(self, state: RenderState, transform: MapTransform, shape: tuple[int, int]) -> Layer:
+        points = state.path
+        if points is None:
+            return []
+        pixels = transform.to_pixel_array(np.column_stack((points['x'], points['y'])))
+        return [(polyline_indices(pixels, shape, points['break']), PATH_COLOUR)]
+
+    def _build_docks(self, state: RenderState, transform: MapTransform, shape: tuple[int, int]) -> Layer:
+        docks = state.docks
+        return [(disc_indices(transform.to_pixel(d.pose.x, d.pose.y), DOCK_RADIUS, shape), DOCK_COLOUR) for d in docks]
+
+    def _build_robot(self, state: RenderState, transform: MapTransform, shape: tuple[int, int]) -> Layer:
+        pose = state.pose
+        if pose is None:
+            return []
+        center = transform.to_pixel(pose.x, pose.y)
+        theta = pose.theta / 100
+        reach = ROBOT_RADIUS * 2 * transform.resolution
+        heading = transform.to_pixel(pose.x + reach * math.cos(theta), pose.y + reach * math.sin(theta))
+        return [
+            (disc_indices(center, ROBOT_RADIUS, shape), ROBOT_COLOUR),
+            (segment_indices(center, heading, shape), ROBOT_COLOUR),
+        ]
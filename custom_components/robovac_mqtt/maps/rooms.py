@@ -0,0 +1,134 @@
+import numpy as np
+
+from ..proto.cloud.common_pb2 import Point
+from ..proto.cloud.p2pdata_pb2 import CompleteMap
+from ..proto.cloud.stream_pb2 import MapInfo, RoomOutline
+from .decoder import decompress_pixels
+from .transform import MapTransform
+
+# The high 6 bits of an outline pixel are the room id, see p2p.MapPixels
+MAX_ROOMS = 32
+LABEL_COUNT = 64
+NO_ROOM = 60
+ROOM_GAP = 61
+ROOM_OBSTACLE = 62
+UNKNOWN_ROOM = 63
+
+
+class RoomIndex:
+    """Per-room statistics of a room outline raster, rebuilt once per outline release.
+
+    Valid room ids are 0-31. Bounding boxes are (x0, y0, x1, y1) in pixels,
+    inclusive, and centroids are (x, y) in pixels; both are -1 for absent rooms.
+    """
+
+    def __init__(self) -> None:
+        self.map_id: int | None = None
+        self.releases: int | None = None
+        self.resolution = 0
+        self.origin = Point()
+        self.labels: np.ndarray | None = None
+        self.counts = np.zeros(MAX_ROOMS, dtype=np.int64)
+        self.areas = np.zeros(MAX_ROOMS, dtype=np.float64)
+        self.bboxes = np.full((MAX_ROOMS, 4), -1, dtype=np.int32)
+        self.centroids = np.full((MAX_ROOMS, 2), -1, dtype=np.float64)
+
+    @property
+    def room_ids(self) -> list[int]:
+        return np.flatnonzero(self.counts).tolist()
+
+    def update(self, message: RoomOutline | CompleteMap, resolution: int = 0) -> bool:
+        """Rebuild from a stream.RoomOutline or p2p.CompleteMap if its release changed.
+
+        `resolution` (m x 100 per pixel, from MapInfo) is used when the message
+        does not carry one itself. Returns True if the index was rebuilt.
+        """
+        if not self.stale(message):
+            return False
+        self._load(message, resolution)
+        return True
+
+    def stale(self, message: RoomOutline | CompleteMap) -> bool:
+        """True if the message carries another map or release than the index."""
+        return (message.map_id, message.releases) != (self.map_id, self.releases)
+
+    @classmethod
+    def build(cls, message: RoomOutline | CompleteMap, resolution: int = 0) -> 'RoomIndex':
+        """New index of a message; shares no state, so it can be built in an executor."""
+        index = cls()
+        index._load(message, resolution)
+        return index
+
+    def replace(self, other: 'RoomIndex') -> None:
+        """Take over the contents of an index from build(), keeping this object shared."""
+        self.__dict__.update(other.__dict__)
+
+    def _load(self, message: RoomOutline | CompleteMap, resolution: int) -> None:
+        if isinstance(message, CompleteMap):
+            width, height = message.map_width, message.map_height
+            raw = decompress_pixels(message.room_outline.pixels, message.room_outline.pixel_size)
+        else:
+            width, height = message.width, message.height
+            resolution = message.resolution or resolution
+            raw = decompress_pixels(message.pixels, message.pixel_size)
+
+        outline = np.frombuffer(raw, dtype=np.uint8, count=width * height).reshape(height, width)
+        self._build(outline >> 2, resolution)
+        self.map_id = message.map_id
+        self.releases = message.releases
+        self.origin = Point(x=message.origin.x, y=message.origin.y)
+
+    def _build(self, labels: np.ndarray, resolution: int) -> None:
+        height, width = labels.shape
+        self.labels = labels
+        self.resolution = resolution
+
+        # Label histograms per row and per column give counts, extents and centroids
+        lab = labels.astype(np.intp)
+        rows = np.bincount((lab + np.arange(height, dtype=np.intp)[:, None] * LABEL_COUNT).ravel(),
+                           minlength=height * LABEL_COUNT).reshape(height, LABEL_COUNT)[:, :MAX_ROOMS]
+        cols = np.bincount((lab + np.arange(width, dtype=np.intp)[None, :] * LABEL_COUNT).ravel(),
+                           minlength=width * LABEL_COUNT).reshape(width, LABEL_COUNT)[:, :MAX_ROOMS]
+
+        counts = rows.sum(axis=0)
+        present = counts > 0
+        self.counts = counts
+        self.areas = counts * (resolution / 100) ** 2
+
+        in_rows, in_cols = rows > 0, cols > 0
+        bboxes = np.full((MAX_ROOMS, 4), -1, dtype=np.int32)
+        bboxes[present, 0] = in_cols.argmax(axis=0)[present]
+        bboxes[present, 1] = in_rows.argmax(axis=0)[present]
+        bboxes[present, 2] = width - 1 - in_cols[::-1].argmax(axis=0)[present]
+        bboxes[present, 3] = height - 1 - in_rows[::-1].argmax(axis=0)[present]
+        self.bboxes = bboxes
+
+        centroids = np.full((MAX_ROOMS, 2), -1, dtype=np.float64)
+        centroids[present, 0] = (np.arange(width) @ cols)[present] / counts[present]
+        centroids[present, 1] = (np.arange(height) @ rows)[present] / counts[present]
+        self.centroids = centroids
+
+    def transform(self, info: MapInfo | None = None) -> MapTransform | None:
+        """Pixel/world transform of the outline raster, preferring the live MapInfo when known."""
+        if self.labels is None:
+            return None
+        if info is not None and info.resolution:
+            return MapTransform.from_info(info)
+        if self.resolution:
+            return MapTransform(self.origin.x, self.origin.y, self.resolution)
+        return None
+
+    def area(self, room_id: int) -> float:
+        """Floor area of a room in m²."""
+        return float(self.areas[room_id])
+
+    def centroid(self, room_id: int) -> tuple[float, float] | None:
+        if not self.counts[room_id]:
+            return None
+        x, y = self.centroids[room_id]
+        return float(x), float(y)
+
+    def bounding_box(self, room_id: int) -> tuple[int, int, int, int] | None:
+        if not self.counts[room_id]:
+            return None
+        return tuple(int(v) for v in self.bboxes[room_id])
@@ -0,0 +1,148 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from .live_map import LiveMap
+from .rooms import MAX_ROOMS, RoomIndex
+
+# Rooms whose pixels are at most this far apart (across a wall or door line) are adjacent
+ADJACENCY_GAP = 2
+# Pixels around the dock searched for the room it stands in
+DOCK_RADIUS = 10
+# Travel between rooms with no path through adjacent rooms is the straight line times this
+DETOUR = 2.0
+MAX_ROUTES = 256
+
+
+class RoomRoutePlanner:
+    """Orders the rooms of a room clean to shorten travel between them.
+
+    Travel costs come from the room outline raster: rooms that touch are
+    connected by the distance between their centroids, and other pairs by
+    the shortest path through adjacent rooms. The costs are rebuilt once per
+    outline release. A route is the round trip from the dock through all
+    rooms, built nearest-neighbour first and improved by 2-opt, and is
+    memoized per room set and dock position until the next release.
+    """
+
+    def __init__(self, room_index: RoomIndex, live_map: LiveMap | None = None) -> None:
+        self.room_index = room_index
+        self.live_map = live_map
+        self._source: tuple | None = None
+        self._costs: np.ndarray | None = None
+        self._routes: dict[tuple, tuple[int, ...]] = {}
+
+    def order(self, room_ids: Iterable[int]) -> list[int]:
+        """Room ids in travel order; returned as given if any room is not in the outline raster."""
+        rooms = list(dict.fromkeys(room_ids))
+        self._refresh()
+        counts = self.room_index.counts
+        if self._costs is None or len(rooms) < 2 or any(not 0 <= r < MAX_ROOMS or not counts[r] for r in rooms):
+            return rooms
+
+        dock = self._dock()
+        key = (frozenset(rooms), dock)
+        route = self._routes.get(key)
+        if route is None:
+            if len(self._routes) >= MAX_ROUTES:
+                self._routes.clear()
+            route = self._routes[key] = self._plan(sorted(rooms), dock)
+        return list(route)
+
+    def _refresh(self) -> None:
+        index = self.room_index
+        source = (index.map_id, index.releases)
+        if source == self._source:
+            return
+        self._source = source
+        self._routes.clear()
+        self._costs = room_costs(index.labels, index.centroids) if index.labels is not None else None
+
+    def _dock(self) -> tuple[int, int] | None:
+        """Pixel position of the first dock of the live map, None if unknown."""
+        info = self.live_map.info if self.live_map is not None else None
+        if info is None:
+            return None
+        docks = info.docks_v2
+        if not docks:
+            return None
+        transform = self.room_index.transform(info)
+        if transform is None:
+            return None
+        px, py = transform.to_pixel(docks[0].pose.x, docks[0].pose.y)
+        return round(px), round(py)
+
+    def _plan(self, rooms: list[int], dock: tuple[int, int] | None) -> tuple[int, ...]:
+        nodes = np.array(rooms)
+        # Node 0 is the dock; without one every leg to it is free and the route is an open path
+        cost = np.zeros((len(rooms) + 1, len(rooms) + 1))
+        cost[1:, 1:] = self._costs[np.ix_(nodes, nodes)]
+        if dock is not None:
+            cost[0, 1:] = cost[1:, 0] = self._dock_costs(dock)[nodes]
+        tour = two_opt(nearest_neighbour(cost), cost.tolist())
+        return tuple(rooms[node - 1] for node in tour[1:])
+
+    def _dock_costs(self, dock: tuple[int, int]) -> np.ndarray:
+        """Travel from the dock to every room, through the room the dock stands in."""
+        index = self.room_index
+        centroids = index.centroids
+        labels = index.labels
+        height, width = labels.shape
+        x, y = dock
+        window = labels[max(y - DOCK_RADIUS, 0):max(y + DOCK_RADIUS + 1, 0),
+                        max(x - DOCK_RADIUS, 0):max(x + DOCK_RADIUS + 1, 0)]
+        near = np.bincount(window[window < MAX_ROOMS].ravel(), minlength=MAX_ROOMS)
+        if near.any():
+            start = int(near.argmax())
+        else:
+            # Dock outside the explored rooms, enter through the closest one
+            present = np.flatnonzero(index.counts)
+            start = int(present[np.hypot(*(centroids[present] - dock).T).argmin()])
+        return np.hypot(*(centroids[start] - dock)) + self._costs[start]
+
+
+def room_costs(labels: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """(MAX_ROOMS, MAX_ROOMS) travel costs in pixels between the rooms of a label raster."""
+    adjacent = np.zeros((MAX_ROOMS, MAX_ROOMS), dtype=bool)
+    for gap in range(1, ADJACENCY_GAP + 1):
+        for a, b in ((labels[:, :-gap], labels[:, gap:]), (labels[:-gap], labels[gap:])):
+            touching = (a < MAX_ROOMS) & (b < MAX_ROOMS) & (a != b)
+            adjacent[a[touching], b[touching]] = True
+    adjacent |= adjacent.T
+
+    straight = np.hypot(*(centroids[:, None] - centroids[None, :]).transpose(2, 0, 1))
+    costs = np.where(adjacent, straight, np.inf)
+    np.fill_diagonal(costs, 0)
+    # Floyd-Warshall, one relaxation of the whole matrix per intermediate room
+    for k in range(MAX_ROOMS):
+        np.minimum(costs, costs[:, k, None] + costs[None, k, :], out=costs)
+    return np.where(np.isinf(costs), straight * DETOUR, costs)
+
+
+def nearest_neighbour(cost: np.ndarray) -> list[int]:
+    """Tour starting at node 0 that always moves to the closest unvisited node."""
+    count = len(cost)
+    visited = np.zeros(count, dtype=bool)
+    tour = [0]
+    visited[0] = True
+    for _ in range(count - 1):
+        node = int(np.where(visited, np.inf, cost[tour[-1]]).argmin())
+        visited[node] = True
+        tour.append(node)
+    return tour
+
+
+def two_opt(tour: list[int], cost: list[list[float]]) -> list[int]:
+    """Reverse tour segments while that shortens the round trip; node 0 stays first."""
+    count = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, count - 1):
+            for j in range(i + 1, count):
+                a, b = tour[i - 1], tour[i]
+                c, d = tour[j], tour[(j + 1) % count]
+                if cost[a][c] + cost[b][d] < cost[a][b] + cost[c][d] - 1e-9:
+                    tour[i:j + 1] = tour[i:j + 1][::-1]
+                    improved = True
+    return tour
@@ -0,0 +1,236 @@
+import logging
+import mmap
+import os
+import re
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from ..proto.cloud.p2pdata_pb2 import CompleteMap
+from .decoder import decompress_pixels, unpack_pixels
+
+_LOGGER = logging.getLogger(__name__)
+
+# File layout: header, CompleteMap without pixel payloads, SLAM pixels, outline pixels.
+# The pixel payloads are kept LZ4 compressed exactly as received.
+_MAGIC = b'EMAP'
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sHIIIII')
+_FILE_NAME = re.compile(r'map_(\d+)_(\d+)\.bin$')
+
+
+def _file_name(map_id: int, releases: int) -> str:
+    return f'map_{map_id}_{releases}.bin'
+
+
+class StoredMap:
+    """One persisted CompleteMap, memory-mapped on first access."""
+
+    def __init__(self, path: Path, map_id: int, releases: int) -> None:
+        self.path = path
+        self.map_id = map_id
+        self.releases = releases
+        stat = path.stat()
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self._mmap: mmap.mmap | None = None
+        self._meta: CompleteMap | None = None
+        self._offsets: tuple[int, int, int] | None = None
+
+    def _open(self) -> memoryview:
+        if self._mmap is None:
+            with open(self.path, 'rb') as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, map_id, releases, meta_len, map_len, outline_len = _HEADER.unpack_from(self._mmap)
+            if magic != _MAGIC or version != _FORMAT_VERSION or (map_id, releases) != (self.map_id, self.releases):
+                self.close()
+                raise ValueError(f'Not a map store file or wrong version: {self.path}')
+            start = _HEADER.size + meta_len
+            self._offsets = (start, start + map_len, start + map_len + outline_len)
+            if self._offsets[2] > len(self._mmap):
+                self.close()
+                raise ValueError(f'Truncated map store file: {self.path}')
+        return memoryview(self._mmap)
+
+    @property
+    def meta(self) -> CompleteMap:
+        """The map without its pixel payloads: name, dimensions, origin, docks, zones..."""
+        if self._meta is None:
+            with self._open() as view:
+                self._meta = CompleteMap.FromString(view[_HEADER.size:self._offsets[0]])
+        return self._meta
+
+    @property
+    def name(self) -> str:
+        return self.meta.name
+
+    def map_pixels(self) -> memoryview:
+        """Compressed SLAM pixels as a zero-copy view of the mapped file."""
+        view = self._open()
+        return view[self._offsets[0]:self._offsets[1]]
+
+    def outline_pixels(self) -> memoryview:
+        """Compressed room outline pixels as a zero-copy view of the mapped file."""
+        view = self._open()
+        return view[self._offsets[1]:self._offsets[2]]
+
+    def grid(self, out: np.ndarray | None = None) -> np.ndarray:
+        """Decode the SLAM raster straight from the mapped file."""
+        meta = self.meta
+        with self.map_pixels() as pixels:
+            raw = decompress_pixels(pixels, meta.map.pixel_size)
+            return unpack_pixels(raw, meta.map_width, meta.map_height, out)
+
+    def complete_map(self) -> CompleteMap:
+        """Rebuild the full CompleteMap message (copies the pixel payloads)."""
+        message = CompleteMap()
+        message.CopyFrom(self.meta)
+        with self.map_pixels() as pixels:
+            message.map.pixels = bytes(pixels)
+        with self.outline_pixels() as pixels:
+            message.room_outline.pixels = bytes(pixels)
+        return message
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views handed out are still alive, the mapping goes away with them
+                pass
+            self._mmap = None
+
+
+class MapStore:
+    """Disk-backed store of saved maps keyed by (map_id, releases).
+
+    Only the newest release of each map is served; older releases are kept
+    until the store grows over `max_bytes`, then evicted oldest first. When
+    still over budget, whole maps are evicted least recently used first.
+    The directory is scanned lazily on first use. All methods do blocking
+    file IO, call them from an executor inside an event loop.
+    """
+
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, root: str | os.PathLike, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._maps: dict[tuple[int, int], StoredMap] | None = None
+        # map_id -> newest stored release, in least recently used order
+        self._latest: dict[int, int] = {}
+
+    def _index(self) -> dict[tuple[int, int], StoredMap]:
+        if self._maps is None:
+            self._maps = {}
+            if self.root.is_dir():
+                for path in self.root.iterdir():
+                    match = _FILE_NAME.match(path.name)
+                    if match:
+                        map_id, releases = int(match[1]), int(match[2])
+                        self._maps[(map_id, releases)] = StoredMap(path, map_id, releases)
+            for map_id, releases in sorted(self._maps, key=lambda key: self._maps[key].mtime):
+                if releases >= self._latest.get(map_id, -1):
+                    self._latest.pop(map_id, None)
+                    self._latest[map_id] = releases
+        return self._maps
+
+    @property
+    def size(self) -> int:
+        return sum(stored.size for stored in self._index().values())
+
+    def list_maps(self) -> list[StoredMap]:
+        """Newest stored release of every map, ordered by map id."""
+        maps = self._index()
+        return [maps[(map_id, releases)] for map_id, releases in sorted(self._latest.items())]
+
+    def releases(self) -> dict[int, int]:
+        """map_id -> newest stored release."""
+        self._index()
+        return dict(self._latest)
+
+    def get(self, map_id: int, releases: int | None = None) -> StoredMap | None:
+        """A stored map, the newest release unless `releases` is given. Pixels are loaded lazily."""
+        maps = self._index()
+        if releases is None:
+            releases = self._latest.get(map_id)
+        stored = maps.get((map_id, releases))
+        if stored is not None and self._latest.get(map_id) == releases:
+            self._latest[map_id] = self._latest.pop(map_id)
+        return stored
+
+    def stale(self, versions: Iterable[tuple[int, int]]) -> list[int]:
+        """Ids of the maps among (map_id, releases) pairs that are not stored at that release."""
+        maps = self._index()
+        return [map_id for map_id, releases in versions if (map_id, releases) not in maps]
+
+    def put(self, message: CompleteMap) -> StoredMap:
+        """Persist a CompleteMap, replacing the file atomically, then enforce the size budget."""
+        maps = self._index()
+        key = (message.map_id, message.releases)
+
+        meta = CompleteMap()
+        meta.CopyFrom(message)
+        meta.map.ClearField('pixels')
+        meta.room_outline.ClearField('pixels')
+        meta_bytes = meta.SerializeToString()
+        map_pixels, outline_pixels = message.map.pixels, message.room_outline.pixels
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / _file_name(*key)
+        temporary = path.with_suffix('.tmp')
+        with open(temporary, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, *key, len(meta_bytes), len(map_pixels), len(outline_pixels)))
+            file.write(meta_bytes)
+            file.write(map_pixels)
+            file.write(outline_pixels)
+        previous = maps.pop(key, None)
+        if previous is not None:
+            previous.close()
+        os.replace(temporary, path)
+
+        stored = StoredMap(path, *key)
+        maps[key] = stored
+        if message.releases >= self._latest.get(message.map_id, -1):
+            self._latest.pop(message.map_id, None)
+            self._latest[message.map_id] = message.releases
+        self._evict(keep=key)
+        return stored
+
+    def delete(self, map_id: int) -> None:
+        """Remove every stored release of a map."""
+        maps = self._index()
+        for key in [key for key in maps if key[0] == map_id]:
+            self._remove(key)
+        self._latest.pop(map_id, None)
+
+    def _remove(self, key: tuple[int, int]) -> None:
+        stored = self._maps.pop(key)
+        stored.close()
+        try:
+            stored.path.unlink()
+        except FileNotFoundError:
+            pass
+        _LOGGER.debug('Evicted stored map %s release %s', *key)
+
+    def _evict(self, keep: tuple[int, int]) -> None:
+        maps = self._maps
+        total = sum(stored.size for stored in maps.values())
+        if total <= self.max_bytes:
+            return
+
+        old = sorted((key for key in maps if self._latest.get(key[0]) != key[1]), key=lambda key: maps[key].mtime)
+        newest = [(map_id, releases) for map_id, releases in self._latest.items() if (map_id, releases) != keep]
+        for key in old + newest:
+            if total <= self.max_bytes:
+                break
+            total -= maps[key].size
+            self._remove(key)
+            if self._latest.get(key[0]) == key[1]:
+                del self._latest[key[0]]
+
+    def close(self) -> None:
+        for stored in (self._maps or {}).values():
+            stored.close()
@@ -0,0 +1,117 @@
+import logging
+from collections.abc import Callable, Iterator
+
+from google.protobuf.message import DecodeError, Message
+
+from ..proto.cloud.stream_pb2 import (CruiseData, DynamicData, Map, MapInfo,
+                                      Metadata, ObstacleInfo, PathPoint,
+                                      RestrictedZone, RoomOutline, RoomParams,
+                                      TemporaryData)
+from ..utils import read_varint
+
+_LOGGER = logging.getLogger(__name__)
+
+# Channel name (a stream.Metadata.ChanIds field) -> message type of its frames
+CHANNEL_TYPES: dict[str, type[Message]] = {
+    'map_info': MapInfo,
+    'path': PathPoint,
+    'room_outline': RoomOutline,
+    'room_params': RoomParams,
+    'restricted_zone': RestrictedZone,
+    'dynamic_data': DynamicData,
+    'temporary_data': TemporaryData,
+    'obstacle_info': ObstacleInfo,
+    'map_data': Map,
+    'cruise_data': CruiseData,
+}
+
+Listener = Callable[[Message], None]
+BatchListener = Callable[[list[Message]], None]
+
+
+def split_delimited(data: bytes | memoryview) -> Iterator[memoryview]:
+    """Yield zero-copy views of the length-delimited protobuf frames in a buffer."""
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        length, offset = read_varint(view, offset)
+        if offset + length > len(view):
+            raise ValueError(f'Truncated frame: {length} bytes announced, {len(view) - offset} left')
+        yield view[offset:offset + length]
+        offset += length
+
+
+class StreamDemux:
+    """Routes map stream payloads to the parsers subscribed to their channel.
+
+    Channel ids come from stream.Metadata and default to the ChanIds field
+    numbers until a Metadata message is fed. A payload holds one or more
+    delimited frames; payloads of channels nobody subscribed to are dropped
+    before their frames are even split. Every channel keeps a version that
+    increases with each frame delivered on it.
+    """
+
+    def __init__(self) -> None:
+        self.channel_ids: dict[int, str] = {
+            field.number: field.name for field in Metadata.ChanIds.DESCRIPTOR.fields}
+        self.map_data_version = 0
+        self.versions: dict[str, int] = dict.fromkeys(CHANNEL_TYPES, 0)
+        self._listeners: dict[str, list[Listener]] = {}
+        self._batch_listeners: dict[str, list[BatchListener]] = {}
+
+    def set_metadata(self, metadata: Metadata) -> None:
+        """Apply the channel ids announced in a stream.Metadata message."""
+        ids = {}
+        for field in Metadata.ChanIds.DESCRIPTOR.fields:
+            chan_id = getattr(metadata.chan_ids, field.name)
+            ids[chan_id or field.number] = field.name
+        self.channel_ids = ids
+        self.map_data_version = metadata.versions.map_data
+
+    def subscribe(self, channel: str, listener: Listener | BatchListener, batch: bool = False) -> Callable[[], None]:
+        """Call `listener` with every parsed message of a channel, or with the list of
+        messages of each payload when `batch` is set. Returns an unsubscribe function."""
+        if channel not in CHANNEL_TYPES:
+            raise ValueError(f'Unknown stream channel: {channel}, allowed values: {list(CHANNEL_TYPES)}')
+        listeners = (self._batch_listeners if batch else self._listeners).setdefault(channel, [])
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+    def subscribed(self, channel: str) -> bool:
+        return bool(self._listeners.get(channel) or self._batch_listeners.get(channel))
+
+    def feed(self, chan_id: int, payload: bytes | memoryview) -> int:
+        """Parse and dispatch the delimited frames of one channel payload, returning the number delivered."""
+        channel = self.channel_ids.get(chan_id)
+        if channel is None:
+            _LOGGER.debug('Dropping payload of unknown stream channel %s', chan_id)
+            return 0
+        if not self.subscribed(channel):
+            return 0
+
+        message_type = CHANNEL_TYPES[channel]
+        messages = []
+        try:
+            for frame in split_delimited(payload):
+                messages.append(message_type.FromString(frame))
+        except (ValueError, DecodeError) as error:
+            # Keep the frames parsed before the damaged one
+            _LOGGER.warning('Could not parse %s frame: %s', channel, error)
+        if not messages:
+            return 0
+
+        self.versions[channel] += len(messages)
+        for listener in self._batch_listeners.get(channel, ()):
+            self._call(channel, listener, messages)
+        for listener in self._listeners.get(channel, ()):
+            for message in messages:
+                self._call(channel, listener, message)
+        return len(messages)
+
+    @staticmethod
+    def _call(channel: str, listener: Listener | BatchListener, argument) -> None:
+        # A failing parser (e.g. a corrupt LZ4 raster) must not cost the other listeners their frames
+        try:
+            listener(argument)
+        except Exception as error:
+            _LOGGER.error('Stream listener of %s failed', channel, exc_info=error)
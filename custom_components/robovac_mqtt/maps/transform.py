@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+
+from ..proto.cloud.stream_pb2 import MapInfo
+
+
+class MapTransform:
+    """Conversion between world coordinates (m x 100) and map pixels.
+
+    `origin` is the world position of pixel (0, 0), `resolution` the size of one
+    pixel in m x 100 and `angle` the clockwise rotation of the map in degrees,
+    all as reported in stream.MapInfo.
+    """
+
+    def __init__(self, origin_x: int, origin_y: int, resolution: int, angle: int = 0) -> None:
+        if resolution <= 0:
+            raise ValueError(f'Invalid map resolution: {resolution}')
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.resolution = resolution
+        self.angle = angle
+        theta = math.radians(angle)
+        self._cos = math.cos(theta)
+        self._sin = math.sin(theta)
+        self._scale = 1 / resolution
+
+    @classmethod
+    def from_info(cls, info: MapInfo) -> 'MapTransform':
+        return cls(info.origin.x, info.origin.y, info.resolution, info.angle)
+
+    @property
+    def key(self) -> tuple[int, int, int, int]:
+        return self.origin_x, self.origin_y, self.resolution, self.angle
+
+    def to_pixel(self, x: float, y: float) -> tuple[float, float]:
+        dx = x - self.origin_x
+        dy = y - self.origin_y
+        return ((dx * self._cos + dy * self._sin) * self._scale,
+                (dy * self._cos - dx * self._sin) * self._scale)
+
+    def to_world(self, px: float, py: float) -> tuple[float, float]:
+        dx = px * self.resolution
+        dy = py * self.resolution
+        return (self.origin_x + dx * self._cos - dy * self._sin,
+                self.origin_y + dy * self._cos + dx * self._sin)
+
+    def to_pixel_array(self, xy: np.ndarray) -> np.ndarray:
+        """Vectorized to_pixel for an (n, 2) array of world points."""
+        d = np.asarray(xy, dtype=np.float64) - (self.origin_x, self.origin_y)
+        rotation = np.array([[self._cos, -self._sin], [self._sin, self._cos]])
+        return d @ rotation * self._scale
+
+    def to_world_array(self, pxy: np.ndarray) -> np.ndarray:
+        """Vectorized to_world for an (n, 2) array of pixel points."""
+        d = np.asarray(pxy, dtype=np.float64) * self.resolution
+        rotation = np.array([[self._cos, self._sin], [-self._sin, self._cos]])
+        return d @ rotation + (self.origin_x, self.origin_y)
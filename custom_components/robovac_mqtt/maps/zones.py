@@ -0,0 +1,120 @@
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from ..proto.cloud.common_pb2 import Quadrangle
+from ..proto.cloud.stream_pb2 import RestrictedZone
+from .decoder import CARPET, FREE
+from .live_map import LiveMap
+from .raster import polygon_indices, polyline_indices, segment_indices
+from .transform import MapTransform
+
+# Bits of the restricted zone mask
+FORBIDDEN = 1
+NO_MOP = 2
+WALL = 4
+
+
+def quadrangle(zone: Sequence) -> Quadrangle:
+    """Quadrangle from an (x0, y0, x1, y1) rectangle or four (x, y) corners, in world coordinates."""
+    if len(zone) == 4 and all(isinstance(v, (int, float)) for v in zone):
+        x0, y0, x1, y1 = zone
+        zone = ((x0, y0), (x1, y0), (x1, y1), (x0, y1))
+    if len(zone) != 4:
+        raise ValueError(f'A zone needs four corners or (x0, y0, x1, y1), got {zone!r}')
+    p0, p1, p2, p3 = ({'x': int(x), 'y': int(y)} for x, y in zone)
+    return Quadrangle(p0=p0, p1=p1, p2=p2, p3=p3)
+
+
+def _corners(quad: Quadrangle) -> list[tuple[int, int]]:
+    return [(p.x, p.y) for p in (quad.p0, quad.p1, quad.p2, quad.p3)]
+
+
+class RestrictedZoneMask:
+    """Raster of the restricted zones on the live map grid, for validating targets locally.
+
+    The mask is rebuilt only when the zones, the map transform or the grid
+    shape change; checking a point is a single raster lookup. Without a live
+    map nothing can be checked and targets are accepted as is.
+    """
+
+    def __init__(self, live_map: LiveMap) -> None:
+        self.live_map = live_map
+        self.zones: RestrictedZone | None = None
+        self._zones_bytes: bytes | None = None
+        self._mask: np.ndarray | None = None
+        self._key = None
+
+    def update(self, zones: RestrictedZone) -> bool:
+        """Record a RestrictedZone message, returning True if the zones changed."""
+        serialized = zones.SerializeToString(deterministic=True)
+        if serialized == self._zones_bytes:
+            return False
+        self.zones = zones
+        self._zones_bytes = serialized
+        self._mask = None
+        return True
+
+    def _transform(self) -> MapTransform | None:
+        info = self.live_map.info
+        if info is None or not info.resolution or self.live_map.grid is None:
+            return None
+        return MapTransform.from_info(info)
+
+    def mask(self) -> np.ndarray | None:
+        """(height, width) uint8 raster of FORBIDDEN | NO_MOP | WALL bits, or None without a live map."""
+        transform = self._transform()
+        if transform is None:
+            return None
+        shape = self.live_map.grid.shape
+        key = (transform.key, shape)
+        if self._mask is not None and key == self._key:
+            return self._mask
+
+        mask = np.zeros(shape, dtype=np.uint8)
+        flat = mask.reshape(-1)
+        zones = self.zones
+        if zones is not None:
+            for quads, bit in ((zones.forbidden_zones, FORBIDDEN), (zones.ban_mop_zones, NO_MOP)):
+                for quad in quads:
+                    polygon = transform.to_pixel_array(_corners(quad))
+                    flat[polygon_indices(polygon, shape)] |= bit
+                    flat[polyline_indices(np.vstack((polygon, polygon[:1])), shape)] |= bit
+            if zones.virtual_walls:
+                starts = transform.to_pixel_array([(w.p0.x, w.p0.y) for w in zones.virtual_walls])
+                ends = transform.to_pixel_array([(w.p1.x, w.p1.y) for w in zones.virtual_walls])
+                flat[segment_indices(starts, ends, shape)] |= WALL
+        self._mask = mask
+        self._key = key
+        return mask
+
+    def check_point(self, x: float, y: float) -> None:
+        """Raise ValueError if the robot cannot be sent to the world point (x, y)."""
+        mask = self.mask()
+        if mask is None:
+            return
+        px, py = (math.floor(v) for v in self._transform().to_pixel(x, y))
+        height, width = mask.shape
+        if not (0 <= px < width and 0 <= py < height):
+            raise ValueError(f'Target ({x}, {y}) is outside the map')
+        if mask[py, px] & FORBIDDEN:
+            raise ValueError(f'Target ({x}, {y}) is inside a forbidden zone')
+        if mask[py, px] & WALL:
+            raise ValueError(f'Target ({x}, {y}) is on a virtual wall')
+        if self.live_map.grid[py, px] not in (FREE, CARPET):
+            raise ValueError(f'Target ({x}, {y}) is not on explored floor')
+
+    def check_zone(self, zone: Quadrangle) -> None:
+        """Raise ValueError if a zone has no explored floor outside the forbidden zones."""
+        mask = self.mask()
+        if mask is None:
+            return
+        transform = self._transform()
+        indices = polygon_indices(transform.to_pixel_array(_corners(zone)), mask.shape)
+        if not len(indices):
+            raise ValueError(f'Zone {_corners(zone)} is outside the map')
+        cells = self.live_map.grid.reshape(-1)[indices]
+        cleanable = ((cells == FREE) | (cells == CARPET)) & (mask.reshape(-1)[indices] & FORBIDDEN == 0)
+        if not cleanable.any():
+            raise ValueError(f'Zone {_corners(zone)} has no explored floor outside forbidden zones')
@@ -0,0 +1,325 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from functools import partial
+
+from ..controllers.SharedConnect import SharedConnect, VacuumActivity
+
+_LOGGER = logging.getLogger(__name__)
+
+AUTO = 'auto'
+ROOMS = 'rooms'
+SCENE = 'scene'
+KINDS = (AUTO, ROOMS, SCENE)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+EXPIRED = 'expired'
+CANCELLED = 'cancelled'
+
+DEFAULT_SITE = 'default'
+
+# Activities a vacuum can be given a job in, and the ones that show a job is under way
+READY_ACTIVITIES = (VacuumActivity.IDLE, VacuumActivity.DOCKED)
+BUSY_ACTIVITIES = (VacuumActivity.CLEANING, VacuumActivity.RETURNING)
+
+# Seconds a started job may take to make its vacuum busy before it is failed
+START_TIMEOUT = 120
+
+
+class Job:
+    """A cleaning job waiting for, or running on, a vacuum of its site."""
+
+    def __init__(self, job_id: int, kind: str, site: str, priority: int = 0, deadline: float | None = None,
+                 min_battery: int = 0, device_id: str | None = None, rooms: list | None = None,
+                 map_id: int | None = None, scene: int | str | None = None) -> None:
+        self.job_id = job_id
+        self.kind = kind
+        self.site = site
+        self.priority = priority
+        self.deadline = deadline
+        self.min_battery = min_battery
+        # Jobs that only make sense on one vacuum (rooms of its map, its scenes) are pinned to it
+        self.device_id = device_id
+        self.rooms = rooms
+        self.map_id = map_id
+        self.scene = scene
+        self.state = QUEUED
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.future: asyncio.Future | None = None
+        self._seen_busy = False
+        self._timer: asyncio.TimerHandle | None = None
+
+    def sort_key(self) -> tuple:
+        """Higher priority first, then earlier deadline, then submission order."""
+        return -self.priority, self.deadline if self.deadline is not None else math.inf, self.job_id
+
+    def expired(self, now: float) -> bool:
+        return self.deadline is not None and now > self.deadline
+
+    def __repr__(self) -> str:
+        return f'Job({self.job_id}, {self.kind}, site={self.site!r}, state={self.state}, device={self.device_id})'
+
+
+class _Vacuum:
+    __slots__ = ('device', 'site', 'activity', 'battery', 'suspended', 'job', 'version')
+
+    def __init__(self, device: SharedConnect, site: str) -> None:
+        self.device = device
+        self.site = site
+        self.activity = None
+        self.battery: int | None = None
+        # Docked or idle in the middle of a task: recharging to resume it or washing the mop
+        self.suspended = False
+        self.job: Job | None = None
+        # Bumped on every state change, invalidating older entries in the ready heaps
+        self.version = 0
+
+    @property
+    def ready(self) -> bool:
+        return (self.job is None and self.activity in READY_ACTIVITIES and not self.suspended
+                and self.battery is not None)
+
+
+class FleetScheduler:
+    """Priority queue of cleaning jobs dispatched to the idle vacuums of a fleet.
+
+    Each site has a heap of queued jobs, a heap of ready vacuums (idle or
+    docked, most charged first) and a concurrency limit; pinned jobs wait in a
+    heap per vacuum and compete with the site's jobs once their vacuum is
+    ready. Every event (job submitted, vacuum state change, job
+    finished) only looks at heap tops, so dispatching is O(log n) amortized;
+    outdated heap entries are skipped when they surface. Jobs are strictly
+    ordered per site: when the best job needs more battery than the most
+    charged ready vacuum has, later jobs wait behind it.
+
+    Completion is tracked from each vacuum's state updates: a running job is
+    done once its vacuum was seen cleaning or returning and is docked or idle
+    again without a task to resume (no breakpoint, no mop wash), and failed if
+    the vacuum reports an error or is not busy START_TIMEOUT seconds after the
+    job started. Queued jobs expire at their deadline.
+    """
+
+    def __init__(self, site_limits: dict[str, int] | None = None, default_limit: int | None = None) -> None:
+        self.site_limits = dict(site_limits or {})
+        self.default_limit = default_limit
+        self.jobs: dict[int, Job] = {}
+        self._vacuums: dict[str, _Vacuum] = {}
+        self._site_jobs: dict[str, list[tuple]] = {}
+        self._pinned_jobs: dict[str, list[tuple]] = {}
+        # Per site: best pinned job of each ready vacuum
+        self._pinned_ready: dict[str, list[tuple]] = {}
+        self._ready: dict[str, list[tuple]] = {}
+        self._running: dict[str, int] = {}
+        self._ids = itertools.count(1)
+        self._entries = itertools.count()
+
+    def add_device(self, device: SharedConnect, site: str = DEFAULT_SITE) -> None:
+        """Put a vacuum under the scheduler; its state updates drive dispatching."""
+        self._vacuums[device.device_id] = _Vacuum(device, site)
+        device.add_listener(partial(self.refresh, device.device_id))
+
+    def limit(self, site: str) -> float:
+        limit = self.site_limits.get(site, self.default_limit)
+        return math.inf if limit is None else limit
+
+    def submit(self, kind: str, site: str = DEFAULT_SITE, priority: int = 0, deadline: float | None = None,
+               min_battery: int = 0, device_id: str | None = None, rooms: list | None = None,
+               map_id: int | None = None, scene: int | str | None = None) -> Job:
+        """Queue a job; `await job.future` for its final state. Must be called from the event loop."""
+        if kind not in KINDS:
+            raise ValueError(f'Invalid job kind: {kind}, allowed values: {KINDS}')
+        if kind == ROOMS and not rooms:
+            raise ValueError('A rooms job needs rooms')
+        if kind == SCENE and scene is None:
+            raise ValueError('A scene job needs a scene')
+        if device_id is not None:
+            vacuum = self._vacuums.get(device_id)
+            if vacuum is None:
+                raise ValueError(f'Unknown device: {device_id}')
+            site = vacuum.site
+        job = Job(next(self._ids), kind, site, priority, deadline, min_battery, device_id, rooms, map_id, scene)
+        loop = asyncio.get_running_loop()
+        job.future = loop.create_future()
+        if deadline is not None:
+            # Deadlines are wall clock times, the loop schedules on its own clock
+            job._timer = loop.call_at(loop.time() + deadline - time.time(), self._expire, job)
+        self.jobs[job.job_id] = job
+        if device_id is not None:
+            heapq.heappush(self._pinned_jobs.setdefault(device_id, []), (job.sort_key(), job))
+            self._offer_pinned(self._vacuums[device_id])
+        else:
+            heapq.heappush(self._site_jobs.setdefault(site, []), (job.sort_key(), job))
+        self._dispatch_site(site)
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a queued job; running jobs are left to the vacuum."""
+        job = self.jobs.get(job_id)
+        if job is None or job.state != QUEUED:
+            return False
+        self._finish(job, CANCELLED)
+        return True
+
+    async def refresh(self, device_id: str) -> None:
+        """Re-read a vacuum's activity and battery and react to the change."""
+        vacuum = self._vacuums[device_id]
+        activity = await vacuum.device.get_work_status()
+        try:
+            battery = await vacuum.device.get_battery_level()
+        except (KeyError, TypeError, ValueError):
+            battery = None
+        suspended = await vacuum.device.get_task_suspended()
+        self.update_state(device_id, activity, battery, suspended)
+
+    def update_state(self, device_id: str, activity, battery: int | None, suspended: bool = False) -> None:
+        vacuum = self._vacuums[device_id]
+        if (activity, battery, suspended) == (vacuum.activity, vacuum.battery, vacuum.suspended):
+            return
+        vacuum.activity, vacuum.battery, vacuum.suspended = activity, battery, suspended
+        vacuum.version += 1
+
+        job = vacuum.job
+        if job is not None:
+            if activity == VacuumActivity.ERROR:
+                self._release(vacuum, FAILED)
+            elif activity in BUSY_ACTIVITIES:
+                job._seen_busy = True
+                if job._timer is not None:
+                    job._timer.cancel()
+                    job._timer = None
+            elif job._seen_busy and activity in READY_ACTIVITIES and not suspended:
+                self._release(vacuum, DONE)
+
+        if vacuum.ready:
+            self._offer(vacuum)
+            self._dispatch_site(vacuum.site)
+
+    def _release(self, vacuum: _Vacuum, state: str) -> None:
+        job, vacuum.job = vacuum.job, None
+        self._running[vacuum.site] -= 1
+        self._finish(job, state)
+        # Its ready entries went stale when the job started, a vacuum that never left the dock is ready again
+        if vacuum.ready:
+            self._offer(vacuum)
+        # A slot freed up for the other vacuums of the site
+        self._dispatch_site(vacuum.site)
+
+    def _expire(self, job: Job) -> None:
+        job._timer = None
+        if job.state == QUEUED:
+            self._finish(job, EXPIRED)
+            # The expired job may have been holding back the jobs behind it
+            self._dispatch_site(job.site)
+
+    def _check_started(self, job: Job, vacuum: _Vacuum) -> None:
+        job._timer = None
+        if vacuum.job is job and not job._seen_busy:
+            _LOGGER.warning('%r did not start within %s seconds', job, START_TIMEOUT)
+            self._release(vacuum, FAILED)
+
+    def _finish(self, job: Job, state: str) -> None:
+        if job._timer is not None:
+            job._timer.cancel()
+            job._timer = None
+        job.state = state
+        job.finished = time.time()
+        _LOGGER.debug('%r finished', job)
+        if job.future is not None and not job.future.done():
+            job.future.set_result(state)
+
+    def _top_job(self, heap: list[tuple], now: float) -> Job | None:
+        """Best queued job of a heap, dropping finished and expired ones."""
+        while heap:
+            job = heap[0][1]
+            if job.state == QUEUED and not job.expired(now):
+                return job
+            heapq.heappop(heap)
+            if job.state == QUEUED:
+                self._finish(job, EXPIRED)
+        return None
+
+    def _top_vacuum(self, site: str) -> _Vacuum | None:
+        heap = self._ready.get(site)
+        while heap:
+            _, device_id, version = heap[0]
+            vacuum = self._vacuums[device_id]
+            if vacuum.version == version and vacuum.ready:
+                return vacuum
+            heapq.heappop(heap)
+        return None
+
+    def _offer(self, vacuum: _Vacuum) -> None:
+        """Make a ready vacuum a candidate for the jobs of its site and its pinned jobs."""
+        heapq.heappush(self._ready.setdefault(vacuum.site, []), (-vacuum.battery, vacuum.device.device_id, vacuum.version))
+        self._offer_pinned(vacuum)
+
+    def _offer_pinned(self, vacuum: _Vacuum) -> None:
+        """Make the best pinned job of a ready vacuum a candidate for its site."""
+        heap = self._pinned_jobs.get(vacuum.device.device_id)
+        job = self._top_job(heap, time.time()) if heap else None
+        if job is not None and vacuum.ready:
+            entry = (job.sort_key(), next(self._entries), job, vacuum, vacuum.version)
+            heapq.heappush(self._pinned_ready.setdefault(vacuum.site, []), entry)
+
+    def _top_pinned(self, site: str, now: float) -> tuple[Job, _Vacuum] | None:
+        heap = self._pinned_ready.get(site)
+        while heap:
+            _, _, job, vacuum, version = heap[0]
+            if (job.state == QUEUED and not job.expired(now) and vacuum.version == version and vacuum.ready
+                    and vacuum.battery >= job.min_battery):
+                return job, vacuum
+            # Offered again when the vacuum's state changes
+            heapq.heappop(heap)
+        return None
+
+    def _dispatch_site(self, site: str) -> None:
+        now = time.time()
+        while self._running.get(site, 0) < self.limit(site):
+            job = self._top_job(self._site_jobs.get(site, []), now)
+            vacuum = self._top_vacuum(site) if job is not None else None
+            if vacuum is not None and vacuum.battery < job.min_battery:
+                job = vacuum = None
+            pinned = self._top_pinned(site, now)
+            if pinned is not None and (job is None or pinned[0].sort_key() < job.sort_key()):
+                heapq.heappop(self._pinned_ready[site])
+                self._start(*pinned)
+            elif job is not None and vacuum is not None:
+                heapq.heappop(self._site_jobs[site])
+                self._start(job, vacuum)
+            else:
+                return
+
+    def _start(self, job: Job, vacuum: _Vacuum) -> None:
+        job.state = RUNNING
+        job.device_id = vacuum.device.device_id
+        job.started = time.time()
+        vacuum.job = job
+        vacuum.version += 1
+        self._running[vacuum.site] = self._running.get(vacuum.site, 0) + 1
+        _LOGGER.debug('Starting %r', job)
+        loop = asyncio.get_running_loop()
+        if job._timer is not None:
+            job._timer.cancel()
+        job._timer = loop.call_later(START_TIMEOUT, self._check_started, job, vacuum)
+        loop.create_task(self._send(job, vacuum))
+
+    async def _send(self, job: Job, vacuum: _Vacuum) -> None:
+        device = vacuum.device
+        try:
+            if job.kind == AUTO:
+                await device.auto_clean()
+            elif job.kind == ROOMS:
+                await device.room_clean(job.rooms, job.map_id)
+            else:
+                await device.scene_clean(job.scene)
+        except Exception as error:
+            _LOGGER.error('Could not start %r: %s', job, error)
+            if vacuum.job is job:
+                self._release(vacuum, FAILED)
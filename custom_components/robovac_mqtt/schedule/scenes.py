@@ -0,0 +1,58 @@
+from collections.abc import Iterable
+
+from ..proto.cloud.scene_pb2 import SceneInfo
+from ..proto.cloud.stream_pb2 import SceneWrap
+
+
+class SceneCatalog:
+    """Cleaning scenes of one robot keyed by id and by case-folded name.
+
+    Filled from the full scene list the robot reports (SceneResponse.infos or
+    a stream.SceneWrap), so resolving a scene is a dict lookup. `version`
+    increases whenever the list changes.
+    """
+
+    def __init__(self) -> None:
+        self.scenes: dict[int, SceneInfo] = {}
+        self.scene_ids: dict[str, int] = {}
+        self.loaded = False
+        self.version = 0
+        self._key = None
+
+    def __len__(self) -> int:
+        return len(self.scenes)
+
+    def replace(self, infos: Iterable[SceneInfo]) -> bool:
+        """Apply the full scene list, returning True if it changed."""
+        infos = sorted(infos, key=lambda info: (info.index, info.id.value))
+        self.loaded = True
+        key = tuple(info.SerializeToString(deterministic=True) for info in infos)
+        if key == self._key:
+            return False
+        self._key = key
+        self.scenes = {info.id.value: info for info in infos}
+        self.scene_ids = {info.name.casefold(): info.id.value for info in infos if info.name}
+        self.version += 1
+        return True
+
+    def replace_wrapped(self, wrap: SceneWrap) -> bool:
+        return self.replace(scene.info for scene in wrap.scenes)
+
+    def get(self, scene_id: int) -> SceneInfo | None:
+        return self.scenes.get(scene_id)
+
+    def resolve(self, scene: int | str) -> SceneInfo:
+        """Scene for a scene id or name; raises ValueError for unknown or invalid scenes."""
+        if isinstance(scene, str) and scene.strip().isdigit():
+            scene = int(scene)
+        if isinstance(scene, int):
+            info = self.scenes.get(scene)
+        else:
+            info = self.scenes.get(self.scene_ids.get(scene.casefold()))
+        if info is None:
+            known = [f'{info.id.value}: {info.name}' for info in self.scenes.values()]
+            raise ValueError(f'Unknown scene: {scene!r}, allowed values: {known}')
+        if not info.valid and info.invalid_reason not in (SceneInfo.NORMAL, SceneInfo.DEFAULT):
+            reason = SceneInfo.InvalidReason.Name(info.invalid_reason)
+            raise ValueError(f'Scene {info.name!r} ({info.id.value}) is not valid: {reason}')
+        return info
@@ -0,0 +1,203 @@
+import heapq
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+
+from ..proto.cloud.timing_pb2 import TimerInfo, TimerRequest
+
+Trigger = TimerInfo.Desc.Trigger
+
+
+def _user_timezone(timing: TimerInfo.Desc.Timing) -> timezone:
+    # user_tz is a uint32 offset in seconds, west of UTC arrives wrapped around
+    offset = timing.user_tz - (1 << 32) if timing.user_tz >= 1 << 31 else timing.user_tz
+    if timing.summer:
+        offset += 3600
+    return timezone(timedelta(seconds=offset))
+
+
+def next_fire_time(timer: TimerInfo, after: float) -> float | None:
+    """Unix time of the first run of a timer strictly after `after`, None if it will not run.
+
+    Cycle timers run on the weekdays of `week_bits` (bit 0 Sunday ... bit 6
+    Saturday) in the user's time zone; single timers run once at the next
+    occurrence of their time of day.
+    """
+    if not (timer.status.valid and timer.status.opened):
+        return None
+    timing = timer.desc.timing
+    now = datetime.fromtimestamp(after, _user_timezone(timing))
+    candidate = now.replace(hour=timing.hours % 24, minute=timing.minutes % 60, second=0, microsecond=0)
+    if timer.desc.trigger == Trigger.SINGLE:
+        if candidate.timestamp() <= after:
+            candidate += timedelta(days=1)
+        return candidate.timestamp()
+
+    week_bits = timer.desc.cycle.week_bits & 0x7F
+    if not week_bits:
+        return None
+    for days in range(8):
+        day = candidate + timedelta(days=days)
+        # isoweekday: Monday 1 ... Sunday 7, week_bits starts at Sunday
+        if week_bits >> (day.isoweekday() % 7) & 1 and day.timestamp() > after:
+            return day.timestamp()
+    return None
+
+
+class TimerIndex:
+    """Min-heap of the next run of every timer of one or more robots.
+
+    Entries are (fire time, device id, timer id, generation); replacing or
+    removing a timer bumps its generation so stale heap entries are skipped
+    lazily, keeping updates and `peek` at O(log n) amortized. The heap is
+    rebuilt once stale entries outnumber the live ones.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, str, int, int]] = []
+        # (device id, timer id) -> (generation, timer, fire time)
+        self._current: dict[tuple[str, int], tuple[int, TimerInfo, float | None]] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def set(self, device_id: str, timer: TimerInfo, now: float | None = None) -> float | None:
+        """Index the next run of a timer after `now`, returning it."""
+        fire_time = next_fire_time(timer, time.time() if now is None else now)
+        self._generation += 1
+        self._current[(device_id, timer.id.value)] = (self._generation, timer, fire_time)
+        if fire_time is not None:
+            heapq.heappush(self._heap, (fire_time, device_id, timer.id.value, self._generation))
+            if len(self._heap) > 2 * len(self._current) + 16:
+                self._rebuild()
+        return fire_time
+
+    def remove(self, device_id: str, timer_id: int) -> None:
+        self._current.pop((device_id, timer_id), None)
+
+    def _rebuild(self) -> None:
+        self._heap = [entry for entry in self._heap if self._valid(entry)]
+        heapq.heapify(self._heap)
+
+    def _valid(self, entry: tuple[float, str, int, int]) -> bool:
+        current = self._current.get((entry[1], entry[2]))
+        return current is not None and current[0] == entry[3]
+
+    def peek(self, now: float | None = None) -> tuple[float, str, TimerInfo] | None:
+        """(fire time, device id, timer) of the next run after `now`.
+
+        Runs already due are rescheduled to their following run first, or
+        dropped for single timers.
+        """
+        now = time.time() if now is None else now
+        # set() and remove() may rebuild the heap into a new list, read it on every pass
+        while self._heap:
+            entry = self._heap[0]
+            if not self._valid(entry):
+                heapq.heappop(self._heap)
+            elif entry[0] <= now:
+                heapq.heappop(self._heap)
+                timer = self._current[(entry[1], entry[2])][1]
+                if timer.desc.trigger == Trigger.SINGLE:
+                    self.remove(entry[1], entry[2])
+                else:
+                    self.set(entry[1], timer, now)
+            else:
+                fire_time, device_id, timer_id, _ = entry
+                return fire_time, device_id, self._current[(device_id, timer_id)][1]
+        return None
+
+
+class TimerCache:
+    """Timers of one robot as reported by TimerResponse, keyed by id.
+
+    A full report only re-indexes timers whose `renew_time` changed, and
+    `changes` turns a wanted set of timers into the minimal list of
+    TimerRequests (ADD, MOTIFY, OPEN / CLOSE, DELETE) to get there.
+    """
+
+    def __init__(self, device_id: str, index: TimerIndex | None = None) -> None:
+        self.device_id = device_id
+        self.index = index or TimerIndex()
+        self.timers: dict[int, TimerInfo] = {}
+        self.loaded = False
+        self.version = 0
+
+    def attach(self, index: TimerIndex) -> None:
+        """Move this robot's timers to a shared (fleet wide) index."""
+        for timer_id in self.timers:
+            self.index.remove(self.device_id, timer_id)
+        self.index = index
+        for timer in self.timers.values():
+            index.set(self.device_id, timer)
+
+    def replace(self, timers: Iterable[TimerInfo], now: float | None = None) -> bool:
+        """Apply the full list of timers of a TimerResponse, returning True if anything changed."""
+        current = {timer.id.value: timer for timer in timers}
+        changed = [timer for timer_id, timer in current.items()
+                   if timer_id not in self.timers or not _same_revision(self.timers[timer_id], timer)]
+        removed = [timer_id for timer_id in self.timers if timer_id not in current]
+        for timer_id in removed:
+            self.index.remove(self.device_id, timer_id)
+        self.timers = current
+        for timer in changed:
+            self.index.set(self.device_id, timer, now)
+        self.loaded = True
+        if changed or removed:
+            self.version += 1
+            return True
+        return False
+
+    def next(self) -> tuple[float, TimerInfo] | None:
+        """Next run of this robot's timers; O(n) in its timers, use the index for fleets."""
+        runs = []
+        now = time.time()
+        for timer in self.timers.values():
+            fire_time = next_fire_time(timer, now)
+            if fire_time is not None:
+                runs.append((fire_time, timer.id.value))
+        if not runs:
+            return None
+        fire_time, timer_id = min(runs)
+        return fire_time, self.timers[timer_id]
+
+    def changes(self, wanted: Iterable[TimerInfo]) -> list[tuple[int, TimerInfo]]:
+        """(TimerRequest method, timer) pairs turning the cached timers into `wanted`.
+
+        Timers without an id are added; timers whose description or action
+        changed are modified; timers that only changed `status.opened` are
+        opened or closed; cached timers missing from `wanted` are deleted.
+        """
+        requests = []
+        wanted_ids = set()
+        for timer in wanted:
+            timer_id = timer.id.value
+            if not timer_id or timer_id not in self.timers:
+                # The robot assigns the id of new timers
+                added = TimerInfo()
+                added.CopyFrom(timer)
+                added.ClearField('id')
+                requests.append((TimerRequest.ADD, added))
+                continue
+            wanted_ids.add(timer_id)
+            cached = self.timers[timer_id]
+            if _definition(cached) != _definition(timer):
+                requests.append((TimerRequest.MOTIFY, timer))
+            elif cached.status.opened != timer.status.opened:
+                method = TimerRequest.OPEN if timer.status.opened else TimerRequest.CLOSE
+                requests.append((method, TimerInfo(id=timer.id)))
+        for timer_id in self.timers:
+            if timer_id not in wanted_ids:
+                requests.append((TimerRequest.DELETE, TimerInfo(id={'value': timer_id})))
+        return requests
+
+
+def _same_revision(a: TimerInfo, b: TimerInfo) -> bool:
+    if a.addition.renew_time or b.addition.renew_time:
+        return a.addition.renew_time == b.addition.renew_time and a.status == b.status
+    return a.SerializeToString(deterministic=True) == b.SerializeToString(deterministic=True)
+
+
+def _definition(timer: TimerInfo) -> tuple[bytes, bytes]:
+    return timer.desc.SerializeToString(deterministic=True), timer.action.SerializeToString(deterministic=True)
@@ -0,0 +1,80 @@
+import logging
+
+from homeassistant.components.sensor import (SensorDeviceClass, SensorEntity,
+                                             SensorStateClass)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .constants.hass import DEVICES, DOMAIN
+from .controllers.MqttConnect import MqttConnect
+from .history.consumables import LIFETIMES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    for device_id, device in hass.data[DOMAIN][DEVICES].items():
+        _LOGGER.info("Adding consumable sensors for %s", device_id)
+        async_add_entities([RoboVacConsumableSensor(device, part) for part in LIFETIMES])
+
+
+class RoboVacConsumableSensor(SensorEntity):
+    """Hours of use of one consumable, with its predicted replacement date as attributes.
+
+    All sensors of a vacuum read the same ConsumableTracker, which decodes each
+    consumables update once; a sensor only writes its state when the tracker
+    changed since its last write.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, item: MqttConnect, part: str) -> None:
+        self.vacuum = item
+        self.part = part
+        self._attr_name = part.replace("_", " ").capitalize()
+        self._attr_unique_id = f"{item.device_id}_consumable_{part}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, item.device_id)},
+            name=item.device_model_desc,
+            manufacturer="Eufy",
+            model=item.device_model,
+        )
+        self._version = None
+
+    async def async_added_to_hass(self) -> None:
+        # self.hass is only set once the entity is added, listen from then on
+        self.vacuum.add_listener(self._threadsafe_update)
+        self.async_on_remove(lambda: self.vacuum.remove_listener(self._threadsafe_update))
+
+    def _threadsafe_update(self) -> None:
+        self.hass.add_job(self.pushed_update_handler)
+
+    @property
+    def available(self) -> bool:
+        return self.vacuum.consumables.hours(self.part) is not None
+
+    @property
+    def native_value(self) -> int | None:
+        return self.vacuum.consumables.hours(self.part)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        state = self.vacuum.consumables.state(self.part)
+        del state["hours"]
+        return state
+
+    @callback
+    def pushed_update_handler(self) -> None:
+        version = self.vacuum.consumables.version
+        if version != self._version and self.entity_id is not None:
+            self._version = version
+            self.async_write_ha_state()
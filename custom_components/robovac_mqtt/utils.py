@@ -13,11 +13,36 @@ async def sleep(ms: int):
 T = TypeVar("T", bound=Type[Message])
 
 
+def read_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
+    """Read a protobuf base 128 varint, returns (value, offset after it)."""
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError('Truncated varint')
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def varint_bytes(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
 def decode(to_type: T, b64_data: str, has_length: bool = True) -> T:
     data = b64decode(b64_data)
 
-    if has_length:
-        data = data[1:]
+    if has_length and data:
+        # Delimited messages: the length is a varint, one byte only below 128
+        _, offset = read_varint(data)
+        data = data[offset:]
 
     return to_type().FromString(data)
 
@@ -31,6 +56,6 @@ def encode_message(message: Type[Message], has_length: bool = True) -> str:
     out = message.SerializeToString(deterministic=False)
 
     if has_length:
-        out = bytes([len(out)]) + out
+        out = varint_bytes(len(out)) + out
 
     return b64encode(out).decode('utf-8')
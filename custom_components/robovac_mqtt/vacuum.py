@@ -69,6 +69,7 @@ class RoboVacMQTTEntity(StateVacuumEntity):
             )
 
         item.add_listener(_threadsafe_update)
+        item.room_tracker.add_listener(lambda previous, current: _threadsafe_update())
 
     @property
     def activity(self) -> VacuumActivity | None:
@@ -98,6 +99,8 @@ class RoboVacMQTTEntity(StateVacuumEntity):
             "battery_level": self._attr_battery_level,
             "fan_speed": self._attr_fan_speed,
             "status": self._state,
+            "current_room": self.vacuum.room_tracker.current_room,
+            "errors": [info.description for info in self.vacuum.error_events.active()],
         }
 
     async def pushed_update_handler(self):
@@ -157,9 +160,13 @@ class RoboVacMQTTEntity(StateVacuumEntity):
         elif command == "room_clean":
             if not params or not isinstance(params, dict) or not isinstance(params.get("rooms"), list):
                 raise ValueError("params[rooms] is required for room_clean command")
-            rooms = [int(r) for r in params['rooms']]
-            map_id = int(params.get("map_id", 0))
-            await self.vacuum.room_clean(rooms, map_id)
+            # Rooms are ids or names, names are resolved through the cached room table
+            rooms = [r if isinstance(r, (int, str)) else int(r) for r in params['rooms']]
+            map_id = int(params["map_id"]) if "map_id" in params else self.vacuum.active_map_id()
+            if map_id is None:
+                # Active map not known yet, keep sending the map id this service always used
+                map_id = 0
+            await self.vacuum.room_clean(rooms, map_id, bool(params.get("optimize_order", False)))
         else:
             raise NotImplementedError(f"Command {command} not implemented")
 